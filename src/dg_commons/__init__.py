@@ -26,3 +26,4 @@ from .geo import *
 from .game_types import *
 from .utils_types import *
 from .utils_toolz import *
+from .utils_cache import *
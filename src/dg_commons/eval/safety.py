@@ -5,13 +5,13 @@ from typing import Mapping, MutableMapping, Optional
 import numpy as np
 from geometry import SE2_from_xytheta
 from shapely import distance
-from shapely.affinity import translate
 from shapely.geometry import Polygon, Point
 from shapely.ops import nearest_points
 
 from dg_commons import apply_SE2_to_shapely_geo, PlayerName, X
 from dg_commons.seq.sequence import Timestamp
 from dg_commons.sim import CollisionReport
+from dg_commons.sim.collision_utils import time_of_impact
 from dg_commons.sim.goals import TPlanningGoal
 from dg_commons.sim.simulator import LogEntry
 from dg_commons.sim.simulator_structures import SimLog, SimModel
@@ -214,24 +214,19 @@ def _get_ttc(state1: X, state2: X, model1: SimModel, model2: SimModel) -> tuple[
 def _get_ttc_of_poly_and_state(poly1: Polygon, poly2: Polygon, state1: X, state2: X) -> tuple[float, float, float]:
     """
     Compute the time-to-collision and distance-to-collisions of the two polygons, considering their geometry.
+    The agents are assumed to keep their velocity, the time of the first contact is exact (see `time_of_impact`).
     :param poly1: geometry of the first agent
     :param poly2: geometry of the second agent
     :param state1: current state of the first agent
     :param state2: current state of the second agent
     :return: time-to-collision, distance-to-collision for agent1. distance-to-collision for agent2
     """
-    time = 0
     max_time = 3.0
-    timestep = 0.1
     v1 = state1.vx * np.array([np.cos(state1.psi), np.sin(state1.psi)])
     v2 = state2.vx * np.array([np.cos(state2.psi), np.sin(state2.psi)])
-    delta_pos = (v2 - v1) * timestep
-    while not poly1.intersects(poly2):
-        if time > max_time:
-            return np.inf, np.inf, np.inf
-        # move poly2
-        poly2 = translate(poly2, xoff=delta_pos[0], yoff=delta_pos[1])
-        time += timestep
+    time = time_of_impact(poly1, poly2, v2 - v1, max_time=max_time)
+    if np.isinf(time):
+        return np.inf, np.inf, np.inf
     return time, state1.vx * time, state2.vx * time
 
 
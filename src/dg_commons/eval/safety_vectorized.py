@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping, Optional, Sequence
+
+import numpy as np
+import shapely
+from zuper_commons.types import ZValueError
+
+from dg_commons import PlayerName
+from dg_commons.seq.columnar import DgColumnarSequence
+from dg_commons.seq.sequence import Timestamp
+from dg_commons.sim.collision_utils import (
+    convex_vertices,
+    edge_normals,
+    projection_intervals,
+    time_of_impact_batch,
+)
+from dg_commons.sim.goals import PolygonGoal, RefLaneGoal, TPlanningGoal
+from dg_commons.sim.log_stream import StreamedSequence
+from dg_commons.sim.simulator_structures import SimLog, SimModel
+
+__all__ = [
+    "SafetySamples",
+    "sample_players",
+    "ego_distances",
+    "ego_ttc_drac",
+    "get_min_dist_vectorized",
+    "get_min_ttc_max_drac_vectorized",
+]
+
+
+@dataclass(frozen=True)
+class SafetySamples:
+    """
+    The poses and velocities of the ego and of the other players sampled once at the timestamps of the ego,
+    as arrays. Rows are the timestamps, columns of the agents arrays are the agents (in the order of the log).
+    """
+
+    timestamps: Sequence[Timestamp]
+    """The sampled timestamps of the ego (as found in its log)"""
+    ego_name: PlayerName
+    """The name of the ego"""
+    agents: tuple[PlayerName, ...]
+    """The names of the other players"""
+    ego_states: np.ndarray
+    """x, y, psi, vx of the ego, shape (T, 4)"""
+    agents_states: np.ndarray
+    """x, y, psi, vx of the agents, shape (T, N, 4)"""
+    ego_active: np.ndarray
+    """Whether the ego has not yet fulfilled its mission, shape (T,)"""
+    agents_active: np.ndarray
+    """Whether the agents have not yet fulfilled their mission, shape (T, N)"""
+    ego_outline: np.ndarray
+    """Vertices of the (convex) outline of the ego in its body frame, shape (K, 2)"""
+    agents_outlines: np.ndarray
+    """Vertices of the (convex) outlines of the agents in their body frame, shape (N, K, 2)"""
+
+
+_POSE_VEL = ("x", "y", "psi", "vx")
+
+
+def _pad_outlines(outlines: list[np.ndarray]) -> np.ndarray:
+    """Stacks outlines with different numbers of vertices repeating their last vertex.
+    The resulting zero length edges do not change distances nor separating axes."""
+    k = max(len(o) for o in outlines)
+    return np.stack([np.concatenate([o, np.repeat(o[-1:], k - len(o), axis=0)]) for o in outlines])
+
+
+def _fulfilled(mission: TPlanningGoal, states: DgColumnarSequence, rows: np.ndarray) -> np.ndarray:
+    """Vectorized `mission.is_fulfilled` over the sampled rows of the states"""
+    x, y = rows[:, states.XT.idx["x"]], rows[:, states.XT.idx["y"]]
+    if isinstance(mission, PolygonGoal):
+        return shapely.contains_xy(mission.goal, x, y)
+    fulfilled = np.zeros(len(rows), dtype=bool)
+    if isinstance(mission, RefLaneGoal):
+        # the polygon test is a necessary condition, the lane poses are computed only for the candidates
+        candidates = shapely.contains_xy(mission.goal_polygon, x, y)
+        poses = np.column_stack([x, y, rows[:, states.XT.idx["psi"]]])[candidates]
+        fulfilled[candidates] = mission.ref_lane.lane_poses(poses)["along_lane"] >= mission.goal_progress
+        return fulfilled
+    for i in range(len(rows)):
+        fulfilled[i] = mission.is_fulfilled(states.XT.from_array(rows[i].copy()))
+    return fulfilled
+
+
+def sample_players(
+    logs: SimLog,
+    models: Mapping[PlayerName, SimModel],
+    missions: Mapping[PlayerName, TPlanningGoal],
+    ego_name: PlayerName,
+    t_range: tuple[Timestamp | None, Timestamp | None] = (None, None),
+) -> SafetySamples:
+    """
+    Samples (interpolating, holding at the extremes) the states of all the players at the timestamps of the ego
+    within t_range, together with whether they have fulfilled their mission.
+    The states need to have x, y, psi and vx.
+    """
+    ego_timestamps = logs[ego_name].states.timestamps
+    # compared as they are (e.g. Decimal with float), as in `get_min_dist`
+    timestamps = [
+        t
+        for t in ego_timestamps
+        if not (t_range[0] is not None and t < t_range[0]) and not (t_range[1] is not None and t > t_range[1])
+    ]
+    float_ts = np.fromiter((float(t) for t in timestamps), dtype=float, count=len(timestamps))
+
+    states, active, outlines = [], [], []
+    for name in logs:
+        seq = logs[name].states
+        if isinstance(seq, StreamedSequence):
+            seq = seq.columnar
+        elif not isinstance(seq, DgColumnarSequence):
+            seq = DgColumnarSequence.from_sequence(seq)
+        if not all(f in seq.XT.idx for f in _POSE_VEL):
+            raise ZValueError("The states need to provide x, y, psi and vx", player=name, XT=seq.XT)
+        rows = seq.at_interp_array(float_ts)
+        states.append(rows[:, [seq.XT.idx[f] for f in _POSE_VEL]])
+        active.append(~_fulfilled(missions[name], seq, rows))
+        outlines.append(convex_vertices(models[name].vg.outline_as_polygon))
+
+    names = list(logs)
+    ego_idx = names.index(ego_name)
+    agents_idx = [i for i in range(len(names)) if i != ego_idx]
+    outlines = _pad_outlines(outlines)
+    states = np.stack(states, axis=1).reshape(len(timestamps), len(names), len(_POSE_VEL))
+    active = np.stack(active, axis=1).reshape(len(timestamps), len(names))
+    return SafetySamples(
+        timestamps=timestamps,
+        ego_name=ego_name,
+        agents=tuple(names[i] for i in agents_idx),
+        ego_states=states[:, ego_idx],
+        agents_states=states[:, agents_idx],
+        ego_active=active[:, ego_idx],
+        agents_active=active[:, agents_idx],
+        ego_outline=outlines[ego_idx],
+        agents_outlines=outlines[agents_idx],
+    )
+
+
+def _world_vertices(outline: np.ndarray, states: np.ndarray) -> np.ndarray:
+    """Outline(s) of shape (..., K, 2) placed at the poses of states (..., 4), returns (..., K, 2)"""
+    c, s = np.cos(states[..., 2])[..., None], np.sin(states[..., 2])[..., None]
+    x = c * outline[..., 0] - s * outline[..., 1] + states[..., 0, None]
+    y = s * outline[..., 0] + c * outline[..., 1] + states[..., 1, None]
+    return np.stack([x, y], axis=-1)
+
+
+def _points_segments_distance(points: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+    """Minimum distance of points (..., K, 2) from the edges of polygons (..., K, 2), returns (...)"""
+    a = vertices[..., None, :, :]
+    ab = np.roll(vertices, -1, axis=-2)[..., None, :, :] - a
+    ap = points[..., :, None, :] - a
+    ab2 = np.sum(ab * ab, axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        h = np.where(ab2 > 0, np.clip(np.sum(ap * ab, axis=-1) / ab2, 0, 1), 0)
+    d = ap - h[..., None] * ab
+    return np.sqrt(np.min(np.sum(d * d, axis=-1), axis=(-2, -1)))
+
+
+def _convex_distance(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Distance between convex polygons p and q (..., K, 2), zero if they intersect (separating axis theorem)"""
+    axes = np.concatenate([edge_normals(p), edge_normals(q)], axis=-2)
+    p_min, p_max = projection_intervals(p, axes)
+    q_min, q_max = projection_intervals(q, axes)
+    separated = np.any((p_max < q_min) | (q_max < p_min), axis=-1)
+    dist = np.minimum(_points_segments_distance(p, q), _points_segments_distance(q, p))
+    return np.where(separated, dist, 0.0)
+
+
+def ego_distances(samples: SafetySamples) -> np.ndarray:
+    """
+    Distances between the outline of the ego and the ones of the agents, shape (T, N).
+    Pairs where either player has fulfilled its mission are inf.
+    """
+    ego = _world_vertices(samples.ego_outline, samples.ego_states)
+    agents = _world_vertices(samples.agents_outlines, samples.agents_states)
+    dist = _convex_distance(np.broadcast_to(ego[:, None], agents.shape), agents)
+    return np.where(samples.ego_active[:, None] & samples.agents_active, dist, np.inf)
+
+
+def _legacy_time_grid(ttc_step: float, ttc_horizon: float) -> np.ndarray:
+    """The times checked by a search stepping ttc_step at a time, accumulated as it did"""
+    grid, time = [0.0], 0.0
+    while time <= ttc_horizon:
+        time += ttc_step
+        grid.append(time)
+    return np.array(grid)
+
+
+def ego_ttc_drac(
+    samples: SafetySamples, ttc_step: Optional[float] = None, ttc_horizon: float = 3.0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Time-to-collision and deceleration-rate-to-avoid-collision of the ego with respect to the agents, shape (T, N).
+    The players are assumed to move with constant velocity along their heading, the time of the first contact
+    of their outlines is solved analytically on the separating axes.
+    As in `get_ttc_drac_at_t`, agents leaving the ego or far enough are skipped (ttc inf, drac -inf).
+    :param samples: the output of `sample_players`
+    :param ttc_step: if given, the time-to-collision is reported on the grid of a search stepping ttc_step at a time
+        (as `eval.safety` used to do), e.g. to reproduce previous results. If None, the exact time is returned.
+    :param ttc_horizon: the time-to-collision beyond the horizon is inf
+    """
+    ego, agents = samples.ego_states[:, None], samples.agents_states
+    ego_vel = ego[..., 3, None] * np.stack([np.cos(ego[..., 2]), np.sin(ego[..., 2])], axis=-1)
+    agents_vel = agents[..., 3, None] * np.stack([np.cos(agents[..., 2]), np.sin(agents[..., 2])], axis=-1)
+    delta_pos = agents[..., :2] - ego[..., :2]
+    rel_vel = agents_vel - ego_vel
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dist_center = np.linalg.norm(delta_pos, axis=-1)
+        rel_vel_along_dist = np.sum(rel_vel * delta_pos, axis=-1) / dist_center
+        skip = (rel_vel_along_dist > 0) | (np.abs(dist_center / rel_vel_along_dist) > 5.0)
+    skip |= ~(samples.ego_active[:, None] & samples.agents_active)
+
+    ego_vertices = _world_vertices(samples.ego_outline, samples.ego_states)
+    agents_vertices = _world_vertices(samples.agents_outlines, samples.agents_states)
+    t_enter, t_exit = time_of_impact_batch(ego_vertices[:, None], agents_vertices, rel_vel)
+    if ttc_step is None:
+        ttc = np.where(t_enter <= ttc_horizon, t_enter, np.inf)
+    else:
+        # first time of the grid in which the polygons overlap
+        grid = _legacy_time_grid(ttc_step, ttc_horizon)
+        k = np.searchsorted(grid, np.where(np.isfinite(t_enter), t_enter, grid[-1] + 1) - 1e-12)
+        k_valid = np.minimum(k, len(grid) - 1)
+        hit = (k < len(grid)) & (grid[k_valid] <= t_exit + 1e-12)
+        ttc = np.where(hit, grid[k_valid], np.inf)
+
+    ego_dtc = np.where(np.isfinite(ttc), ego[..., 3] * ttc, np.inf)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        drac = np.where(ego_dtc > 0, ego[..., 3] ** 2 / (2 * ego_dtc), np.inf)
+    return np.where(skip, np.inf, ttc), np.where(skip, -np.inf, drac)
+
+
+def _first_extremum(values: np.ndarray, samples: SafetySamples, minimum: bool):
+    """The first (in time, then in the order of the agents) extremum, with its agent and timestamp"""
+    if not values.size:
+        return (np.inf if minimum else -np.inf), None, None
+    flat = int(np.argmin(values) if minimum else np.argmax(values))
+    t_idx, agent_idx = np.unravel_index(flat, values.shape)
+    value = float(values[t_idx, agent_idx])
+    if np.isinf(value) and (value > 0) == minimum:
+        return value, None, None
+    return value, samples.agents[agent_idx], samples.timestamps[t_idx]
+
+
+def get_min_dist_vectorized(
+    logs: SimLog,
+    models: Mapping[PlayerName, SimModel],
+    missions: Mapping[PlayerName, TPlanningGoal],
+    ego_name: PlayerName,
+    t_range: tuple[Timestamp | None, Timestamp | None] = (None, None),
+) -> tuple[float, Optional[PlayerName], Optional[Timestamp]]:
+    """Array based version of `eval.safety.get_min_dist`, same arguments and outputs"""
+    samples = sample_players(logs, models, missions, ego_name, t_range)
+    return _first_extremum(ego_distances(samples), samples, minimum=True)
+
+
+def get_min_ttc_max_drac_vectorized(
+    logs: SimLog,
+    models: Mapping[PlayerName, SimModel],
+    missions: Mapping[PlayerName, TPlanningGoal],
+    ego_name: PlayerName,
+    t_range: tuple[Timestamp | None, Timestamp | None] = (None, None),
+    ttc_step: Optional[float] = None,
+) -> tuple[float, Optional[PlayerName], Optional[Timestamp], float, Optional[PlayerName], Optional[Timestamp]]:
+    """Array based version of `eval.safety.get_min_ttc_max_drac`, same arguments and outputs.
+    See `ego_ttc_drac` for `ttc_step`."""
+    samples = sample_players(logs, models, missions, ego_name, t_range)
+    ttc, drac = ego_ttc_drac(samples, ttc_step=ttc_step)
+    return _first_extremum(ttc, samples, minimum=True) + _first_extremum(drac, samples, minimum=False)
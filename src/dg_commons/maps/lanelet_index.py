@@ -0,0 +1,115 @@
+import weakref
+from functools import cached_property
+from typing import Sequence, Union
+
+import numpy as np
+import shapely
+from commonroad.scenario.lanelet import Lanelet, LaneletNetwork
+from commonroad.scenario.scenario import Scenario
+from geometry import T2value
+from shapely.strtree import STRtree
+
+from dg_commons.maps.lanes import DgLanelet
+from dg_commons.utils_cache import IdentityCache
+
+__all__ = ["LaneletIndex"]
+
+_SHARED: IdentityCache["LaneletIndex"] = IdentityCache()
+"""The indices shared by the users of a scenario (or of a network), see `LaneletIndex.of`"""
+
+
+class LaneletIndex:
+    """
+    Spatial index over the lanelets of a network with a cache of their conversions to `DgLanelet`.
+    The network is assumed not to change after the index has been created.
+    """
+
+    def __init__(self, network: LaneletNetwork):
+        self._network: Union[LaneletNetwork, weakref.ref] = network
+        self._dglanelets: dict[int, DgLanelet] = {}
+        self._merged: dict[int, tuple[list[Lanelet], list[DgLanelet]]] = {}
+
+    @classmethod
+    def of(cls, owner: Union[Scenario, LaneletNetwork]) -> "LaneletIndex":
+        """
+        The index of the lanelet network of the scenario shared by all its users (e.g. the `DgScenario` built on it
+        and the conversion of its dynamic obstacles), kept as long as the scenario is alive.
+        A network without its scenario can be given as well, its index is shared by the users of the network.
+        """
+        index = _SHARED.get(owner)
+        if index is None or index.network is not _network(owner):
+            index = cls(_network(owner))
+            index.share(owner)
+        return index
+
+    def share(self, owner: Union[Scenario, LaneletNetwork]):
+        """Makes this index (e.g. with its lanelets already converted) the one returned by `of` for the owner.
+        If the owner is the network itself, the index refers to it weakly (it would keep its owner alive otherwise).
+        """
+        assert self.network is _network(owner)
+        if owner is self.network:
+            self._network = weakref.ref(owner)
+        _SHARED.put(owner, self)
+
+    @property
+    def network(self) -> LaneletNetwork:
+        return self._network() if isinstance(self._network, weakref.ref) else self._network
+
+    @cached_property
+    def _lanelet_ids(self) -> np.ndarray:
+        return np.array([lanelet.lanelet_id for lanelet in self.network.lanelets], dtype=int)
+
+    @cached_property
+    def _strtree(self) -> STRtree:
+        """The polygons of the lanelets in a spatial index, built at the first query"""
+        return STRtree([lanelet.polygon.shapely_object for lanelet in self.network.lanelets])
+
+    def lanelet_ids_at_points(self, points: np.ndarray) -> list[list[int]]:
+        """
+        Batched version of `LaneletNetwork.find_lanelet_by_position`.
+        :param points: shape (N, 2)
+        :return: for each point the ids of the lanelets containing it (empty if none)
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        res: list[list[int]] = [[] for _ in range(len(points))]
+        if len(self._lanelet_ids) == 0:
+            return res
+        # same tolerance as `LaneletNetwork.find_lanelet_by_position`
+        query_idx, tree_idx = self._strtree.query(shapely.points(points), predicate="dwithin", distance=1e-15)
+        for i, lanelet_id in zip(query_idx.tolist(), self._lanelet_ids[tree_idx].tolist()):
+            res[i].append(lanelet_id)
+        return res
+
+    def lanelet_ids_at(self, point: T2value) -> list[int]:
+        """The ids of the lanelets containing the point"""
+        return self.lanelet_ids_at_points(np.asarray(point)[None, :2])[0]
+
+    def dglanelet(self, lanelet_id: int) -> DgLanelet:
+        """The lanelet converted to a `DgLanelet`, converted only once"""
+        if lanelet_id not in self._dglanelets:
+            lanelet = self.network.find_lanelet_by_id(lanelet_id)
+            self._dglanelets[lanelet_id] = DgLanelet.from_commonroad_lanelet(lanelet)
+        return self._dglanelets[lanelet_id]
+
+    def dglanelets_at(self, point: T2value) -> list[DgLanelet]:
+        """The lanelets containing the point as `DgLanelet`"""
+        return [self.dglanelet(lanelet_id) for lanelet_id in self.lanelet_ids_at(point)]
+
+    def merged_lanelets(self, lanelet_id: int) -> Sequence[Lanelet]:
+        """The lanelets from `Lanelet.all_lanelets_by_merging_successors_from_lanelet`, merged only once"""
+        return self._merged_lanes(lanelet_id)[0]
+
+    def merged_dglanelets(self, lanelet_id: int) -> Sequence[DgLanelet]:
+        """The merged lanelets (see `merged_lanelets`) converted to `DgLanelet`"""
+        return self._merged_lanes(lanelet_id)[1]
+
+    def _merged_lanes(self, lanelet_id: int) -> tuple[list[Lanelet], list[DgLanelet]]:
+        if lanelet_id not in self._merged:
+            lanelet = self.network.find_lanelet_by_id(lanelet_id)
+            merged, _ = Lanelet.all_lanelets_by_merging_successors_from_lanelet(lanelet=lanelet, network=self.network)
+            self._merged[lanelet_id] = (merged, [DgLanelet.from_commonroad_lanelet(m) for m in merged])
+        return self._merged[lanelet_id]
+
+
+def _network(owner: Union[Scenario, LaneletNetwork]) -> LaneletNetwork:
+    return owner if isinstance(owner, LaneletNetwork) else owner.lanelet_network
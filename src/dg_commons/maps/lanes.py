@@ -1,5 +1,7 @@
+import warnings
 from dataclasses import dataclass
-from math import atan2, isclose, pi
+from functools import cached_property
+from math import atan2, cos, floor, isclose, pi, sin
 from typing import Sequence, Optional
 
 import numpy as np
@@ -16,13 +18,11 @@ from geometry import (
     translation_angle_scale_from_E2,
 )
 from scipy.optimize import minimize_scalar
+from zuper_commons.types import ZValueError
 
 from dg_commons import (
     SE2_apply_T2,
-    SE2_interpolate,
     SE2Transform,
-    get_distance_SE2,
-    relative_pose,
 )
 
 
@@ -67,6 +67,34 @@ class DgLanePose:
     center_point: SE2Transform
 
 
+LANE_POSES_DTYPE = np.dtype(
+    [
+        ("beta", float),
+        ("along_lane", float),
+        ("lateral", float),
+        ("relative_heading", float),
+        ("inside", bool),
+        ("outside_left", bool),
+        ("outside_right", bool),
+        ("along_inside", bool),
+        ("along_before", bool),
+        ("along_after", bool),
+        ("lateral_inside", bool),
+        ("correct_direction", bool),
+        ("lateral_left", float),
+        ("lateral_right", float),
+        ("distance_from_left", float),
+        ("distance_from_right", float),
+        ("distance_from_center", float),
+        ("center_x", float),
+        ("center_y", float),
+        ("center_theta", float),
+    ]
+)
+"""Fields of the structured arrays returned by `DgLanelet.lane_poses`, those of `DgLanePose`
+(the center point split in x, y and theta) plus beta"""
+
+
 @dataclass(frozen=True)
 class LaneCtrPoint:
     q: SE2Transform
@@ -77,6 +105,146 @@ class LaneCtrPoint:
 
 _rot90: SO2value = SO2_from_angle(pi / 2)
 
+_EXTENSION_STEP = 0.1
+"""Before the first and after the last control point the center line continues straight,
+one unit of beta corresponds to this distance [m] (see `DgLanelet.center_point`)"""
+
+_MAX_PROJECTIONS = 2**16
+"""Maximum number of (query, segment) pairs projected at once by `DgLanelet.lane_poses`"""
+
+
+def _wrap_angle(angle):
+    return (angle + np.pi) % (2 * np.pi) - np.pi
+
+
+def _rotate(v: np.ndarray, angle) -> np.ndarray:
+    """Rotates the vectors v (..., 2) by angle (...)"""
+    c, s = np.cos(angle), np.sin(angle)
+    return np.stack([c * v[..., 0] - s * v[..., 1], s * v[..., 0] + c * v[..., 1]], axis=-1)
+
+
+@dataclass(frozen=True)
+class _LaneTables:
+    """The geometry of the center line of a lane as arrays, precomputed from the control points.
+    Each segment between two control points is a circular arc (the SE2 interpolation with a constant twist),
+    or a straight segment if the heading does not change."""
+
+    positions: np.ndarray
+    """Positions of the control points, shape (n, 2)"""
+    headings: np.ndarray
+    """Headings of the control points, shape (n,)"""
+    directions: np.ndarray
+    """Unit vectors of the headings, shape (n, 2)"""
+    segments: np.ndarray
+    """Vectors from each control point to the next, shape (n-1, 2)"""
+    segments_norm2: np.ndarray
+    """Squared norms of the segments, shape (n-1,)"""
+    twists: np.ndarray
+    """Body twists (vx, vy, omega) interpolating each control point to the next (SE2 log), shape (n-1, 3)"""
+    lengths: np.ndarray
+    """Arc lengths of the segments, shape (n-1,)"""
+    cum_lengths: np.ndarray
+    """Arc length from the first control point to each control point, shape (n,)"""
+    straight: np.ndarray
+    """Whether the segments are straight, shape (n-1,)"""
+    centers: np.ndarray
+    """Centers of the arcs, shape (n-1, 2)"""
+    arc_radii: np.ndarray
+    """Radii of the arcs, shape (n-1,)"""
+    start_angles: np.ndarray
+    """Angle of the start of the arcs as seen from their center, shape (n-1,)"""
+
+    @classmethod
+    def from_control_points(cls, control_points: Sequence[LaneCtrPoint]) -> "_LaneTables":
+        positions = np.array([cp.q.p for cp in control_points], dtype=float).reshape(-1, 2)
+        headings = np.array([cp.q.theta for cp in control_points], dtype=float)
+        segments = np.diff(positions, axis=0)
+        omega = _wrap_angle(np.diff(headings))
+        # closed form of the SE2 log: v = R(-omega/2) t / sinc(omega/2), t the translation in the frame of the start
+        local = _rotate(segments, -headings[:-1])
+        linear = _rotate(local, -omega / 2) / np.sinc(omega / (2 * np.pi))[:, None]
+        twists = np.concatenate([linear, omega[:, None]], axis=1)
+        lengths = np.linalg.norm(linear, axis=1)
+        straight = np.abs(omega) < 1e-9
+        # the arcs rotate about the point at (-vy, vx) / omega in the frame of the start
+        with np.errstate(invalid="ignore", divide="ignore"):
+            local_centers = np.where(
+                straight[:, None], 0, np.stack([-linear[:, 1], linear[:, 0]], axis=1) / omega[:, None]
+            )
+        centers = positions[:-1] + _rotate(local_centers, headings[:-1])
+        arc_radii = np.linalg.norm(local_centers, axis=1)
+        start_angles = np.arctan2(positions[:-1, 1] - centers[:, 1], positions[:-1, 0] - centers[:, 0])
+        return cls(
+            positions=positions,
+            headings=headings,
+            directions=np.column_stack([np.cos(headings), np.sin(headings)]),
+            segments=segments,
+            segments_norm2=np.sum(segments * segments, axis=1),
+            twists=twists,
+            lengths=lengths,
+            cum_lengths=np.concatenate([[0.0], np.cumsum(lengths)]),
+            straight=straight,
+            centers=centers,
+            arc_radii=arc_radii,
+            start_angles=start_angles,
+        )
+
+    def pose_at(self, beta: float) -> tuple[float, float, float]:
+        """x, y and heading of the center line at beta. Before the first and after the last control point
+        the center line continues straight, one unit of beta corresponding to `_EXTENSION_STEP`."""
+        n = len(self.positions)
+        i = int(floor(beta))
+        if i < 0 or i >= n - 1:
+            i = 0 if i < 0 else n - 1
+            theta = float(self.headings[i])
+            d = (beta - i) * _EXTENSION_STEP
+            return float(self.positions[i, 0]) + d * cos(theta), float(self.positions[i, 1]) + d * sin(theta), theta
+        alpha = beta - i
+        theta0 = float(self.headings[i])
+        vx, vy, omega = self.twists[i].tolist()
+        phi = alpha * omega
+        # translation of exp(alpha * twist): alpha * sin(phi/2)/(phi/2) * R(phi/2) v
+        k = alpha if abs(phi) < 1e-12 else alpha * sin(phi / 2) / (phi / 2)
+        c, s = cos(theta0 + phi / 2), sin(theta0 + phi / 2)
+        x = float(self.positions[i, 0]) + k * (c * vx - s * vy)
+        y = float(self.positions[i, 1]) + k * (s * vx + c * vy)
+        return x, y, theta0 + phi
+
+    def poses_at(self, betas: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized `pose_at`, x, y and heading have the shape of betas"""
+        n = len(self.positions)
+        i = np.floor(betas).astype(int)
+        extension = (i < 0) | (i >= n - 1)
+        # straight extensions
+        i_ext = np.where(i < 0, 0, n - 1)
+        theta_ext = self.headings[i_ext]
+        d = (betas - i_ext) * _EXTENSION_STEP
+        x = self.positions[i_ext, 0] + d * np.cos(theta_ext)
+        y = self.positions[i_ext, 1] + d * np.sin(theta_ext)
+        if n < 2:
+            return x, y, theta_ext
+        # arcs, the translation of exp(alpha * twist) is alpha * sin(phi/2)/(phi/2) * R(phi/2) v
+        seg = np.clip(i, 0, n - 2)
+        alpha = betas - seg
+        theta0 = self.headings[seg]
+        vx, vy, omega = self.twists[seg, 0], self.twists[seg, 1], self.twists[seg, 2]
+        phi = alpha * omega
+        k = alpha * np.sinc(phi / (2 * np.pi))
+        c, s = np.cos(theta0 + phi / 2), np.sin(theta0 + phi / 2)
+        x = np.where(extension, x, self.positions[seg, 0] + k * (c * vx - s * vy))
+        y = np.where(extension, y, self.positions[seg, 1] + k * (s * vx + c * vy))
+        return x, y, np.where(extension, theta_ext, theta0 + phi)
+
+
+def _warn_tol_deprecated(tol: Optional[float]):
+    """Warns the callers still passing the tolerance of the former numerical projection"""
+    if tol is not None:
+        warnings.warn(
+            "tol is deprecated and ignored, the projection on the center line is in closed form",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+
 
 class DgLanelet:
     """Taking the best from commonroad Lanelet and Duckietown LaneSegment"""
@@ -84,6 +252,11 @@ class DgLanelet:
     def __init__(self, control_points: Sequence[LaneCtrPoint]):
         self.control_points: list[LaneCtrPoint] = list(control_points)
 
+    @cached_property
+    def _tables(self) -> _LaneTables:
+        """The center line as arrays, computed at the first use (the control points are not supposed to change)"""
+        return _LaneTables.from_control_points(self.control_points)
+
     @classmethod
     def from_commonroad_lanelet(cls, lanelet: Lanelet) -> "DgLanelet":
         return cls.from_vertices(
@@ -105,53 +278,120 @@ class DgLanelet:
             ctr_points.append(LaneCtrPoint(q, r=np.linalg.norm(normal) / 2))
         return DgLanelet(ctr_points)
 
-    @cached(LRUCache(maxsize=128))
     @staticmethod
     def get_lanelets(lane_network: LaneletNetwork, points: list[np.ndarray]) -> list[Lanelet]:
-        lane_ids = lane_network.find_lanelet_by_position(point_list=points)
+        """The first lanelet containing each point, from the spatial index shared by the users of the network"""
+        from dg_commons.maps.lanelet_index import LaneletIndex  # import here to avoid circular imports
+
+        lane_ids = LaneletIndex.of(lane_network).lanelet_ids_at_points(np.array(points))
         return [lane_network.find_lanelet_by_id(lid[0]) for lid in lane_ids]
 
-    @cached(LRUCache(maxsize=128))
     def get_lane_lengths(self) -> list[float]:
-        res = []
-        for i in range(len(self.control_points) - 1):
-            p0 = self.control_points[i].q
-            p1 = self.control_points[i + 1].q
-            sd = get_distance_SE2(p0.as_SE2(), p1.as_SE2())
-            res.append(sd)
-        return res
+        return self._tables.lengths.tolist()
 
     def get_lane_length(self) -> float:
-        return sum(self.get_lane_lengths())
-
-    def lane_pose_from_SE2Transform(self, qt: SE2Transform, tol: float = 1e-3) -> DgLanePose:
-        return self.lane_pose_from_SE2_generic(qt.as_SE2(), tol=tol)
-
-    def lane_pose_from_SE2_generic(self, q: SE2value, tol: float = 1e-3) -> DgLanePose:
-        """Note this function performs a local search, not very robust to strange situations"""
-        p, _, _ = translation_angle_scale_from_E2(q)
-
-        beta, q0 = self.find_along_lane_closest_point(p, tol=tol)
-        along_lane = self.along_lane_from_beta(beta)
-        rel = relative_pose(q0, q)
-
-        r, relative_heading, _ = translation_angle_scale_from_E2(rel)
-        lateral = r[1]
-
+        return float(self._tables.cum_lengths[-1])
+
+    def lane_pose_from_SE2Transform(self, qt: SE2Transform, tol: Optional[float] = None) -> DgLanePose:
+        """:param tol: deprecated, the projection is in closed form"""
+        _warn_tol_deprecated(tol)
+        return self.lane_pose_from_SE2_generic(qt.as_SE2())
+
+    def lane_pose_from_SE2_generic(self, q: SE2value, tol: Optional[float] = None) -> DgLanePose:
+        """The lane pose of q, from the closest point of the center line (see `projection_from_T2value`).
+        :param tol: deprecated, the projection is in closed form"""
+        _warn_tol_deprecated(tol)
+        p, theta, _ = translation_angle_scale_from_E2(q)
+        beta, along_lane, lateral = self.projection_from_T2value(p)
+        relative_heading = float(_wrap_angle(theta - self._tables.pose_at(beta)[2]))
         return self.lane_pose(along_lane=along_lane, relative_heading=relative_heading, lateral=lateral)
 
+    def projection_from_T2value(
+        self, p: T2value, bracket: Optional[Sequence[float]] = None
+    ) -> tuple[float, float, float]:
+        """
+        Closed-form projection of a point on the center line. Each segment between two control points is a circular
+        arc (or a straight segment), the closest point on each of them is computed in closed form and the closest
+        overall is kept. Before the first and after the last control point the center line continues straight.
+        :param p: the point
+        :param bracket: if given, only the part of the center line with beta in this interval is considered
+        :return: beta, along_lane and lateral (positive to the left) of the closest point of the center line
+        """
+        brackets = None if bracket is None else np.array([bracket], dtype=float)
+        beta, _, _, _, lateral = self._projections(np.array([p[:2]], dtype=float), brackets)
+        return float(beta[0]), self.along_lane_from_beta(float(beta[0])), float(lateral[0])
+
+    def _projections(self, points: np.ndarray, brackets: Optional[np.ndarray] = None) -> tuple[np.ndarray, ...]:
+        """Projections of the points (N, 2) on the center line, optionally with beta within brackets (N, 2).
+        With brackets, each point is projected only on the segments its bracket overlaps.
+        :return: beta, x, y, heading of the closest points and the lateral offsets, each of shape (N,)"""
+        t = self._tables
+        n = len(t.positions)
+        # straight extensions before the first and after the last control point
+        candidates = []
+        for i, sign in ((0, -1), (n - 1, 1)):
+            d = np.maximum(sign * ((points - t.positions[i]) @ t.directions[i]), 0)
+            candidates.append(i + sign * d / _EXTENSION_STEP)
+        rows = np.arange(len(points))
+        if brackets is None:
+            segments = np.arange(n - 1)[None, :]
+            in_bracket = None
+        else:
+            first = np.clip(np.floor(brackets[:, 0]), 0, n - 1).astype(int)
+            last = np.clip(np.ceil(brackets[:, 1]), first, n - 1).astype(int)
+            # a window as wide as the widest bracket, starting at the first segment of each bracket
+            window = np.arange(max(int(np.max(last - first, initial=0)), 0))
+            segments = np.minimum(first[:, None] + window, n - 2)
+            in_bracket = first[:, None] + window < last[:, None]
+        if n > 1 and segments.shape[1] > 0:
+            alpha, dist2 = self._segments_projection(points, segments)
+            if in_bracket is not None:
+                dist2 = np.where(in_bracket, dist2, np.inf)
+            k = np.argmin(dist2, axis=1)
+            k_segments = np.broadcast_to(segments, dist2.shape)[rows, k]
+            # without any segment in the bracket, the candidate repeats the first one
+            candidates.append(np.where(np.isfinite(dist2[rows, k]), k_segments + alpha[rows, k], candidates[0]))
+        betas = np.stack(candidates, axis=1)
+        if brackets is not None:
+            betas = np.clip(betas, brackets[:, 0, None], brackets[:, 1, None])
+        x, y, heading = t.poses_at(betas)
+        best = np.argmin((points[:, 0, None] - x) ** 2 + (points[:, 1, None] - y) ** 2, axis=1)
+        beta, x, y, heading = betas[rows, best], x[rows, best], y[rows, best], heading[rows, best]
+        lateral = -np.sin(heading) * (points[:, 0] - x) + np.cos(heading) * (points[:, 1] - y)
+        return beta, x, y, heading, lateral
+
+    def _segments_projection(self, points: np.ndarray, segments: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """The parameter alpha in [0, 1] of the closest point of the segments to each point (N, 2),
+        with the squared distances. The indices of the segments are of shape (N, m), or (1, m) for all the points,
+        the outputs of shape (N, m)."""
+        t = self._tables
+        d = points[:, None, :] - t.positions[segments]
+        vectors, norm2 = t.segments[segments], t.segments_norm2[segments]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # straight segments
+            alpha_straight = np.where(norm2 == 0, 0, np.clip(np.sum(d * vectors, axis=2) / norm2, 0, 1))
+            # arcs, the angle of p around the center could also be reached going around the circle the other way
+            dc = points[:, None, :] - t.centers[segments]
+            start_angles = t.start_angles[segments]
+            phi = _wrap_angle(np.arctan2(dc[..., 1], dc[..., 0]) - start_angles)
+            omega = t.twists[segments, 2]
+            alphas = np.clip((phi[..., None] + np.array([0, 2 * np.pi, -2 * np.pi])) / omega[..., None], 0, 1)
+        angles = start_angles[..., None] + alphas * omega[..., None]
+        radii = t.arc_radii[segments][..., None]
+        arc_dist2 = (dc[..., 0, None] - radii * np.cos(angles)) ** 2 + (dc[..., 1, None] - radii * np.sin(angles)) ** 2
+        best = np.argmin(arc_dist2, axis=2)[..., None]
+        straight_dist2 = np.sum((d - alpha_straight[..., None] * vectors) ** 2, axis=2)
+        straight = t.straight[segments]
+        alpha = np.where(straight, alpha_straight, np.take_along_axis(alphas, best, axis=2)[..., 0])
+        return alpha, np.where(straight, straight_dist2, np.take_along_axis(arc_dist2, best, axis=2)[..., 0])
+
     def find_along_lane_closest_point(
-        self, p: T2value, tol: float = 1e-5, bracket: Optional[Sequence[float]] = None
+        self, p: T2value, tol: Optional[float] = None, bracket: Optional[Sequence[float]] = None
     ) -> tuple[float, SE2value]:
-        def get_delta(beta):
-            q0 = self.center_point(beta)
-            t0, _ = translation_angle_from_SE2(q0)
-            d = np.linalg.norm(p - t0)
-            return d**2
-
-        bracket = (-1, len(self.control_points)) if bracket is None else bracket
-        res0 = minimize_scalar(get_delta, bracket=bracket, tol=tol)
-        beta0 = res0.x
+        """The closest point of the center line (see `projection_from_T2value`).
+        :param tol: deprecated, the projection is in closed form"""
+        _warn_tol_deprecated(tol)
+        beta0, _, _ = self.projection_from_T2value(p, bracket=bracket)
         q = self.center_point(beta0)
         return beta0, q
 
@@ -208,26 +448,78 @@ class DgLanelet:
             correct_direction=correct_direction,
         )
 
+    def lane_poses(self, poses: np.ndarray, brackets: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Vectorized `lane_pose_from_SE2_generic` for many poses at once.
+        :param poses: x, y and theta of the queries, shape (N, 3)
+        :param brackets: optional interval of beta to search per query, shape (N, 2). When the queries follow
+            a trajectory, the beta of the previous query plus a margin makes a good bracket for the next one.
+            Each query is then projected only on the segments within its bracket.
+        :return: a structured array of shape (N,) with the fields of `LANE_POSES_DTYPE`
+        """
+        poses = np.asarray(poses, dtype=float).reshape(-1, 3)
+        if brackets is not None:
+            brackets = np.asarray(brackets, dtype=float).reshape(-1, 2)
+            if len(brackets) != len(poses):
+                raise ZValueError("One bracket per pose is needed", n_poses=len(poses), n_brackets=len(brackets))
+        res = np.empty(len(poses), dtype=LANE_POSES_DTYPE)
+        # in chunks to bound the memory of the (queries x segments) intermediate arrays
+        chunk = max(1, _MAX_PROJECTIONS // len(self.control_points))
+        for start in range(0, len(poses), chunk):
+            sl = slice(start, start + chunk)
+            b = None if brackets is None else brackets[sl]
+            res["beta"][sl], res["center_x"][sl], res["center_y"][sl], res["center_theta"][sl], res["lateral"][sl] = (
+                self._projections(poses[sl, :2], b)
+            )
+        beta, lateral = res["beta"], res["lateral"]
+        res["along_lane"] = self._along_lane_from_betas(beta)
+        res["relative_heading"] = _wrap_angle(poses[:, 2] - res["center_theta"])
+        r = np.interp(beta, np.arange(len(self.control_points)), [cp.r for cp in self.control_points])
+        res["lateral_inside"] = (-r <= lateral) & (lateral <= r)
+        res["outside_right"] = lateral < -r
+        res["outside_left"] = r < lateral
+        res["distance_from_left"] = np.abs(r - lateral)
+        res["distance_from_right"] = np.abs(-r - lateral)
+        res["distance_from_center"] = np.abs(lateral)
+        res["lateral_left"] = r
+        res["lateral_right"] = -r
+        L = self.get_lane_length()
+        along_lane = res["along_lane"]
+        res["along_inside"] = (0 <= along_lane) & (along_lane < L)
+        res["along_before"] = along_lane < 0
+        res["along_after"] = along_lane > L
+        res["inside"] = res["lateral_inside"] & res["along_inside"]
+        res["correct_direction"] = np.abs(res["relative_heading"]) <= np.pi / 2
+        return res
+
     def along_lane_from_beta(self, beta: float) -> float:
         """Returns the position along the lane (parametrized in distance)"""
-        lengths = self.get_lane_lengths()
+        t = self._tables
         if beta < 0:
             return beta
         elif beta >= len(self.control_points) - 1:
             rest = beta - (len(self.control_points) - 1)
-            return sum(lengths) + rest
+            return float(t.cum_lengths[-1]) + rest
         else:
             i = int(np.floor(beta))
             rest = beta - i
-            res = sum(lengths[:i]) + lengths[i] * rest
-            return res
+            return float(t.cum_lengths[i] + t.lengths[i] * rest)
+
+    def _along_lane_from_betas(self, betas: np.ndarray) -> np.ndarray:
+        """Vectorized `along_lane_from_beta`"""
+        t = self._tables
+        n = len(self.control_points)
+        i = np.clip(np.floor(betas).astype(int), 0, max(n - 2, 0))
+        lengths = np.append(t.lengths, 0.0)
+        inner = t.cum_lengths[i] + lengths[i] * (betas - i)
+        return np.where(betas < 0, betas, np.where(betas >= n - 1, t.cum_lengths[-1] + (betas - (n - 1)), inner))
 
     def beta_from_along_lane(self, along_lane: float) -> float:
         """Returns the progress along the lane (parametrized in control points)"""
-        lengths = self.get_lane_lengths()
+        t = self._tables
         x0 = along_lane
         n = len(self.control_points)
-        S = sum(lengths)
+        S = float(t.cum_lengths[-1])
 
         if x0 < 0:
             beta = x0
@@ -239,14 +531,9 @@ class DgLanelet:
             beta = n - 1.0
             return beta
         assert 0 <= x0 < S, (x0, S)
-
-        for i in range(n - 1):
-            start_x = sum(lengths[:i])
-            end_x = sum(lengths[: i + 1])
-            if start_x <= x0 < end_x:
-                beta = i + (x0 - start_x) / lengths[i]
-                return beta
-        assert False
+        # the last control point starting before x0 (segments of zero length are skipped)
+        i = int(np.searchsorted(t.cum_lengths, x0, side="right")) - 1
+        return i + (x0 - float(t.cum_lengths[i])) / float(t.lengths[i])
 
     def radius(self, beta: float) -> float:
         n = len(self.control_points)
@@ -262,23 +549,10 @@ class DgLanelet:
             return r0 * (1 - alpha) + r1 * alpha
 
     def center_point(self, beta: float) -> SE2value:
-        n = len(self.control_points)
-        i = int(np.floor(beta))
-
-        if i < 0:
-            q0 = self.control_points[0].q.as_SE2()
-            q1 = SE2.multiply(q0, SE2_from_translation_angle([0.1, 0], 0))
-            alpha = beta
-        elif i >= n - 1:
-            q0 = self.control_points[-1].q.as_SE2()
-            q1 = SE2.multiply(q0, SE2_from_translation_angle([0.1, 0], 0))
-            alpha = beta - (n - 1)
-        else:
-            alpha = beta - i
-            q0 = self.control_points[i].q.as_SE2()
-            q1 = self.control_points[i + 1].q.as_SE2()
-        q = SE2_interpolate(q0, q1, alpha)
-        return q
+        """The pose of the center line at beta, the SE2 interpolation of the control points (in closed form).
+        Before the first and after the last control point the center line continues straight."""
+        x, y, heading = self._tables.pose_at(beta)
+        return SE2_from_translation_angle(np.array([x, y]), heading)
 
     def center_point_fast_SE2Transform(self, beta: float) -> SE2Transform:
         """Mainly based on the assumption of very close control points, hence interpolates linearly"""
@@ -302,20 +576,30 @@ class DgLanelet:
         theta = q0.theta * (1 - alpha) + q1.theta * alpha
         return SE2Transform(p, theta)
 
-    def is_inside_from_T2value(self, position: T2value, tol: float = 1e-3) -> bool:
-        beta, _ = self.find_along_lane_closest_point(position, tol=tol)
+    def is_inside_from_T2value(self, position: T2value, tol: Optional[float] = None) -> bool:
+        """:param tol: deprecated, the projection is in closed form"""
+        _warn_tol_deprecated(tol)
+        beta, _ = self.find_along_lane_closest_point(position)
         r = self.radius(beta)
         center = self.center_point_fast_SE2Transform(beta).p
         lateral = np.linalg.norm(center - position)
         return lateral <= r and 0 <= beta <= len(self.control_points) - 1
 
     def along_lane_from_T2value(
-        self, position: T2value, tol: float = 1e-3, bracket: Optional[Sequence[float]] = None, fast: bool = False
+        self,
+        position: T2value,
+        tol: Optional[float] = None,
+        bracket: Optional[Sequence[float]] = None,
+        fast: bool = False,
     ) -> float:
+        """:param tol: tolerance of the numerical minimization (fast only, 1e-3 by default),
+        deprecated otherwise as the projection is in closed form"""
         if fast:
+            tol = 1e-3 if tol is None else tol
             beta, _ = self.find_along_lane_closest_point_fast(position, tol=tol, bracket=bracket)
         else:
-            beta, _ = self.find_along_lane_closest_point(position, tol=tol, bracket=bracket)
+            _warn_tol_deprecated(tol)
+            beta, _ = self.find_along_lane_closest_point(position, bracket=bracket)
         return self.along_lane_from_beta(beta)
 
     @cached(LRUCache(maxsize=128))
@@ -1,48 +1,78 @@
+import numpy as np
+import shapely
+from commonroad.scenario.lanelet import LaneletNetwork
 from commonroad.scenario.scenario import Scenario
-from shapely import MultiPolygon
 from shapely.geometry import LineString, Polygon
-from shapely.ops import unary_union
+from shapely.strtree import STRtree
+
+from dg_commons.utils_cache import IdentityCache
+
+__all__ = ["build_road_boundary_obstacle", "share_road_boundaries"]
+
+_ROAD_BOUNDARIES: IdentityCache[tuple[LaneletNetwork, dict[float, tuple[list[LineString], list[Polygon]]]]] = (
+    IdentityCache()
+)
+"""The boundaries already built for a scenario (with its network), by buffer"""
 
 
 def build_road_boundary_obstacle(scenario: Scenario, buffer: float = 0.1) -> tuple[list[LineString], list[Polygon]]:
     """Returns a list of LineString of the scenario that are then used for collision checking.
     The boundaries are computed taking the external perimeter of the scenario and
     removing the entrance and exiting "gates" of the lanes.
+    They are built once per scenario and buffer, the lanelet network is assumed not to change afterwards.
     :param scenario: the scenario to build the boundaries for
     :param buffer: the buffer to apply to the lanelets
     @:return: a tuple containing the road boundaries and the open gates. Both are represented as a lists of LineStrings
     """
+    built = _built_boundaries(scenario)
+    if buffer not in built:
+        built[buffer] = _build_road_boundaries(scenario.lanelet_network, buffer)
+    scenario_bounds, entrance_exit_gates = built[buffer]
+    return list(scenario_bounds), list(entrance_exit_gates)
 
-    lanelets = scenario.lanelet_network.lanelets
-    scenario_bounds: list[LineString] = []
-    lane_polygons: list[Polygon] = []
-    entrance_exit_gates = []
+
+def share_road_boundaries(scenario: Scenario, buffer: float, boundaries: tuple[list[LineString], list[Polygon]]):
+    """Makes the boundaries (e.g. from a cache on disk) the ones returned by `build_road_boundary_obstacle`"""
+    _built_boundaries(scenario)[buffer] = boundaries
+
+
+def _built_boundaries(scenario: Scenario) -> dict[float, tuple[list[LineString], list[Polygon]]]:
+    """The boundaries already built for the scenario by buffer"""
+    network, built = _ROAD_BOUNDARIES.get(scenario) or (None, {})
+    if network is not scenario.lanelet_network:
+        built = {}
+        _ROAD_BOUNDARIES.put(scenario, (scenario.lanelet_network, built))
+    return built
+
+
+def _build_road_boundaries(network: LaneletNetwork, buffer: float) -> tuple[list[LineString], list[Polygon]]:
+    """
+    The lanelets are buffered all at once and merged, the gates are removed from each exterior at once
+    (only the ones intersecting it, from a spatial index).
+    """
+    lanelets = network.lanelets
+    gate_segments = []
     for lanelet in lanelets:
-        lane_polygons.append(lanelet.polygon.shapely_object.buffer(buffer))
         if len(lanelet.successor) == 0:
-            pt1 = lanelet.right_vertices[-1]
-            pt2 = lanelet.left_vertices[-1]
-            entrance_exit_gates.append(LineString([pt1, pt2]).buffer(buffer * 2))
+            gate_segments.append([lanelet.right_vertices[-1], lanelet.left_vertices[-1]])
         if len(lanelet.predecessor) == 0:
-            pt1 = lanelet.right_vertices[0]
-            pt2 = lanelet.left_vertices[0]
-            entrance_exit_gates.append(LineString([pt1, pt2]).buffer(buffer * 2))
-
-    overall_poly = unary_union(lane_polygons)
-    # if the overall_poly is a Polygon, convert it to a MultiPolygon
-    if isinstance(overall_poly, Polygon):
-        overall_poly = MultiPolygon(
-            [
-                overall_poly,
-            ]
-        )
-
-    for geo in overall_poly.geoms:
-        for interior in geo.interiors:
-            scenario_bounds.append(interior)
-
-        ext_bounds = geo.exterior
-        for eeg in entrance_exit_gates:
-            ext_bounds = ext_bounds.difference(eeg)
-        scenario_bounds += [g for g in ext_bounds.geoms]
-    return scenario_bounds, entrance_exit_gates
+            gate_segments.append([lanelet.right_vertices[0], lanelet.left_vertices[0]])
+    # same resolution as `BaseGeometry.buffer`
+    lane_polygons = shapely.buffer(
+        np.array([lanelet.polygon.shapely_object for lanelet in lanelets]), buffer, quad_segs=16
+    )
+    gate_lines = shapely.linestrings(np.array(gate_segments, dtype=float).reshape(-1, 2, 2))
+    gates = shapely.buffer(gate_lines, buffer * 2, quad_segs=16)
+
+    polygons = shapely.get_parts(shapely.union_all(lane_polygons))
+    exteriors = shapely.get_exterior_ring(polygons)
+    ext_idx, gate_idx = STRtree(gates).query(exteriors, predicate="intersects")
+    open_exteriors = exteriors.copy()
+    for i in np.unique(ext_idx):
+        open_exteriors[i] = shapely.difference(exteriors[i], shapely.union_all(gates[gate_idx[ext_idx == i]]))
+
+    scenario_bounds: list[LineString] = []
+    for polygon, open_exterior in zip(polygons, open_exteriors):
+        scenario_bounds += list(polygon.interiors)
+        scenario_bounds += [g for g in shapely.get_parts(open_exterior) if not g.is_empty]
+    return scenario_bounds, list(gates)
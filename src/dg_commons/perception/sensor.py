@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from math import atan
-from typing import Iterable
+from math import atan, cos, sin
+from typing import Iterable, Sequence
 
 import numpy as np
+import shapely
+from cachetools import LRUCache
 from commonroad_dc import pycrcc
 from commonroad_dc.pycrcc import Shape as crShape
 from shapely.geometry import Polygon, Point
@@ -21,11 +23,25 @@ class Sensor(ABC):
         self.angle_resolution = atan(1 / self.range)
         assert self.field_of_view <= 2 * np.pi
         assert self.range >= 0
+        self.static_obstacles: list[crShape] = []
+
+    def set_static_obstacles(self, obstacles: Iterable[crShape]):
+        """Obstacles that never move (e.g. of the scenario), considered in addition to the ones passed to
+        `fov_as_polygon_dynamic`. A list is kept as is (not copied), so that it can be shared."""
+        self.static_obstacles = obstacles if isinstance(obstacles, list) else list(obstacles)
 
     @abstractmethod
     def fov_as_polygon(self, obstacles: Iterable[crShape]) -> Polygon:
         pass
 
+    def fov_as_polygon_dynamic(self, obstacles: Iterable[crShape]) -> Polygon:
+        """
+        The field of view given the obstacles that move, in addition to the static ones (see `set_static_obstacles`).
+        By default all of them are passed to `fov_as_polygon`, the sensors that process the static obstacles only once
+        override it.
+        """
+        return self.fov_as_polygon(self.static_obstacles + list(obstacles))
+
     def is_omnidirectional(self) -> bool:
         return self.field_of_view > 2 * np.pi - self.angle_resolution
 
@@ -45,42 +61,406 @@ class FullRangeSensor(Sensor):
             raise NotImplementedError("Only omnidirectional sensors are supported for full range sensors.")
 
 
+@dataclass(frozen=True)
+class _ObstacleEdges:
+    """The edges of polygonal obstacles as arrays"""
+
+    starts: np.ndarray
+    """Start points of the edges, shape (E, 2)"""
+    ends: np.ndarray
+    """End points of the edges, shape (E, 2)"""
+    owners: np.ndarray
+    """Index of the polygon each edge belongs to, shape (E,)"""
+    boxes: np.ndarray
+    """Bounding boxes (min x, min y, max x, max y) of the polygons, shape (P, 4)"""
+    others: tuple[crShape, ...] = ()
+    """Obstacles that are not polygons, ray-traced by the collision checker"""
+
+    @classmethod
+    def from_shapes(cls, shapes: Iterable[crShape]) -> "_ObstacleEdges":
+        starts, ends, owners, boxes, others = [np.zeros((0, 2))], [np.zeros((0, 2))], [np.zeros(0, dtype=int)], [], []
+        for shape in shapes:
+            parts = shape.unpack() if isinstance(shape, pycrcc.ShapeGroup) else [shape]
+            for part in parts:
+                if not isinstance(part, pycrcc.Polygon):
+                    others.append(part)
+                    continue
+                rings = [part.vertices()] + list(part.hole_vertices())
+                for ring in rings:
+                    ring = np.array(ring, dtype=float).reshape(-1, 2)
+                    starts.append(ring)
+                    ends.append(np.roll(ring, -1, axis=0))
+                    owners.append(np.full(len(ring), len(boxes)))
+                outline = np.array(rings[0], dtype=float).reshape(-1, 2)
+                boxes.append(np.concatenate([outline.min(axis=0), outline.max(axis=0)]))
+        return cls(
+            starts=np.concatenate(starts),
+            ends=np.concatenate(ends),
+            owners=np.concatenate(owners),
+            boxes=np.array(boxes, dtype=float).reshape(-1, 4),
+            others=tuple(others),
+        )
+
+    def within(self, center: np.ndarray, radius: float) -> "_ObstacleEdges":
+        """The edges whose bounding box intersects the square of half side radius around center"""
+        lower, upper = np.minimum(self.starts, self.ends), np.maximum(self.starts, self.ends)
+        keep = np.all((lower <= center + radius) & (upper >= center - radius), axis=1)
+        return _ObstacleEdges(self.starts[keep], self.ends[keep], self.owners[keep], self.boxes, self.others)
+
+    def concat(self, other: "_ObstacleEdges") -> "_ObstacleEdges":
+        return _ObstacleEdges(
+            starts=np.concatenate([self.starts, other.starts]),
+            ends=np.concatenate([self.ends, other.ends]),
+            owners=np.concatenate([self.owners, other.owners + len(self.boxes)]),
+            boxes=np.concatenate([self.boxes, other.boxes]),
+            others=self.others + other.others,
+        )
+
+    def contain(self, point: np.ndarray) -> bool:
+        """Whether the point is inside any of the polygons (even-odd rule on a horizontal ray).
+        Meaningful only if the edges of the polygons around the point have not been culled."""
+        around = np.flatnonzero(np.all((self.boxes[:, :2] <= point) & (point <= self.boxes[:, 2:]), axis=1))
+        if len(around) == 0:
+            return False
+        keep = np.isin(self.owners, around)
+        a, b = self.starts[keep] - point, self.ends[keep] - point
+        crossing = (a[:, 1] > 0) != (b[:, 1] > 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x = a[:, 0] - a[:, 1] * (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+        crossings = np.bincount(self.owners[keep][crossing & (x > 0)], minlength=len(self.boxes))
+        return bool(np.any(crossings % 2 == 1))
+
+
+_NO_EDGES = _ObstacleEdges.from_shapes([])
+
+_STATIC_EDGES: LRUCache = LRUCache(maxsize=8)
+
+
+def _static_edges(obstacles: list[crShape]) -> _ObstacleEdges:
+    """The edges of a list of static obstacles, shared by the sensors given the same list (e.g. by `FovObsFilter`)"""
+    cached = _STATIC_EDGES.get(id(obstacles))
+    if cached is None or cached[0] is not obstacles:
+        # the list is kept in the cache, its id cannot be reused while cached
+        cached = (obstacles, _ObstacleEdges.from_shapes(obstacles))
+        _STATIC_EDGES[id(obstacles)] = cached
+    return cached[1]
+
+
+_MAX_RAY_EDGE_PAIRS = 2**18
+"""Maximum number of (ray, edge) intersections computed at once"""
+
+
+def _cast_rays(origin: np.ndarray, angles: np.ndarray, edges: _ObstacleEdges, max_range: float) -> np.ndarray:
+    """The distance from origin to the closest edge along each ray (at most max_range)"""
+    directions = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    distances = np.full(len(angles), float(max_range))
+    chunk = max(1, _MAX_RAY_EDGE_PAIRS // max(len(angles), 1))
+    for start in range(0, len(edges.starts), chunk):
+        a, b = edges.starts[start : start + chunk], edges.ends[start : start + chunk]
+        e, w = b - a, a - origin
+        # origin + t * direction = a + u * e
+        denom = directions[:, None, 0] * e[None, :, 1] - directions[:, None, 1] * e[None, :, 0]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t = (w[None, :, 0] * e[None, :, 1] - w[None, :, 1] * e[None, :, 0]) / denom
+            u = (w[None, :, 0] * directions[:, None, 1] - w[None, :, 1] * directions[:, None, 0]) / denom
+        hit = (denom != 0) & (t >= 0) & (u >= 0) & (u <= 1)
+        distances = np.minimum(distances, np.where(hit, t, np.inf).min(axis=1, initial=np.inf))
+    return distances
+
+
 @dataclass
 class VisRangeSensor(Sensor):
+    """
+    Field of view bounded by rays cast every `angle_resolution` and stopped by the closest obstacle.
+    The edges of the static obstacles are extracted once (see `set_static_obstacles`), at each call only the edges
+    within range are intersected with all the rays at once.
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._static_edges = _NO_EDGES
+
+    def set_static_obstacles(self, obstacles: Iterable[crShape]):
+        super().set_static_obstacles(obstacles)
+        self._static_edges = _static_edges(self.static_obstacles)
+
     def fov_as_polygon(self, obstacles: Iterable[crShape]) -> Polygon:
-        vertices = []
+        return self._fov(_NO_EDGES, obstacles)
 
-        if not self.is_omnidirectional():
-            vertices.append(self.pose.p)
+    def fov_as_polygon_dynamic(self, obstacles: Iterable[crShape]) -> Polygon:
+        return self._fov(self._static_edges, obstacles)
+
+    def _fov(self, static_edges: _ObstacleEdges, obstacles: Iterable[crShape]) -> Polygon:
+        origin = np.array(self.pose.p, dtype=float)
+        dynamic_edges = _ObstacleEdges.from_shapes(obstacles)
+        # range culling before intersecting the rays
+        edges = static_edges.within(origin, self.range).concat(dynamic_edges.within(origin, self.range))
 
         num_ray_angles = int(self.field_of_view / self.angle_resolution) + 1
         ray_angles = self.pose.theta + np.linspace(-self.field_of_view / 2, self.field_of_view / 2, num_ray_angles)
+        if static_edges.contain(origin) or dynamic_edges.contain(origin):
+            # as with the collision checker, a sensor inside an obstacle is blinded
+            distances = np.zeros(num_ray_angles)
+        else:
+            distances = _cast_rays(origin, ray_angles, edges, self.range)
+        if edges.others:
+            distances = np.minimum(distances, self._raytrace(origin, ray_angles, edges.others))
+        vertices = origin + distances[:, None] * np.stack([np.cos(ray_angles), np.sin(ray_angles)], axis=1)
+
+        if not self.is_omnidirectional():
+            vertices = np.concatenate([origin[None], vertices])
+        return Polygon(np.concatenate([vertices, vertices[:1]]))
 
+    def _raytrace(self, origin: np.ndarray, ray_angles: np.ndarray, obstacles: Sequence[crShape]) -> np.ndarray:
+        """Ray-traces the obstacles that are not polygons one ray at a time with the collision checker"""
         cc = pycrcc.CollisionChecker()
         for obstacle in obstacles:
             cc.add_collision_object(obstacle)
+        distances = np.full(len(ray_angles), float(self.range))
+        for i, angle in enumerate(ray_angles):
+            ray_end = origin + self.range * np.array([np.cos(angle), np.sin(angle)])
+            for ray_hit in cc.raytrace(origin[0], origin[1], ray_end[0], ray_end[1], False):
+                hits = np.array(ray_hit, dtype=float).reshape(2, 2)
+                distances[i] = min(distances[i], np.min(np.linalg.norm(hits - origin, axis=1)))
+        return distances
+
+
+def _split_at_intersections(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Splits the segments where they cross each other, afterwards they can only touch at their end points.
+    The candidate pairs come from a spatial index, O((E + K) log E) for K crossings."""
+    if len(starts) < 2:
+        return starts, ends
+    tree = shapely.STRtree(shapely.linestrings(np.stack([starts, ends], axis=1)))
+    i, j = tree.query(tree.geometries, predicate="intersects")
+    i, j = i[i < j], j[i < j]
+    d_i, d_j = ends[i] - starts[i], ends[j] - starts[j]
+    w = starts[j] - starts[i]
+    denom = d_i[:, 0] * d_j[:, 1] - d_i[:, 1] * d_j[:, 0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t_i = (w[:, 0] * d_j[:, 1] - w[:, 1] * d_j[:, 0]) / denom
+        t_j = (w[:, 0] * d_i[:, 1] - w[:, 1] * d_i[:, 0]) / denom
+    # parallel (also collinear) segments are not split
+    segments, params = [], []
+    for seg, t in ((i, t_i), (j, t_j)):
+        interior = (denom != 0) & (t > _SPLIT_TOL) & (t < 1 - _SPLIT_TOL)
+        segments.append(seg[interior])
+        params.append(t[interior])
+    segments, params = np.concatenate(segments), np.concatenate(params)
+    if len(segments) == 0:
+        return starts, ends
+    # each segment becomes the pieces between its sorted split parameters
+    segments = np.concatenate([segments, np.arange(len(starts)), np.arange(len(starts))])
+    params = np.concatenate([params, np.zeros(len(starts)), np.ones(len(starts))])
+    order = np.lexsort((params, segments))
+    segments, params = segments[order], params[order]
+    same = segments[:-1] == segments[1:]
+    seg, t0, t1 = segments[:-1][same], params[:-1][same], params[1:][same]
+    d = ends[seg] - starts[seg]
+    return starts[seg] + t0[:, None] * d, starts[seg] + t1[:, None] * d
+
+
+_SPLIT_TOL = 1e-9
+"""Relative position along a segment under which a crossing is considered at its end points"""
+
+
+class _SweepSegments:
+    """Segments seen from the origin, with their angular intervals relative to the start of the sweep"""
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, angle0: float, sweep: float, max_range: float):
+        """
+        :param starts: start points relative to the origin, shape (E, 2)
+        :param ends: end points relative to the origin, shape (E, 2)
+        :param angle0: absolute angle where the sweep starts
+        :param sweep: angular width of the sweep (up to 2 pi)
+        :param max_range: range of the sensor
+        """
+        # orient the segments counterclockwise as seen from the origin, drop the ones pointing at it
+        cross = starts[:, 0] * ends[:, 1] - starts[:, 1] * ends[:, 0]
+        a = np.where(cross[:, None] > 0, starts, ends)[cross != 0]
+        b = np.where(cross[:, None] > 0, ends, starts)[cross != 0]
+        alpha_a = np.mod(np.arctan2(a[:, 1], a[:, 0]) - angle0, 2 * np.pi)
+        alpha_b = np.mod(np.arctan2(b[:, 1], b[:, 0]) - angle0, 2 * np.pi)
+        # the segments across the start of the sweep are split on it
+        wrap = alpha_b <= alpha_a
+        direction = np.array([np.cos(angle0), np.sin(angle0)])
+        seam = _hit_distance(a[wrap], b[wrap] - a[wrap], direction)[:, None] * direction
+        a, b = np.concatenate([a[~wrap], a[wrap], seam]), np.concatenate([b[~wrap], seam, b[wrap]])
+        start = np.concatenate([alpha_a[~wrap], alpha_a[wrap], np.zeros(wrap.sum())])
+        end = np.concatenate([alpha_b[~wrap], np.full(wrap.sum(), 2 * np.pi), alpha_b[wrap]])
+        keep = (start < sweep) & (end > start)
+        self.a, self.d = a[keep], b[keep] - a[keep]
+        self.start, self.end = start[keep], np.minimum(end[keep], sweep)
+        self.angle0 = angle0
+        self.visible_from, self.visible_to = self._within_range(max_range)
+
+    def _within_range(self, max_range: float) -> tuple[np.ndarray, np.ndarray]:
+        """The intervals of (relative) angles where the lines of the segments are within max_range (maybe empty)"""
+        d = self.d / np.linalg.norm(self.d, axis=1)[:, None]
+        foot = self.a - np.sum(self.a * d, axis=1)[:, None] * d
+        h = np.linalg.norm(foot, axis=1)
+        phi = np.mod(np.arctan2(foot[:, 1], foot[:, 0]) - self.angle0, 2 * np.pi)
+        # the representative of phi closest to the interval of the segment
+        phi += 2 * np.pi * np.round(((self.start + self.end) / 2 - phi) / (2 * np.pi))
+        half = np.arccos(np.minimum(h / max_range, 1))
+        return phi - half, phi + half
+
+    def points(self, i: np.ndarray, angles: np.ndarray) -> np.ndarray:
+        """Points of the segments i (relative to the origin) along the rays at the (relative) angles"""
+        directions = np.stack([np.cos(self.angle0 + angles), np.sin(self.angle0 + angles)], axis=-1)
+        return _hit_distance(self.a[i], self.d[i], directions)[:, None] * directions
+
+    def sweep(self, sweep: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The intervals of (relative) angles between consecutive events, with the segment in front over each of them.
+        The active segments are kept in a binary heap by distance from the origin, with their positions in it
+        so that the ones ending are removed in O(log E): segments that do not cross keep their order over their
+        common angular interval, so two of them are compared in the middle of what remains of it.
+        :return: start and end of the intervals and index of the segment in front (-1 if none)
+        """
+        by_start = np.argsort(self.start, kind="stable").tolist()
+        by_end = np.argsort(self.end, kind="stable").tolist()
+        starts, ends = self.start.tolist(), self.end.tolist()
+        (ax, ay), (dx, dy) = self.a.T.tolist(), self.d.T.tolist()
+        angle0 = self.angle0
+        lo = 0.0
+
+        def in_front(i: int, j: int) -> bool:
+            mid = angle0 + (lo + min(ends[i], ends[j])) / 2
+            ux, uy = cos(mid), sin(mid)
+            t_i = (ax[i] * dy[i] - ay[i] * dx[i]) / (ux * dy[i] - uy * dx[i])
+            t_j = (ax[j] * dy[j] - ay[j] * dx[j]) / (ux * dy[j] - uy * dx[j])
+            return t_i * t_i < t_j * t_j
+
+        heap: list[int] = []
+        position = [-1] * len(starts)
+
+        def move(k: int, i: int):
+            heap[k] = i
+            position[i] = k
+
+        def sift_up(k: int):
+            i = heap[k]
+            while k > 0 and in_front(i, heap[(k - 1) // 2]):
+                move(k, heap[(k - 1) // 2])
+                k = (k - 1) // 2
+            move(k, i)
+
+        def sift_down(k: int):
+            i = heap[k]
+            while 2 * k + 1 < len(heap):
+                child = 2 * k + 1
+                if child + 1 < len(heap) and in_front(heap[child + 1], heap[child]):
+                    child += 1
+                if not in_front(heap[child], i):
+                    break
+                move(k, heap[child])
+                k = child
+            move(k, i)
+
+        breaks = np.unique(np.concatenate([[0.0, sweep], self.start, self.end]))
+        nearest = []
+        k_start = k_end = 0
+        for lo in breaks[:-1].tolist():
+            while k_end < len(by_end) and ends[by_end[k_end]] <= lo:
+                k = position[by_end[k_end]]
+                k_end += 1
+                last = heap.pop()
+                if k < len(heap):
+                    heap[k] = last
+                    sift_up(k)
+                    sift_down(position[last])
+            while k_start < len(by_start) and starts[by_start[k_start]] <= lo:
+                heap.append(by_start[k_start])
+                k_start += 1
+                sift_up(len(heap) - 1)
+            nearest.append(heap[0] if heap else -1)
+        return breaks[:-1], breaks[1:], np.array(nearest, dtype=int)
+
+
+def _hit_distance(a: np.ndarray, d: np.ndarray, directions: np.ndarray) -> np.ndarray:
+    """Distance from the origin along the directions to the lines through a with direction d"""
+    cross_ad = a[..., 0] * d[..., 1] - a[..., 1] * d[..., 0]
+    return cross_ad / (directions[..., 0] * d[..., 1] - directions[..., 1] * d[..., 0])
+
+
+@dataclass
+class SweepVisSensor(Sensor):
+    """
+    Exact visibility polygon from a rotational sweep over the edges of the obstacles within range.
+    Unlike `VisRangeSensor` the boundary along the obstacles does not depend on `angle_resolution`, which is only
+    used to discretize the arcs at the limit of the range. O(E log E) in the number E of edges within range
+    (plus the crossings among them). Only polygonal obstacles are supported.
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._static_edges = _NO_EDGES
+
+    def set_static_obstacles(self, obstacles: Iterable[crShape]):
+        super().set_static_obstacles(obstacles)
+        self._static_edges = _static_edges(self.static_obstacles)
+
+    def fov_as_polygon(self, obstacles: Iterable[crShape]) -> Polygon:
+        return self._fov(_NO_EDGES, obstacles)
+
+    def fov_as_polygon_dynamic(self, obstacles: Iterable[crShape]) -> Polygon:
+        return self._fov(self._static_edges, obstacles)
+
+    def _fov(self, static_edges: _ObstacleEdges, obstacles: Iterable[crShape]) -> Polygon:
+        origin = np.array(self.pose.p, dtype=float)
+        dynamic_edges = _ObstacleEdges.from_shapes(obstacles)
+        if static_edges.others or dynamic_edges.others:
+            raise NotImplementedError("Only polygonal obstacles are supported by the sweep")
+        if static_edges.contain(origin) or dynamic_edges.contain(origin):
+            # as with the collision checker, a sensor inside an obstacle is blinded
+            return Polygon([origin] * 3)
+        edges = static_edges.within(origin, self.range).concat(dynamic_edges.within(origin, self.range))
+        starts, ends = _split_at_intersections(edges.starts - origin, edges.ends - origin)
+        omnidirectional = self.is_omnidirectional()
+        sweep = 2 * np.pi if omnidirectional else self.field_of_view
+        segments = _SweepSegments(starts, ends, angle0=self.pose.theta - sweep / 2, sweep=sweep, max_range=self.range)
+        if len(segments.start) == 0:
+            # nothing within range, the disk (or the sector)
+            _, angles = self._arcs(np.zeros(1), np.full(1, sweep))
+            vertices = self.range * np.stack(
+                [np.cos(segments.angle0 + angles), np.sin(segments.angle0 + angles)], axis=1
+            )
+        else:
+            lo, hi, nearest = segments.sweep(sweep)
+
+            # over each interval: an arc at the limit of the range, the segment in front where within range, an arc
+            seen = nearest >= 0
+            s0 = np.where(seen, np.maximum(lo, segments.visible_from[nearest]), hi)
+            s1 = np.where(seen, np.minimum(hi, segments.visible_to[nearest]), hi)
+            seen &= s0 < s1
+            s0, s1 = np.where(seen, s0, hi), np.where(seen, s1, hi)
+            arcs_interval, arcs_angles = self._arcs(np.concatenate([lo, s1]), np.concatenate([s0, hi]))
+            arcs_piece = np.where(arcs_interval < len(lo), 0, 2)
+            arcs_interval = np.mod(arcs_interval, len(lo))
+            seen_idx = np.flatnonzero(seen)
+            segments_points = segments.points(
+                np.repeat(nearest[seen_idx], 2), np.stack([s0, s1], axis=1)[seen_idx].ravel()
+            )
+            arcs_points = self.range * np.stack(
+                [np.cos(segments.angle0 + arcs_angles), np.sin(segments.angle0 + arcs_angles)], axis=1
+            )
+            points = np.concatenate([arcs_points, segments_points])
+            interval = np.concatenate([arcs_interval, np.repeat(seen_idx, 2)])
+            piece = np.concatenate([arcs_piece, np.ones(2 * len(seen_idx), dtype=int)])
+            order = np.lexsort((np.arange(len(points)), piece, interval))
+            vertices = points[order]
+        if not omnidirectional:
+            vertices = np.concatenate([np.zeros((1, 2)), vertices])
+        # consecutive duplicates (e.g. where two intervals meet on the same segment)
+        keep = np.concatenate([[True], np.any(np.abs(np.diff(vertices, axis=0)) > 1e-12, axis=1)])
+        vertices = origin + vertices[keep]
+        return Polygon(np.concatenate([vertices, vertices[:1]]))
 
-        for angle in ray_angles:
-            ray_end = [self.pose.p[0] + self.range * np.cos(angle), self.pose.p[1] + self.range * np.sin(angle)]
-            ray_hits = cc.raytrace(self.pose.p[0], self.pose.p[1], ray_end[0], ray_end[1], False)
-
-            if not ray_hits:
-                vertices.append(ray_end)
-            else:
-                closest_hit = ray_end
-                closest_hit_distance = self.range**2
-                for ray_hit in ray_hits:
-                    hit_in = ray_hit[0:2]
-                    hit_out = ray_hit[2:]
-                    distance_to_hit_in = (hit_in[0] - self.pose.p[0]) ** 2 + (hit_in[1] - self.pose.p[1]) ** 2
-                    distance_to_hit_out = (hit_out[0] - self.pose.p[0]) ** 2 + (hit_out[1] - self.pose.p[1]) ** 2
-                    if distance_to_hit_in < closest_hit_distance:
-                        closest_hit_distance = distance_to_hit_in
-                        closest_hit = hit_in
-                    if distance_to_hit_out < closest_hit_distance:
-                        closest_hit_distance = distance_to_hit_out
-                        closest_hit = hit_out
-                vertices.append(closest_hit)
-
-        vertices.append(vertices[0])
-        return Polygon(vertices)
+    def _arcs(self, lo: np.ndarray, hi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Angles of the points of the arcs from lo to hi, spaced by at most `angle_resolution`,
+        with the index of the arc of each point"""
+        n = np.where(hi > lo, np.ceil((hi - lo) / self.angle_resolution).astype(int) + 1, 0)
+        arc = np.repeat(np.arange(len(lo)), n)
+        step = np.arange(len(arc)) - np.repeat(np.cumsum(n) - n, n)
+        angles = lo[arc] + (hi - lo)[arc] * step / np.maximum(n[arc] - 1, 1)
+        return arc, angles
@@ -1,2 +1,3 @@
 from .seq_op import *
 from .sequence import *
+from .columnar import *
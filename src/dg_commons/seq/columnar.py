@@ -0,0 +1,164 @@
+from decimal import Decimal as D
+from typing import Generic, Iterator, Optional, Sequence, Type, TypeVar, Union
+
+import numpy as np
+from zuper_commons.types import ZValueError
+
+from dg_commons import DgCommonsConstants
+from dg_commons.seq.sequence import DgSampledSequence, Timestamp, UndefinedAtTime
+
+__all__ = ["DgColumnarSequence"]
+
+X = TypeVar("X")
+
+
+class DgColumnarSequence(Generic[X]):
+    """
+    A sampled time sequence of numeric values stored by columns, i.e. a float64 array of timestamps and a 2-D array
+    of values (one row per sample). It is the memory efficient and vectorized counterpart of `DgSampledSequence`
+    for values that provide `as_ndarray` and `from_array` (e.g. the states of the simulation models), or plain numbers.
+    Timestamps are floats, slicing and sub-sequences are views on the same arrays (no copies).
+    """
+
+    def __init__(self, timestamps: Sequence[Timestamp], values: np.ndarray, XT: Type[X] = float):
+        """
+        :param timestamps: strictly increasing timestamps
+        :param values: array of shape (n_samples, n_columns), or (n_samples,) for a sequence of numbers
+        :param XT: the type of the values, used to convert the rows back to objects
+        """
+        timestamps = np.asarray(timestamps, dtype=float)
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        if timestamps.ndim != 1 or values.ndim != 2 or len(timestamps) != len(values):
+            raise ZValueError("Length mismatch of Timestamps and values", timestamps=timestamps, values=values)
+        if DgCommonsConstants.checks and np.any(np.diff(timestamps) <= 0):
+            raise ZValueError("Timestamps are not strictly increasing", timestamps=timestamps)
+        self._timestamps: np.ndarray = timestamps
+        self._values: np.ndarray = values
+        self.XT: Type[X] = XT
+
+    @classmethod
+    def from_sequence(cls, sequence: DgSampledSequence[X], XT: Optional[Type[X]] = None) -> "DgColumnarSequence[X]":
+        """Builds the columnar version of a sequence, the values are converted via `as_ndarray`"""
+        if XT is None:
+            XT = type(sequence.values[0]) if len(sequence) else float
+        timestamps = np.fromiter((float(t) for t in sequence.timestamps), dtype=float, count=len(sequence))
+        if _is_number(XT):
+            values = np.asarray(sequence.values, dtype=float)
+        else:
+            values = np.array([v.as_ndarray() for v in sequence.values], dtype=float)
+        return cls(timestamps, values.reshape(len(sequence), -1), XT)
+
+    def to_sequence(self, decimal_timestamps: bool = True) -> DgSampledSequence[X]:
+        """Converts back to the object API, by default the timestamps are converted to Decimal
+        (their shortest representation, e.g. `0.1` rather than the binary expansion of the float)"""
+        if decimal_timestamps:
+            timestamps = [D(repr(t)) for t in self._timestamps.tolist()]
+        else:
+            timestamps = self._timestamps.tolist()
+        return DgSampledSequence[self.XT](timestamps=timestamps, values=[self.as_value(v) for v in self._values])
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """The timestamps as a read-only float array"""
+        return _read_only(self._timestamps)
+
+    @property
+    def values(self) -> np.ndarray:
+        """The values as a read-only array of shape (n_samples, n_columns)"""
+        return _read_only(self._values)
+
+    def column(self, name: Union[str, int]) -> np.ndarray:
+        """A column of the values (view), by index or by name if the values type has an `idx` mapping"""
+        if isinstance(name, str):
+            name = self.XT.idx[name]
+        return _read_only(self._values[:, name])
+
+    def as_value(self, row: np.ndarray) -> X:
+        """Converts a row of the values (e.g. of `at_interp_array`) to an object of type XT"""
+        if _is_number(self.XT):
+            return self.XT(row[0])
+        return self.XT.from_array(row.copy())
+
+    def _index_at(self, t: Timestamp) -> int:
+        i = int(np.searchsorted(self._timestamps, float(t)))
+        if i == len(self._timestamps) or self._timestamps[i] != float(t):
+            raise UndefinedAtTime(f"Could not find Timestamp: {t}")
+        return i
+
+    def at(self, t: Timestamp) -> X:
+        """Returns value at requested timestamp, raises UndefinedAtTime if not defined at t"""
+        return self.as_value(self._values[self._index_at(t)])
+
+    def at_or_previous(self, t: Timestamp) -> X:
+        """Value at requested timestamp or at previous, raises UndefinedAtTime if there is no previous"""
+        i = int(np.searchsorted(self._timestamps, float(t), side="right"))
+        if i == 0:
+            raise UndefinedAtTime(f"Could not find at_or_previous with Timestamp: {t}")
+        return self.as_value(self._values[i - 1])
+
+    def at_interp(self, t: Timestamp) -> X:
+        """Interpolates between timestamps, holds at the extremes"""
+        return self.as_value(self.at_interp_array([float(t)])[0])
+
+    def at_interp_array(self, ts: Union[Sequence[Timestamp], np.ndarray]) -> np.ndarray:
+        """Vectorized interpolation, holds at the extremes.
+        :param ts: the query times, in any order
+        :return: the interpolated values, array of shape (len(ts), n_columns)
+        """
+        if not len(self._timestamps):
+            raise ZValueError("Empty sequence")
+        ts = np.asarray(ts, dtype=float).reshape(-1)
+        if len(self._timestamps) == 1:
+            return np.repeat(self._values, len(ts), axis=0)
+        i = np.clip(np.searchsorted(self._timestamps, ts, side="right"), 1, len(self._timestamps) - 1)
+        t0, t1 = self._timestamps[i - 1], self._timestamps[i]
+        scale = np.clip((ts - t0) / (t1 - t0), 0, 1)[:, None]
+        return self._values[i - 1] * (1 - scale) + self._values[i] * scale
+
+    def get_start(self) -> float:
+        if not len(self._timestamps):
+            raise ZValueError("Empty sequence")
+        return float(self._timestamps[0])
+
+    def get_end(self) -> float:
+        if not len(self._timestamps):
+            raise ZValueError("Empty sequence")
+        return float(self._timestamps[-1])
+
+    def get_subsequence(self, from_ts: Timestamp, to_ts: Timestamp) -> "DgColumnarSequence[X]":
+        """A view with the values between from_ts and to_ts (extrema included)"""
+        assert from_ts <= to_ts, f"Required t_start <= t_end, got {from_ts},{to_ts}."
+        from_idx = int(np.searchsorted(self._timestamps, float(from_ts), side="left"))
+        to_idx = int(np.searchsorted(self._timestamps, float(to_ts), side="right"))
+        return self[from_idx:to_idx]
+
+    def shift_timestamps(self, dt: Timestamp) -> "DgColumnarSequence[X]":
+        """A new sequence with the timestamps shifted by dt, the values are shared"""
+        return DgColumnarSequence(self._timestamps + float(dt), self._values, self.XT)
+
+    def __getitem__(self, item: slice) -> "DgColumnarSequence[X]":
+        """Slicing by index returns a view"""
+        if not isinstance(item, slice) or (item.step is not None and item.step <= 0):
+            raise ZValueError("Only slicing with positive steps is supported, use `at` to get a value", item=item)
+        seq = DgColumnarSequence.__new__(DgColumnarSequence)
+        seq._timestamps, seq._values, seq.XT = self._timestamps[item], self._values[item], self.XT
+        return seq
+
+    def __iter__(self) -> Iterator[tuple[float, X]]:
+        for t, v in zip(self._timestamps.tolist(), self._values):
+            yield t, self.as_value(v)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+
+def _is_number(XT: type) -> bool:
+    return isinstance(XT, type) and issubclass(XT, (int, float, D, np.number))
+
+
+def _read_only(a: np.ndarray) -> np.ndarray:
+    view = a.view()
+    view.flags.writeable = False
+    return view
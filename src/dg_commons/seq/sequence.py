@@ -3,6 +3,7 @@ from dataclasses import dataclass, InitVar, field
 from decimal import Decimal as D
 from typing import Generic, TypeVar, Callable, Type, Iterator, Union, get_args, Any, Sequence
 
+import numpy as np
 from zuper_commons.types import ZException, ZValueError
 
 __all__ = [
@@ -42,6 +43,8 @@ class DgSampledSequence(Generic[X]):
 
     _timestamps: tuple[Timestamp] = field(default_factory=tuple)
     _values: tuple[X] = field(default_factory=tuple)
+    _float_timestamps = None
+    """Lazily built float mirror of the timestamps for fast bisection (not a dataclass field)"""
 
     def __post_init__(self, timestamps, values):
         if DgCommonsConstants.checks:
@@ -83,28 +86,52 @@ class DgSampledSequence(Generic[X]):
     def values(self, v: Any) -> None:
         raise RuntimeError("Cannot set values of SampledSequence directly")
 
+    def _get_float_timestamps(self) -> list[float]:
+        if self._float_timestamps is None or len(self._float_timestamps) != len(self._timestamps):
+            self._float_timestamps = [float(t) for t in self._timestamps]
+        return self._float_timestamps
+
+    def _refine_index(self, i: int, t: Timestamp, right: bool) -> int:
+        """Fixes an insertion index found on the float mirror with exact comparisons,
+        the float conversion of Decimal timestamps might be off by one ulp"""
+        if right:
+            while i > 0 and self._timestamps[i - 1] > t:
+                i -= 1
+            while i < len(self._timestamps) and self._timestamps[i] <= t:
+                i += 1
+        else:
+            while i > 0 and self._timestamps[i - 1] >= t:
+                i -= 1
+            while i < len(self._timestamps) and self._timestamps[i] < t:
+                i += 1
+        return i
+
+    def _bisect_left(self, t: Timestamp) -> int:
+        """Same as `bisect_left(self._timestamps, t)` but bisecting the float mirror"""
+        return self._refine_index(bisect_left(self._get_float_timestamps(), float(t)), t, right=False)
+
+    def _bisect_right(self, t: Timestamp) -> int:
+        """Same as `bisect_right(self._timestamps, t)` but bisecting the float mirror"""
+        return self._refine_index(bisect_right(self._get_float_timestamps(), float(t)), t, right=True)
+
     def at(self, t: Timestamp) -> X:
         """Returns value at requested timestamp, raises UndefinedAtTime if not defined at t"""
-        try:
-            i = self._timestamps.index(t)
-            return self._values[i]
-        except ValueError:
+        i = self._bisect_left(t)
+        if i == len(self._timestamps) or self._timestamps[i] != t:
             msg = f"Could not find Timestamp: {t} in: {self._timestamps}"
             raise UndefinedAtTime(msg)
+        return self._values[i]
 
     def at_or_previous(self, t: Timestamp) -> X:
         """
         @:return: Value at requested timestamp or at previous.
         @:raise UndefinedAtTime if there is no previous
         """
-        if t < self.get_start():
+        i = self._bisect_right(t)
+        if i == 0:
             msg = f"Could not find at_or_previous with Timestamp: {t} in: {self._timestamps}"
             raise UndefinedAtTime(msg)
-        try:
-            return self.at(t)
-        except UndefinedAtTime:
-            i = bisect_right(self._timestamps, t)
-            return self._values[i - 1]
+        return self._values[i - 1]
 
     def at_interp(self, t: Timestamp) -> X:
         """Interpolates between timestamps, holds at the extremes
@@ -115,10 +142,43 @@ class DgSampledSequence(Generic[X]):
         elif t >= self.get_end():
             return self._values[-1]
         else:
-            i = bisect_right(self._timestamps, t)
+            i = self._bisect_right(t)
             scale = (float(t) - float(self._timestamps[i - 1])) / (float(self._timestamps[i] - self._timestamps[i - 1]))
             return self._values[i - 1] * (1 - scale) + self._values[i] * scale
 
+    def _search_many(self, ts: Sequence[Timestamp], right: bool) -> list[int]:
+        """Vectorized `_bisect_left`/`_bisect_right` for a batch of queries"""
+        float_ts = np.asarray(self._get_float_timestamps())
+        idx = np.searchsorted(float_ts, np.array([float(t) for t in ts]), side="right" if right else "left")
+        return [self._refine_index(i, t, right) for i, t in zip(idx.tolist(), ts)]
+
+    def at_many(self, ts: Sequence[Timestamp]) -> list[X]:
+        """Vectorized `at`, raises UndefinedAtTime if the sequence is not defined at any of the timestamps"""
+        idx = self._search_many(ts, right=False)
+        values = []
+        for i, t in zip(idx, ts):
+            if i == len(self._timestamps) or self._timestamps[i] != t:
+                msg = f"Could not find Timestamp: {t} in: {self._timestamps}"
+                raise UndefinedAtTime(msg)
+            values.append(self._values[i])
+        return values
+
+    def at_interp_many(self, ts: Sequence[Timestamp]) -> list[X]:
+        """Vectorized `at_interp`, holds at the extremes"""
+        start = self.get_start()
+        idx = self._search_many(ts, right=True)
+        float_ts = self._get_float_timestamps()
+        values = []
+        for i, t in zip(idx, ts):
+            if i == 0 or t <= start:
+                values.append(self._values[0])
+            elif i == len(self._timestamps):
+                values.append(self._values[-1])
+            else:
+                scale = (float(t) - float_ts[i - 1]) / float(self._timestamps[i] - self._timestamps[i - 1])
+                values.append(self._values[i - 1] * (1 - scale) + self._values[i] * scale)
+        return values
+
     def get_start(self) -> Timestamp:
         """
         @:return: The timestamp for start
@@ -159,8 +219,8 @@ class DgSampledSequence(Generic[X]):
         :return: A new sequence with the values between t_start and t_end (extrema included)
         """
         assert from_ts <= to_ts, f"Required t_start <= t_end, got {from_ts},{to_ts}."
-        from_idx = bisect_left(self._timestamps, from_ts)
-        to_idx = bisect_right(self._timestamps, to_ts)
+        from_idx = self._bisect_left(from_ts)
+        to_idx = self._bisect_right(to_ts)
         return DgSampledSequence[X](timestamps=self._timestamps[from_idx:to_idx], values=self._values[from_idx:to_idx])
 
     def shift_timestamps(self, dt: Timestamp) -> "DgSampledSequence[X]":
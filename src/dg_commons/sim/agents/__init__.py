@@ -1 +1,2 @@
 from .agent import *
+from .executors import *
@@ -0,0 +1,192 @@
+import multiprocessing
+import traceback
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from time import perf_counter
+from typing import Any, Mapping, Optional
+
+from zuper_commons.types import ZValueError
+
+from dg_commons import PlayerName, U
+from dg_commons.sim.agents.agent import Agent
+from dg_commons.sim.sim_types import AgentsExecution, SEQUENTIAL, THREAD_POOL, PROCESS_POOL
+from dg_commons.sim.simulator_structures import SimObservations, InitSimObservations
+
+__all__ = [
+    "AgentOutput",
+    "AgentsExecutor",
+    "SequentialAgentsExecutor",
+    "ThreadPoolAgentsExecutor",
+    "ProcessPoolAgentsExecutor",
+    "get_agents_executor",
+]
+
+
+@dataclass(frozen=True)
+class AgentOutput:
+    commands: U
+    """The commands returned by the agent"""
+    extra: Optional[Any]
+    """The output of `on_get_extra`"""
+    elapsed: float
+    """The time spent in `get_commands` [s] (perf_counter)"""
+
+
+def _evaluate_agent(agent: Agent, sim_obs: SimObservations) -> AgentOutput:
+    tic = perf_counter()
+    cmds = agent.get_commands(sim_obs)
+    toc = perf_counter()
+    return AgentOutput(commands=cmds, extra=agent.on_get_extra(), elapsed=toc - tic)
+
+
+class AgentsExecutor(ABC):
+    """Evaluates the agents of a simulation, the results are always returned in the order of the observations."""
+
+    @abstractmethod
+    def on_episode_init(self, players: Mapping[PlayerName, Agent], init_obs: Mapping[PlayerName, InitSimObservations]):
+        pass
+
+    @abstractmethod
+    def get_commands(
+        self, players: Mapping[PlayerName, Agent], observations: Mapping[PlayerName, SimObservations]
+    ) -> dict[PlayerName, AgentOutput]:
+        pass
+
+    def close(self):
+        """Releases the workers, if any"""
+        pass
+
+    def __enter__(self) -> "AgentsExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SequentialAgentsExecutor(AgentsExecutor):
+    """One agent after the other, this is the default behaviour of the simulator"""
+
+    def on_episode_init(self, players: Mapping[PlayerName, Agent], init_obs: Mapping[PlayerName, InitSimObservations]):
+        for player_name, agent in players.items():
+            agent.on_episode_init(init_obs[player_name])
+
+    def get_commands(
+        self, players: Mapping[PlayerName, Agent], observations: Mapping[PlayerName, SimObservations]
+    ) -> dict[PlayerName, AgentOutput]:
+        return {p: _evaluate_agent(players[p], obs) for p, obs in observations.items()}
+
+
+class ThreadPoolAgentsExecutor(SequentialAgentsExecutor):
+    """The agents are evaluated concurrently on a pool of threads.
+    This pays off only if the agents release the GIL, e.g. calling numerical solvers, and do not share state."""
+
+    def __init__(self, n_workers: Optional[int] = None):
+        self._pool = ThreadPoolExecutor(max_workers=n_workers)
+
+    def get_commands(
+        self, players: Mapping[PlayerName, Agent], observations: Mapping[PlayerName, SimObservations]
+    ) -> dict[PlayerName, AgentOutput]:
+        futures = {p: self._pool.submit(_evaluate_agent, players[p], obs) for p, obs in observations.items()}
+        return {p: f.result() for p, f in futures.items()}
+
+    def close(self):
+        self._pool.shutdown()
+
+
+def _agents_worker(conn: Connection):
+    """The loop of a worker process, it owns a subset of the agents for the whole episode"""
+    agents: dict[PlayerName, Agent] = {}
+    while True:
+        msg, payload = conn.recv()
+        if msg == "close":
+            conn.close()
+            return
+        try:
+            if msg == "init":
+                agents = {}
+                for player_name, (agent, init_obs) in payload.items():
+                    agent.on_episode_init(init_obs)
+                    agents[player_name] = agent
+                result = None
+            else:
+                result = {p: _evaluate_agent(agents[p], obs) for p, obs in payload.items()}
+        except Exception:
+            conn.send(("error", traceback.format_exc()))
+        else:
+            conn.send(("ok", result))
+
+
+class ProcessPoolAgentsExecutor(AgentsExecutor):
+    """
+    The agents are evaluated concurrently on persistent worker processes.
+    At the beginning of the episode each agent is sent (pickled) to a worker where it lives until the end,
+    the agents in the simulation context are therefore not updated.
+    The assignment of the agents to the workers is deterministic (round-robin in the order of the players).
+    """
+
+    def __init__(self, n_workers: Optional[int] = None):
+        self.n_workers = n_workers or multiprocessing.cpu_count()
+        self._workers: list[tuple[multiprocessing.Process, Connection]] = []
+        self._assignment: dict[PlayerName, int] = {}
+
+    def on_episode_init(self, players: Mapping[PlayerName, Agent], init_obs: Mapping[PlayerName, InitSimObservations]):
+        self.close()
+        n_workers = max(1, min(self.n_workers, len(players)))
+        for _ in range(n_workers):
+            conn, worker_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_agents_worker, args=(worker_conn,), daemon=True)
+            process.start()
+            self._workers.append((process, conn))
+        self._assignment = {p: i % n_workers for i, p in enumerate(players)}
+        payloads = [{} for _ in range(n_workers)]
+        for p, agent in players.items():
+            payloads[self._assignment[p]][p] = (agent, init_obs[p])
+        self._exchange("init", payloads)
+
+    def get_commands(
+        self, players: Mapping[PlayerName, Agent], observations: Mapping[PlayerName, SimObservations]
+    ) -> dict[PlayerName, AgentOutput]:
+        payloads = [{} for _ in self._workers]
+        for p, obs in observations.items():
+            payloads[self._assignment[p]][p] = obs
+        results: dict[PlayerName, AgentOutput] = {}
+        for worker_results in self._exchange("commands", payloads):
+            results.update(worker_results)
+        return {p: results[p] for p in observations}
+
+    def _exchange(self, msg: str, payloads: list[dict]) -> list:
+        """Sends the payloads to the workers and collects the answers in order"""
+        for (_, conn), payload in zip(self._workers, payloads):
+            conn.send((msg, payload))
+        answers = []
+        for _, conn in self._workers:
+            status, answer = conn.recv()
+            if status == "error":
+                raise RuntimeError(f"An agent failed in a worker process:\n{answer}")
+            answers.append(answer)
+        return answers
+
+    def close(self):
+        for process, conn in self._workers:
+            try:
+                conn.send(("close", None))
+                conn.close()
+            except (BrokenPipeError, OSError):
+                pass
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._workers = []
+
+
+def get_agents_executor(execution: AgentsExecution, n_workers: Optional[int] = None) -> AgentsExecutor:
+    if execution == SEQUENTIAL:
+        return SequentialAgentsExecutor()
+    elif execution == THREAD_POOL:
+        return ThreadPoolAgentsExecutor(n_workers)
+    elif execution == PROCESS_POOL:
+        return ProcessPoolAgentsExecutor(n_workers)
+    else:
+        raise ZValueError("Unknown agents execution", execution=execution)
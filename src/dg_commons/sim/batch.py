@@ -0,0 +1,144 @@
+import os
+import pickle
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional
+
+from tqdm import tqdm
+
+from dg_commons.sim import CollisionReport, SimTime, logger
+from dg_commons.sim.simulator import SimContext, Simulator
+
+__all__ = ["SimContextFactory", "SimMetrics", "SimOutcome", "run_batch", "load_batch_outcomes"]
+
+SimContextFactory = Callable[..., SimContext]
+"""Creates the simulation context for a given seed, it gets called as `factory(seed=seed)`.
+It needs to be picklable to be sent to the workers,
+e.g. `functools.partial(get_scenario_commonroad_replica, scenario_name)`."""
+SimMetrics = Callable[[SimContext], Mapping[str, Any]]
+"""Computes the metrics of interest from a simulation context after the simulation.
+It runs in the worker, so only its (compact) output gets sent back."""
+
+
+@dataclass(frozen=True)
+class SimOutcome:
+    """The compact result of one simulation of a batch"""
+
+    seed: int
+    """The seed passed to the factory"""
+    collision_reports: list[CollisionReport] = field(default_factory=list)
+    """The collision reports of the simulation"""
+    first_collision_ts: SimTime = SimTime("Infinity")
+    """The time of the first collision"""
+    last_time: Optional[SimTime] = None
+    """The simulation time at termination"""
+    metrics: Mapping[str, Any] = field(default_factory=dict)
+    """The output of the metrics function, if any"""
+    elapsed: float = 0
+    """Wall time spent for creating and running the simulation [s]"""
+    error: Optional[str] = None
+    """The traceback if the simulation failed, None otherwise"""
+
+
+def _run_one(factory: SimContextFactory, seed: int, metrics: Optional[SimMetrics]) -> SimOutcome:
+    tic = perf_counter()
+    try:
+        sim_context = factory(seed=seed)
+        Simulator().run(sim_context)
+        return SimOutcome(
+            seed=seed,
+            collision_reports=sim_context.collision_reports,
+            first_collision_ts=sim_context.first_collision_ts,
+            last_time=sim_context.time,
+            metrics=dict(metrics(sim_context)) if metrics is not None else {},
+            elapsed=perf_counter() - tic,
+        )
+    except Exception:
+        return SimOutcome(seed=seed, elapsed=perf_counter() - tic, error=traceback.format_exc())
+
+
+def load_batch_outcomes(outcomes_file: str) -> list[SimOutcome]:
+    """
+    Loads the outcomes stored by `run_batch`, a truncated last record (e.g. an interrupted run) is ignored.
+    If a seed was simulated more than once (failed seeds are retried when resuming), its last outcome is kept.
+    """
+    outcomes, _ = _load_outcomes(outcomes_file)
+    return list({o.seed: o for o in outcomes}.values())
+
+
+def _load_outcomes(outcomes_file: str) -> tuple[list[SimOutcome], int]:
+    """The stored outcomes and the position in the file right after the last complete record"""
+    outcomes: list[SimOutcome] = []
+    end = 0
+    if not os.path.exists(outcomes_file):
+        return outcomes, end
+    with open(outcomes_file, "rb") as f:
+        while True:
+            try:
+                outcomes.append(pickle.load(f))
+            except EOFError:
+                break
+            except Exception:
+                logger.warn(f"Ignoring a corrupted record at the end of {outcomes_file}")
+                break
+            end = f.tell()
+    return outcomes, end
+
+
+def run_batch(
+    factory: SimContextFactory,
+    seeds: Iterable[int],
+    metrics: Optional[SimMetrics] = None,
+    n_workers: Optional[int] = None,
+    outcomes_file: Optional[str] = None,
+    progress: bool = True,
+) -> Iterator[SimOutcome]:
+    """
+    Runs a simulation for each seed on a pool of processes, each with its own simulator.
+    The outcomes are yielded as soon as they are available (i.e. not in the order of the seeds).
+    :param factory: creates the simulation context for a seed, see `SimContextFactory`
+    :param seeds: the seeds to simulate
+    :param metrics: optional function computing the metrics of interest after each simulation
+    :param n_workers: number of processes, defaults to the number of CPUs. With 0 the simulations run in this process
+    :param outcomes_file: if given, the outcomes are appended to this file as they come.
+        The seeds already simulated successfully are skipped (the failed ones are retried), this allows to resume
+        an interrupted batch. A truncated record left by the interruption is dropped from the file.
+    :param progress: whether to show a progress bar
+    :return: an iterator over the outcomes of the new simulations
+    """
+    seeds = list(dict.fromkeys(seeds))
+    if outcomes_file is not None:
+        stored, end = _load_outcomes(outcomes_file)
+        if os.path.exists(outcomes_file) and os.path.getsize(outcomes_file) > end:
+            # the next records are appended after the last complete one
+            os.truncate(outcomes_file, end)
+        done = {o.seed for o in stored if o.error is None}
+        if done:
+            logger.info(f"Resuming batch, skipping {len(done & set(seeds))} already simulated seeds")
+        seeds = [s for s in seeds if s not in done]
+        os.makedirs(os.path.dirname(os.path.abspath(outcomes_file)), exist_ok=True)
+
+    def _store(outcome: SimOutcome):
+        if outcome.error is not None:
+            logger.warn(f"Simulation with seed {outcome.seed} failed:\n{outcome.error}")
+        if outcomes_file is not None:
+            with open(outcomes_file, "ab") as f:
+                pickle.dump(outcome, f)
+
+    with tqdm(total=len(seeds), unit="sim", disable=not progress) as pbar:
+        if n_workers == 0:
+            for seed in seeds:
+                outcome = _run_one(factory, seed, metrics)
+                _store(outcome)
+                pbar.update()
+                yield outcome
+            return
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(_run_one, factory, seed, metrics) for seed in seeds]
+            for future in as_completed(futures):
+                outcome = future.result()
+                _store(outcome)
+                pbar.update()
+                yield outcome
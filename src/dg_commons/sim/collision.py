@@ -37,9 +37,12 @@ def impact_locations_from_polygons(a_model: SimModel, b_shape: BaseGeometry) ->
     return locations
 
 
-def resolve_collision(a: PlayerName, b: PlayerName, sim_context: SimContext) -> Optional[CollisionReport]:
+def resolve_collision(
+    a: PlayerName, b: PlayerName, sim_context: SimContext, at_time: Optional[SimTime] = None
+) -> Optional[CollisionReport]:
     """
     Resolves the collision between A and B using the impulse method.
+    The time of the report is at_time if given (e.g. the time of impact in between two steps), else the current time.
     Sources:
         - http://www.chrishecker.com/images/e/e7/Gdmphys3.pdf
         - https://research.ncl.ac.uk/game/mastersdegree/gametechnologies/previousinformation/physics6collisionresponse/
@@ -79,6 +82,7 @@ def resolve_collision(a: PlayerName, b: PlayerName, sim_context: SimContext) ->
             {a: a_model.get_pose(), b: b_model.get_pose()},
             impact_point=impact_point,
             lanelet_network=sim_context.dg_scenario.scenario.lanelet_network,
+            lanelet_index=sim_context.dg_scenario.lanelet_index,
         )
         a_fault, b_fault = who_is_at_fault[a], who_is_at_fault[b]
     else:
@@ -122,7 +126,7 @@ def resolve_collision(a: PlayerName, b: PlayerName, sim_context: SimContext) ->
         players={a: a_report, b: b_report},
         impact_point=impact_point,
         impact_normal=impact_normal,
-        at_time=sim_context.time,
+        at_time=sim_context.time if at_time is None else at_time,
     )
 
 
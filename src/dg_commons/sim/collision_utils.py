@@ -1,20 +1,40 @@
 import logging
 import time
 from math import pi
-from typing import Mapping
+from typing import Mapping, Optional
 
 import numpy as np
 from commonroad.scenario.lanelet import LaneletNetwork
 from geometry import T2value, SO2value, SO2_from_angle, SE2value
 from shapely import GeometryCollection, MultiPoint, MultiLineString
+from shapely.affinity import translate
 from shapely.geometry import Polygon, Point, LineString, MultiPolygon
 from shapely.geometry.base import BaseGeometry
 from toolz import remove
 
 from dg_commons import X, PlayerName, logger
-from dg_commons.maps.lanes import DgLanelet, DgLanePose
+from dg_commons.maps.lanelet_index import LaneletIndex
+from dg_commons.maps.lanes import DgLanePose
 from dg_commons.sim.models.model_structures import ModelGeometry
 
+__all__ = [
+    "CollisionException",
+    "velocity_of_P_given_A",
+    "convex_vertices",
+    "edge_normals",
+    "projection_intervals",
+    "time_of_impact_batch",
+    "time_of_impact",
+    "first_contact_along_translation",
+    "get_impact_point_direction",
+    "compute_impact_geometry",
+    "compute_impulse_response",
+    "velocity_after_collision",
+    "rot_velocity_after_collision",
+    "kinetic_energy",
+    "check_who_is_at_fault",
+]
+
 
 class CollisionException(Exception):
     pass
@@ -29,6 +49,111 @@ def velocity_of_P_given_A(vel: T2value, omega: float, vec_ap: T2value) -> T2valu
     return vel + omega * (_rot90 @ vec_ap)
 
 
+def convex_vertices(shape: BaseGeometry) -> np.ndarray:
+    """The vertices (not closed) of the convex hull of a geometry, array of shape (K, 2)"""
+    hull = shape.convex_hull
+    if isinstance(hull, Polygon):
+        return np.array(hull.exterior.coords[:-1], dtype=float)
+    return np.array(hull.coords, dtype=float).reshape(-1, 2)
+
+
+def edge_normals(vertices: np.ndarray) -> np.ndarray:
+    """The (not normalized) normals of the edges of polygons (..., K, 2)"""
+    edges = np.roll(vertices, -1, axis=-2) - vertices
+    return np.stack([-edges[..., 1], edges[..., 0]], axis=-1)
+
+
+def projection_intervals(vertices: np.ndarray, axes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Projection intervals of polygons (..., K, 2) on axes (..., A, 2), returns min and max of shape (..., A)"""
+    proj = np.einsum("...ad,...kd->...ak", axes, vertices)
+    return proj.min(axis=-1), proj.max(axis=-1)
+
+
+def time_of_impact_batch(
+    a_vertices: np.ndarray, b_vertices: np.ndarray, rel_vel: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Continuous collision detection of convex polygons b moving with constant velocity relative to convex polygons a.
+    On each separating axis (the edge normals of both polygons) the projections overlap in an interval of time,
+    the polygons overlap in the intersection of these intervals (separating axis theorem).
+    The leading dimensions of the arguments are broadcast, polygons with fewer vertices can be padded
+    repeating a vertex (zero length edges do not separate).
+    :param a_vertices: vertices of the static polygons, shape (..., K, 2)
+    :param b_vertices: vertices of the moving polygons, shape (..., H, 2)
+    :param rel_vel: velocity of b relative to a, shape (..., 2)
+    :return: time of impact and time of separation, shape (...).
+        The time of impact is 0 if they already overlap and inf if they never touch for t >= 0.
+    """
+    a_vertices, b_vertices, rel_vel = np.asarray(a_vertices), np.asarray(b_vertices), np.asarray(rel_vel)
+    lead = np.broadcast_shapes(a_vertices.shape[:-2], b_vertices.shape[:-2], rel_vel.shape[:-1])
+    a_normals = np.broadcast_to(edge_normals(a_vertices), lead + a_vertices.shape[-2:])
+    b_normals = np.broadcast_to(edge_normals(b_vertices), lead + b_vertices.shape[-2:])
+    axes = np.concatenate([a_normals, b_normals], axis=-2)
+    a_min, a_max = projection_intervals(a_vertices, axes)
+    b_min, b_max = projection_intervals(b_vertices, axes)
+    speed = np.einsum("...ad,...d->...a", axes, rel_vel)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t0, t1 = (a_min - b_max) / speed, (a_max - b_min) / speed
+    moving = speed != 0
+    overlapping = (b_max >= a_min) & (b_min <= a_max)
+    t_in = np.where(moving, np.minimum(t0, t1), np.where(overlapping, -np.inf, np.inf))
+    t_out = np.where(moving, np.maximum(t0, t1), np.where(overlapping, np.inf, -np.inf))
+    t_enter = np.maximum(np.max(t_in, axis=-1), 0)
+    t_exit = np.min(t_out, axis=-1)
+    return np.where(t_enter <= t_exit, t_enter, np.inf), t_exit
+
+
+def time_of_impact(a: BaseGeometry, b: BaseGeometry, rel_vel: T2value, max_time: float = np.inf) -> float:
+    """
+    Exact time at which b, translating with constant velocity rel_vel with respect to a, touches a.
+    Non-convex geometries are replaced by their convex hull.
+    :return: the time of impact, 0 if they already intersect and inf if they do not touch within max_time
+    """
+    toi, _ = time_of_impact_batch(convex_vertices(a), convex_vertices(b), np.asarray(rel_vel, dtype=float))
+    toi = float(toi)
+    return toi if toi <= max_time else np.inf
+
+
+def first_contact_along_translation(
+    shape: BaseGeometry, displacement: T2value, obstacle: BaseGeometry, tol: float = 1e-3
+) -> Optional[float]:
+    """
+    The first fraction s in [0, 1] at which shape translated by s * displacement intersects the obstacle.
+    The obstacle can be any geometry (e.g. non-convex), the translation is sampled finer than the extent of shape
+    along the displacement so that it cannot be jumped over, then the first contact is refined by bisection.
+    :param tol: the returned position penetrates the obstacle by at most tol [m]
+    :return: the fraction, or None if they never intersect
+    """
+    displacement = np.asarray(displacement, dtype=float)
+    length = float(np.linalg.norm(displacement))
+    if shape.intersects(obstacle):
+        return 0.0
+    if length == 0:
+        return None
+    projections = convex_vertices(shape) @ (displacement / length)
+    extent = max(float(np.ptp(projections)), tol)
+    samples = np.linspace(0, 1, int(np.ceil(2 * length / extent)) + 1)
+
+    def _hits(s: float) -> bool:
+        return translate(shape, *(s * displacement)).intersects(obstacle)
+
+    free = 0.0
+    for s in samples[1:]:
+        if _hits(s):
+            hit = float(s)
+            break
+        free = float(s)
+    else:
+        return None
+    while (hit - free) * length > tol:
+        middle = (free + hit) / 2
+        if _hits(middle):
+            hit = middle
+        else:
+            free = middle
+    return hit
+
+
 def _find_intersection_points(a_shape: Polygon, b_shape: BaseGeometry) -> list[tuple[float, float]]:
     """Returns a list of points"""
     int_shape = a_shape.intersection(b_shape)
@@ -172,7 +297,10 @@ def kinetic_energy(velocity: np.ndarray, m: float) -> float:
 
 
 def check_who_is_at_fault(
-    p_poses: Mapping[PlayerName, SE2value], impact_point: Point, lanelet_network: LaneletNetwork
+    p_poses: Mapping[PlayerName, SE2value],
+    impact_point: Point,
+    lanelet_network: LaneletNetwork,
+    lanelet_index: Optional[LaneletIndex] = None,
 ) -> Mapping[PlayerName, bool]:
     """
     This functions checks who is at fault in a collision.
@@ -181,13 +309,13 @@ def check_who_is_at_fault(
     :param p_poses:
     :param impact_point: #fixme this could be made into a np.array, we do not use any shapely stuff atm
     :param lanelet_network:
+    :param lanelet_index: the index of the lanelet network (e.g. `DgScenario.lanelet_index`),
+        by default the one shared by the users of the network (see `LaneletIndex.of`)
     :return:
     """
+    lanelet_index = LaneletIndex.of(lanelet_network) if lanelet_index is None else lanelet_index
     # first_check who is in an illegal state, if you are in an illegal state you are at fault
-    lanesid_at_impact = lanelet_network.find_lanelet_by_position([np.array([impact_point.x, impact_point.y])])[0]
-    dglanes_at_impact = [
-        DgLanelet.from_commonroad_lanelet(lanelet_network.find_lanelet_by_id(id)) for id in lanesid_at_impact
-    ]
+    dglanes_at_impact = lanelet_index.dglanelets_at(np.array([impact_point.x, impact_point.y]))
     who_is_at_fault: dict[PlayerName, bool] = {p: False for p in p_poses}
     for p, p_pose in p_poses.items():
         dglane_poses = [dglane.lane_pose_from_SE2_generic(p_pose) for dglane in dglanes_at_impact]
@@ -0,0 +1,31 @@
+import importlib
+from dataclasses import fields, is_dataclass
+from decimal import Decimal as D
+from typing import Any
+
+__all__ = ["type_path", "type_from_path", "is_numeric"]
+
+
+def type_path(t: type) -> str:
+    """A string identifying the type, to store along the values (see `type_from_path`)"""
+    return f"{t.__module__}:{t.__qualname__}"
+
+
+def type_from_path(path: str) -> type:
+    """The type identified by `type_path`"""
+    module, qualname = path.split(":")
+    obj = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def is_numeric(v: Any) -> bool:
+    """Whether the values of this type can be stored as rows of floats without losing information,
+    i.e. plain numbers or dataclasses whose fields are all covered by their `idx` mapping (e.g. the models' states)"""
+    if isinstance(v, (int, float, D)) and not isinstance(v, bool):
+        return True
+    if not (is_dataclass(v) and hasattr(v, "as_ndarray") and hasattr(type(v), "from_array")):
+        return False
+    idx = getattr(type(v), "idx", {})
+    return all(f.name in idx for f in fields(v))
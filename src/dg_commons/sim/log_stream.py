@@ -0,0 +1,300 @@
+import json
+import os
+import pickle
+from collections.abc import Sequence
+from decimal import Decimal as D
+from typing import Any, Callable, Iterator, Optional, Type
+
+import numpy as np
+from zuper_commons.types import ZValueError
+
+from dg_commons import DgSampledSequence, DgColumnarSequence, PlayerName
+from dg_commons.seq.sequence import Timestamp
+from dg_commons.sim.log_encoding import is_numeric, type_from_path, type_path
+from dg_commons.sim.simulator_structures import PlayerLog, SimLog
+
+__all__ = ["StreamingPlayerLogger", "StreamedSequence", "init_log_stream", "load_log_stream", "LOG_STREAM_VERSION"]
+
+LOG_STREAM_VERSION = 1
+"""Version of the on-disk layout written by `StreamingPlayerLogger`"""
+
+_FIELDS = ("states", "commands", "extra", "info")
+_INDEX = "index.json"
+
+
+class _FieldWriter:
+    """
+    Append-only writer of the records (timestamp, value) of a log field.
+    Numeric values (see `is_numeric`) are appended as rows of float64 (timestamp first),
+    the others are appended as a stream of pickled chunks.
+    At most `buffer_size` records are kept in memory before being appended to disk.
+    """
+
+    def __init__(self, path: str, buffer_size: int):
+        self.path = path
+        for ext in (".json", ".f64", ".pickle"):
+            if os.path.exists(path + ext):
+                os.remove(path + ext)
+        self.buffer_size = buffer_size
+        self._buffer: list[tuple[Timestamp, Any]] = []
+        self._numeric: Optional[bool] = None
+        self._type: Optional[type] = None
+        self._last_t: Optional[Timestamp] = None
+        self._n_records = 0
+
+    def add(self, t: Timestamp, v: Any):
+        if self._last_t is not None and t <= self._last_t:
+            raise ZValueError("Repeated time stamp", t=t, last_t=self._last_t)
+        if self._numeric is None:
+            self._write_meta(t, v)
+            self._type = type(v)
+        elif self._numeric and type(v) != self._type:
+            raise ZValueError("All the values of a numeric log field must have the same type", v=v, type=self._type)
+        self._buffer.append((t, v))
+        self._last_t = t
+        self._n_records += 1
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def _write_meta(self, t: Timestamp, v: Any):
+        self._numeric = is_numeric(v)
+        meta = {"numeric": self._numeric, "decimal_timestamps": isinstance(t, D), "type": type_path(type(v))}
+        if self._numeric:
+            meta["n_columns"] = 1 if isinstance(v, (int, float, D)) else int(np.size(v.as_ndarray()))
+        with open(self.path + ".json", "w") as f:
+            json.dump(meta, f)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        if self._numeric:
+            rows = [
+                np.concatenate([[float(t)], np.atleast_1d(np.asarray(_as_row(v), dtype=float))])
+                for t, v in self._buffer
+            ]
+            with open(self.path + ".f64", "ab") as f:
+                f.write(np.array(rows, dtype=np.float64).tobytes())
+        else:
+            with open(self.path + ".pickle", "ab") as f:
+                pickle.dump(self._buffer, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._buffer = []
+
+    def __len__(self) -> int:
+        return self._n_records
+
+
+def _as_row(v: Any):
+    return float(v) if isinstance(v, (int, float, D)) else v.as_ndarray()
+
+
+class StreamingPlayerLogger:
+    """
+    Drop-in replacement of `PlayerLogger` that streams the log of a player to a directory instead of keeping it
+    in memory. Use `load_log_stream` to read it back.
+    """
+
+    def __init__(self, log_dir: str, player_name: PlayerName, buffer_size: int = 256):
+        self.player_dir = os.path.join(log_dir, _player_dir(log_dir, player_name))
+        os.makedirs(self.player_dir, exist_ok=True)
+        self.states = _FieldWriter(os.path.join(self.player_dir, "states"), buffer_size)
+        self.commands = _FieldWriter(os.path.join(self.player_dir, "commands"), buffer_size)
+        self.extra = _FieldWriter(os.path.join(self.player_dir, "extra"), buffer_size)
+        self.info = _FieldWriter(os.path.join(self.player_dir, "info"), buffer_size)
+
+    def flush(self):
+        for field_name in _FIELDS:
+            getattr(self, field_name).flush()
+
+    def as_sequence(self) -> PlayerLog:
+        """Flushes the buffers and returns the lazy log read from disk"""
+        self.flush()
+        return _load_player_log(self.player_dir)
+
+
+def init_log_stream(log_dir: str):
+    """Starts a new log in the directory, a previous log in the same directory gets overwritten"""
+    os.makedirs(log_dir, exist_ok=True)
+    with open(os.path.join(log_dir, _INDEX), "w") as f:
+        json.dump({"version": LOG_STREAM_VERSION, "players": {}}, f)
+
+
+def _player_dir(log_dir: str, player_name: PlayerName) -> str:
+    """Registers the player in the index of the log directory, player names are not used as paths"""
+    index_path = os.path.join(log_dir, _INDEX)
+    if not os.path.exists(index_path):
+        init_log_stream(log_dir)
+    with open(index_path) as f:
+        index = json.load(f)
+    if player_name not in index["players"]:
+        index["players"][player_name] = f"player{len(index['players'])}"
+        with open(index_path, "w") as f:
+            json.dump(index, f)
+    return index["players"][player_name]
+
+
+class _LazyPickledSequence:
+    """Loads the pickled records of a log field only when accessed, then behaves as a DgSampledSequence"""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._sequence: Optional[DgSampledSequence] = None
+
+    def _load(self) -> DgSampledSequence:
+        if self._sequence is None:
+            records = []
+            if os.path.exists(self._path):
+                with open(self._path, "rb") as f:
+                    while True:
+                        try:
+                            records.extend(pickle.load(f))
+                        except (EOFError, pickle.UnpicklingError):
+                            # a truncated chunk is the sign of an interrupted simulation
+                            break
+            self._sequence = DgSampledSequence[object](
+                timestamps=[t for t, _ in records], values=[v for _, v in records]
+            )
+        return self._sequence
+
+    def __getattr__(self, item):
+        if item.startswith("_"):
+            raise AttributeError(item)
+        return getattr(self._load(), item)
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+class _RowsView(Sequence):
+    """Read-only sequence converting the items of an array one by one, when accessed"""
+
+    def __init__(self, array: np.ndarray, convert: Callable[[Any], Any]):
+        self._array = array
+        self._convert = convert
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return tuple(self._convert(a) for a in self._array[item])
+        return self._convert(self._array[item])
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+
+class StreamedSequence:
+    """
+    The object API of `DgSampledSequence` over the columns of a numeric log field (see `DgColumnarSequence`).
+    `timestamps` and `values` are converted back to `Timestamp` and to the logged type only when accessed,
+    the raw columns are available as `columnar` (e.g. `columnar.values` is the matrix of the values).
+    """
+
+    def __init__(self, columnar: DgColumnarSequence, decimal_timestamps: bool):
+        self.columnar = columnar
+        self.decimal_timestamps = decimal_timestamps
+
+    @property
+    def XT(self) -> Type:
+        return self.columnar.XT
+
+    @property
+    def array(self) -> np.ndarray:
+        """The values as a read-only array of shape (n_samples, n_columns)"""
+        return self.columnar.values
+
+    def _as_timestamp(self, t: float) -> Timestamp:
+        # the shortest representation of the float, e.g. `0.1` rather than its binary expansion
+        return D(repr(float(t))) if self.decimal_timestamps else float(t)
+
+    @property
+    def timestamps(self) -> Sequence[Timestamp]:
+        return _RowsView(self.columnar.timestamps, self._as_timestamp)
+
+    @property
+    def values(self) -> Sequence:
+        return _RowsView(self.columnar.values, self.columnar.as_value)
+
+    def at(self, t: Timestamp):
+        return self.columnar.at(t)
+
+    def at_or_previous(self, t: Timestamp):
+        return self.columnar.at_or_previous(t)
+
+    def at_interp(self, t: Timestamp):
+        return self.columnar.at_interp(t)
+
+    def at_many(self, ts: Sequence[Timestamp]) -> list:
+        return [self.columnar.at(t) for t in ts]
+
+    def at_interp_many(self, ts: Sequence[Timestamp]) -> list:
+        return [self.columnar.as_value(row) for row in self.columnar.at_interp_array([float(t) for t in ts])]
+
+    def get_start(self) -> Timestamp:
+        return self._as_timestamp(self.columnar.get_start())
+
+    def get_end(self) -> Timestamp:
+        return self._as_timestamp(self.columnar.get_end())
+
+    def get_sampling_points(self) -> Sequence[Timestamp]:
+        return self.timestamps
+
+    def get_subsequence(self, from_ts: Timestamp, to_ts: Timestamp) -> "StreamedSequence":
+        return StreamedSequence(self.columnar.get_subsequence(from_ts, to_ts), self.decimal_timestamps)
+
+    def shift_timestamps(self, dt: Timestamp) -> "StreamedSequence":
+        return StreamedSequence(self.columnar.shift_timestamps(dt), self.decimal_timestamps)
+
+    def transform_values(self, f: Callable, YT: type = object) -> DgSampledSequence:
+        return self.to_sequence().transform_values(f, YT)
+
+    def to_sequence(self) -> DgSampledSequence:
+        """Loads the field in memory as a `DgSampledSequence`"""
+        return self.columnar.to_sequence(decimal_timestamps=self.decimal_timestamps)
+
+    def __iter__(self) -> Iterator[tuple[Timestamp, Any]]:
+        for t, v in self.columnar:
+            yield self._as_timestamp(t), v
+
+    def __len__(self) -> int:
+        return len(self.columnar)
+
+
+def _load_field(path: str):
+    if not os.path.exists(path + ".json"):
+        return DgSampledSequence[object](timestamps=[], values=[])
+    with open(path + ".json") as f:
+        meta = json.load(f)
+    if not meta["numeric"]:
+        return _LazyPickledSequence(path + ".pickle")
+    n_columns = meta["n_columns"] + 1
+    XT = type_from_path(meta["type"])
+    if not os.path.exists(path + ".f64") or os.path.getsize(path + ".f64") < 8 * n_columns:
+        columnar = DgColumnarSequence(np.zeros(0), np.zeros((0, n_columns - 1)), XT)
+    else:
+        # a partially written last row (interrupted simulation) is ignored
+        n_rows = os.path.getsize(path + ".f64") // (8 * n_columns)
+        data = np.memmap(path + ".f64", dtype=np.float64, mode="r", shape=(n_rows, n_columns))
+        columnar = DgColumnarSequence(data[:, 0], data[:, 1:], XT)
+    return StreamedSequence(columnar, meta["decimal_timestamps"])
+
+
+def _load_player_log(player_dir: str) -> PlayerLog:
+    fields = {field_name: _load_field(os.path.join(player_dir, field_name)) for field_name in _FIELDS}
+    return PlayerLog(**fields)
+
+
+def load_log_stream(log_dir: str) -> SimLog:
+    """
+    Reads a log written by `StreamingPlayerLogger` without loading it in memory.
+    The numeric fields (e.g. states, commands, info) are `StreamedSequence` memory-mapped on the files,
+    the other ones (e.g. extra) get unpickled at the first access.
+    """
+    with open(os.path.join(log_dir, _INDEX)) as f:
+        index = json.load(f)
+    if index["version"] != LOG_STREAM_VERSION:
+        raise ZValueError("Unsupported log stream version", version=index["version"], supported=LOG_STREAM_VERSION)
+    sim_log = SimLog()
+    for player_name, player_dir in index["players"].items():
+        sim_log[PlayerName(player_name)] = _load_player_log(os.path.join(log_dir, player_dir))
+    return sim_log
@@ -6,13 +6,13 @@ from typing import Type, Mapping
 import numpy as np
 from frozendict import frozendict
 from geometry import SE2value, SE2_from_xytheta, T2value
-from scipy.integrate import solve_ivp
 from shapely.geometry import Polygon
 
 from dg_commons import apply_SE2_to_shapely_geo, PoseState
 from dg_commons.sim import logger, ImpactLocation, IMPACT_RIGHT, IMPACT_LEFT, IMPACT_BACK, IMPACT_FRONT
 from dg_commons.sim.models import ModelType
 from dg_commons.sim.models.diff_drive_structures import *
+from dg_commons.sim.models.integrators import integrate
 from dg_commons.sim.simulator_structures import SimModel
 
 
@@ -144,11 +144,8 @@ class DiffDriveModel(SimModel[DiffDriveState, DiffDriveCommands]):
         state_np = self._state.as_ndarray()
         action_np = commands.as_ndarray()
         y0 = np.concatenate([state_np, action_np])
-        result = solve_ivp(fun=_dynamics, t_span=(0.0, float(dt)), y0=y0)
-
-        if not result.success:
-            raise RuntimeError("Failed to integrate ivp!")
-        new_state, _ = _stateactions_from_array(result.y[:, -1])
+        y1 = integrate(fun=lambda y: _dynamics(0, y), y0=y0, dt=float(dt), method=self.integrator)
+        new_state, _ = _stateactions_from_array(y1)
         self._state = new_state
         return
 
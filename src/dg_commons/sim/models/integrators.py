@@ -0,0 +1,57 @@
+from typing import Callable, NewType
+
+import numpy as np
+from scipy.integrate import solve_ivp
+from zuper_commons.types import ZValueError
+
+__all__ = ["Integrator", "RK45", "RK4", "EULER", "EXACT_KINEMATIC", "integrate"]
+
+Integrator = NewType("Integrator", str)
+RK45 = Integrator("rk45")
+""" Adaptive Runge-Kutta 4(5) via scipy's solve_ivp (default tolerances rtol=1e-3, atol=1e-6) """
+RK4 = Integrator("rk4")
+""" Classic fixed-step Runge-Kutta of order 4 """
+EULER = Integrator("euler")
+""" Fixed-step explicit (forward) Euler """
+EXACT_KINEMATIC = Integrator("exact_kinematic")
+""" Closed-form update of the kinematic bicycle model, models without a closed-form update fall back to RK4 """
+
+
+def integrate(
+    fun: Callable[[np.ndarray], np.ndarray], y0: np.ndarray, dt: float, method: Integrator = RK45, n_steps: int = 1
+) -> np.ndarray:
+    """
+    Integrates the time-invariant dynamics y' = fun(y) over a horizon dt.
+    The state can be an array of any shape, e.g. (n_players, n_states) for batched integration.
+    :param fun: returns the derivative of the state, same shape as the state
+    :param y0: initial state
+    :param dt: integration horizon [s]
+    :param method: the integration scheme
+    :param n_steps: number of sub-steps for the fixed-step schemes
+    :return: the state after dt
+    """
+    y0 = np.asarray(y0, dtype=float)
+    if method == RK45:
+        shape = y0.shape
+        result = solve_ivp(fun=lambda t, y: fun(y.reshape(shape)).ravel(), t_span=(0.0, dt), y0=y0.ravel())
+        if not result.success:
+            raise RuntimeError("Failed to integrate ivp!")
+        return result.y[:, -1].reshape(shape)
+    elif method == EULER:
+        h = dt / n_steps
+        y = y0
+        for _ in range(n_steps):
+            y = y + h * fun(y)
+        return y
+    elif method in (RK4, EXACT_KINEMATIC):
+        h = dt / n_steps
+        y = y0
+        for _ in range(n_steps):
+            k1 = fun(y)
+            k2 = fun(y + 0.5 * h * k1)
+            k3 = fun(y + 0.5 * h * k2)
+            k4 = fun(y + h * k3)
+            y = y + h / 6.0 * (k1 + 2 * k2 + 2 * k3 + k4)
+        return y
+    else:
+        raise ZValueError("Unknown integrator", method=method)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from dg_commons.sim import logger
 from dg_commons.sim.models.model_structures import ModelParameters
 from dg_commons.sim.models.spacecraft_structures import SpacecraftParameters
@@ -35,6 +37,15 @@ def apply_full_acceleration_limits(speed: float, acceleration: float, p: ModelPa
     return acc
 
 
+def apply_full_acceleration_limits_batch(
+    speed: np.ndarray, acceleration: np.ndarray, vx_limits: np.ndarray, acc_limits: np.ndarray
+) -> np.ndarray:
+    """Vectorized version of `apply_full_acceleration_limits`, limits are stacked as arrays of shape (n, 2)"""
+    acc = np.clip(acceleration, acc_limits[:, 0], acc_limits[:, 1])
+    at_limit = ((speed <= vx_limits[:, 0]) & (acc < 0)) | ((speed >= vx_limits[:, 1]) & (acc > 0))
+    return np.where(at_limit, 0.0, acc)
+
+
 # todo make it more generic also for the other models
 def apply_rot_speed_constraint(omega: float, domega: float, p: SpacecraftParameters):
     """Enforces rot acceleration limits if the maximum speed is reached"""
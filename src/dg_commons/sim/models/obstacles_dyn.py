@@ -5,12 +5,12 @@ from typing import Mapping, Type
 import numpy as np
 from frozendict import frozendict
 from geometry import T2value, SE2value, SO2_from_angle, SO2value, SE2_from_xytheta
-from scipy.integrate import solve_ivp
 from shapely.geometry import Polygon
 
 from dg_commons import U, apply_SE2_to_shapely_geo
 from dg_commons.sim.collision_structures import IMPACT_EVERYWHERE
 from dg_commons.sim.models import ModelType, DYNAMIC_OBSTACLE, ModelParameters
+from dg_commons.sim.models.integrators import integrate
 from dg_commons.sim.models.model_utils import apply_full_acceleration_limits, apply_rot_speed_constraint
 from dg_commons.sim.models.obstacles import ObstacleGeometry, DynObstacleParameters
 from dg_commons.sim.sim_types import ImpactLocation, SimTime
@@ -178,11 +178,8 @@ class DynObstacleModel(SimModel[DynObstacleState, DynObstacleCommands]):
         state_np = self._state.as_ndarray()
         action_np = commands.as_ndarray()
         y0 = np.concatenate([state_np, action_np])
-        result = solve_ivp(fun=_dynamics, t_span=(0.0, float(dt)), y0=y0)
-
-        if not result.success:
-            raise RuntimeError("Failed to integrate ivp!")
-        new_state, _ = _stateactions_from_array(result.y[:, -1])
+        y1 = integrate(fun=lambda y: _dynamics(0, y), y0=y0, dt=float(dt), method=self.integrator)
+        new_state, _ = _stateactions_from_array(y1)
         self._state = new_state
         return
 
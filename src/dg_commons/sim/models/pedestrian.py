@@ -6,7 +6,6 @@ from typing import Type, Sequence, Mapping
 import numpy as np
 from frozendict import frozendict
 from geometry import SE2value, T2value, SE2_from_xytheta, SO2_from_angle, SO2value
-from scipy.integrate import solve_ivp
 from shapely import affinity
 from shapely.affinity import affine_transform
 from shapely.geometry import Point, Polygon
@@ -14,6 +13,7 @@ from shapely.geometry import Point, Polygon
 from dg_commons import PoseState, apply_SE2_to_shapely_geo
 from dg_commons.sim import SimModel, SimTime, ImpactLocation, IMPACT_EVERYWHERE
 from dg_commons.sim.models import ModelParameters
+from dg_commons.sim.models.integrators import integrate
 from dg_commons.sim.models.model_structures import ModelGeometry, PEDESTRIAN, ModelType
 from dg_commons.sim.models.model_utils import apply_full_acceleration_limits
 from dg_commons.sim.models.pedestrian_utils import PedestrianParameters, rotation_constraint
@@ -195,11 +195,8 @@ class PedestrianModel(SimModel[SE2value, float]):
         state_np = self._state.as_ndarray()
         action_np = commands.as_ndarray()
         y0 = np.concatenate([state_np, action_np])
-        result = solve_ivp(fun=_dynamics, t_span=(0.0, float(dt)), y0=y0)
-
-        if not result.success:
-            raise RuntimeError("Failed to integrate ivp!")
-        new_state, _ = _stateactions_from_array(result.y[:, -1])
+        y1 = integrate(fun=lambda y: _dynamics(0, y), y0=y0, dt=float(dt), method=self.integrator)
+        new_state, _ = _stateactions_from_array(y1)
         self._state = new_state
         return
 
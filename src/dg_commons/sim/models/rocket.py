@@ -8,12 +8,12 @@ from dg_commons import logger
 import numpy as np
 from frozendict import frozendict
 from geometry import SE2value, SE2_from_xytheta, SO2_from_angle, SO2value, T2value
-from scipy.integrate import solve_ivp
 from shapely.geometry import Polygon
 
 from dg_commons import apply_SE2_to_shapely_geo
 from dg_commons.sim import ImpactLocation, IMPACT_EVERYWHERE
 from dg_commons.sim.models import ModelType, ModelParameters
+from dg_commons.sim.models.integrators import integrate
 from dg_commons.sim.models.model_utils import apply_force_limits, apply_full_ang_vel_limits  # , apply_speed_limits
 from dg_commons.sim.models.rocket_structures import RocketGeometry, RocketParameters
 from dg_commons.sim.simulator_structures import SimModel
@@ -196,11 +196,8 @@ class RocketModel(SimModel[RocketState, RocketCommands]):
         state_np = self._state.as_ndarray()
         action_np = commands.as_ndarray()
         y0 = np.concatenate([state_np, action_np])
-        result = solve_ivp(fun=_dynamics, t_span=(0.0, float(dt)), y0=y0)
-
-        if not result.success:
-            raise RuntimeError("Failed to integrate ivp!")
-        new_state, _ = _stateactions_from_array(result.y[:, -1])
+        y1 = integrate(fun=lambda y: _dynamics(0, y), y0=y0, dt=float(dt), method=self.integrator)
+        new_state, _ = _stateactions_from_array(y1)
         self._state = new_state
         return
 
@@ -1,22 +1,22 @@
 import math
 from dataclasses import dataclass, replace
 from decimal import Decimal
-from typing import Type, Mapping, TypeVar
+from typing import Type, Mapping, TypeVar, Sequence, Optional
 
 import numpy as np
 from frozendict import frozendict
 from geometry import SE2value, SE2_from_xytheta, SO2_from_angle, SO2value, T2value
-from scipy.integrate import solve_ivp
 from shapely.geometry import Polygon
 
 from dg_commons import apply_SE2_to_shapely_geo, PoseState
 from dg_commons.sim import logger, ImpactLocation, IMPACT_RIGHT, IMPACT_LEFT, IMPACT_BACK, IMPACT_FRONT
 from dg_commons.sim.models import ModelType, CAR
-from dg_commons.sim.models.model_utils import apply_full_acceleration_limits
+from dg_commons.sim.models.integrators import integrate, Integrator, RK45, EXACT_KINEMATIC
+from dg_commons.sim.models.model_utils import apply_full_acceleration_limits, apply_full_acceleration_limits_batch
 from dg_commons.sim.models.vehicle_ligths import LightsCmd, NO_LIGHTS
 from dg_commons.sim.models.vehicle_structures import VehicleGeometry
-from dg_commons.sim.models.vehicle_utils import steering_constraint, VehicleParameters
-from dg_commons.sim.simulator_structures import SimModel
+from dg_commons.sim.models.vehicle_utils import steering_constraint, VehicleParameters, steering_constraint_batch
+from dg_commons.sim.simulator_structures import SimModel, BatchDynamics
 
 
 @dataclass(unsafe_hash=True, eq=True, order=True)
@@ -183,14 +183,18 @@ class VehicleModel(SimModel[TVehicleState, VehicleCommands]):
             du = np.zeros([len(VehicleCommands.idx)])
             return np.concatenate([dx.as_ndarray(), du])
 
+        if self.integrator != RK45:
+            # fixed-step and closed-form schemes work directly on arrays
+            batch_dynamics = type(self).get_batch_dynamics([self])
+            if batch_dynamics is not None:
+                batch_dynamics.update([commands], dt=dt, integrator=self.integrator)
+                return
+
         state_np = self._state.as_ndarray()
         action_np = commands.as_ndarray()
         y0 = np.concatenate([state_np, action_np])
-        result = solve_ivp(fun=_dynamics, t_span=(0.0, float(dt)), y0=y0)
-
-        if not result.success:
-            raise RuntimeError("Failed to integrate ivp!")
-        new_state, _ = _stateactions_from_array(result.y[:, -1])
+        y1 = integrate(fun=lambda y: _dynamics(0, y), y0=y0, dt=float(dt), method=self.integrator)
+        new_state, _ = _stateactions_from_array(y1)
         self._state = new_state
         return
 
@@ -270,3 +274,86 @@ class VehicleModel(SimModel[TVehicleState, VehicleCommands]):
     def get_extra_collision_friction_acc(self):
         # this model is not dynamic
         pass
+
+    @classmethod
+    def get_batch_dynamics(cls, models: Sequence["VehicleModel"]) -> Optional["VehicleBatchDynamics"]:
+        # subclasses might change the dynamics, they need to provide their own batch dynamics
+        if cls is not VehicleModel:
+            return None
+        return VehicleBatchDynamics(models)
+
+
+class VehicleBatchDynamics(BatchDynamics[VehicleState, VehicleCommands]):
+    """Vectorized kinematic bicycle model (see `VehicleModel.dynamics`)"""
+
+    def __init__(self, models: Sequence[VehicleModel]):
+        super().__init__(models)
+        self.wheelbase = np.array([m.vg.wheelbase for m in models])
+        self.lr = np.array([m.vg.lr for m in models])
+        self.vx_limits = np.array([m.vp.vx_limits for m in models], dtype=float).reshape(-1, 2)
+        self.acc_limits = np.array([m.vp.acc_limits for m in models], dtype=float).reshape(-1, 2)
+        self.delta_max = np.array([m.vp.delta_max for m in models])
+        self.ddelta_max = np.array([m.vp.ddelta_max for m in models])
+        self.no_actions = np.array([m.has_collided and not m.vg.vehicle_type == CAR for m in models], dtype=bool)
+
+    def commands_as_array(self, commands: Sequence[VehicleCommands]) -> np.ndarray:
+        u = np.array([[cmds.acc, cmds.ddelta] for cmds in commands], dtype=float).reshape(-1, 2)
+        u[self.no_actions] = 0
+        return u
+
+    def kinematic_derivatives(self, x: np.ndarray, u: np.ndarray) -> tuple[np.ndarray, ...]:
+        """Returns xdot, ydot, dtheta, acc and ddelta, the state is required to have x, y, psi, vx in the first
+        four columns and delta in the last one"""
+        psi, vx, delta = x[:, 2], x[:, 3], x[:, -1]
+        dtheta = vx * np.tan(delta) / self.wheelbase
+        vy = dtheta * self.lr
+        costh = np.cos(psi)
+        sinth = np.sin(psi)
+        xdot = vx * costh - vy * sinth
+        ydot = vx * sinth + vy * costh
+        ddelta = steering_constraint_batch(delta, u[:, 1], self.delta_max, self.ddelta_max)
+        acc = apply_full_acceleration_limits_batch(vx, u[:, 0], self.vx_limits, self.acc_limits)
+        return xdot, ydot, dtheta, acc, ddelta
+
+    def dynamics(self, x: np.ndarray, u: np.ndarray) -> np.ndarray:
+        return np.stack(self.kinematic_derivatives(x, u), axis=1)
+
+    def step(self, x0: np.ndarray, u: np.ndarray, dt: float, integrator: Integrator) -> np.ndarray:
+        if integrator != EXACT_KINEMATIC:
+            return super().step(x0, u, dt, integrator)
+        return self.exact_kinematic_step(x0, u, dt)
+
+    def exact_kinematic_step(self, x0: np.ndarray, u: np.ndarray, dt: float) -> np.ndarray:
+        """Closed-form update of the kinematic bicycle model.
+        Speed and steering angle are saturated ramps, the pose is obtained integrating along the travelled distance
+        with the mean steering angle. This is exact when the steering angle is constant over the step."""
+        psi0, vx0, delta0 = x0[:, 2], x0[:, 3], x0[:, -1]
+        acc = apply_full_acceleration_limits_batch(vx0, u[:, 0], self.vx_limits, self.acc_limits)
+        ddelta = steering_constraint_batch(delta0, u[:, 1], self.delta_max, self.ddelta_max)
+        vx1, s = _saturated_ramp(vx0, acc, self.vx_limits[:, 0], self.vx_limits[:, 1], dt)
+        delta1, delta_integral = _saturated_ramp(delta0, ddelta, -self.delta_max, self.delta_max, dt)
+        k = np.tan(delta_integral / dt) / self.wheelbase
+        beta = np.arctan(k * self.lr)
+        dpsi = k * s
+        # chord of the arc travelled by the reference point, np.sinc(x) is sin(pi x)/(pi x)
+        chord = np.hypot(1, k * self.lr) * s * np.sinc(dpsi / (2 * np.pi))
+        heading = psi0 + beta + dpsi / 2
+        x1 = x0.copy()
+        x1[:, 0] += chord * np.cos(heading)
+        x1[:, 1] += chord * np.sin(heading)
+        x1[:, 2] = psi0 + dpsi
+        x1[:, 3] = vx1
+        x1[:, -1] = delta1
+        return x1
+
+
+def _saturated_ramp(
+    x0: np.ndarray, rate: np.ndarray, lower: np.ndarray, upper: np.ndarray, dt: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Value after dt and integral over [0, dt] of a quantity moving at constant rate until it hits its limits"""
+    x1 = np.where(rate > 0, np.minimum(x0 + rate * dt, np.maximum(upper, x0)), x0 + rate * dt)
+    x1 = np.where(rate < 0, np.maximum(x0 + rate * dt, np.minimum(lower, x0)), x1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_hit = np.where(rate != 0, (x1 - x0) / rate, dt)
+    integral = x0 * t_hit + 0.5 * rate * t_hit**2 + x1 * (dt - t_hit)
+    return x1, integral
@@ -1,18 +1,20 @@
 import math
 from dataclasses import dataclass, replace
-from typing import Sequence
+from typing import Sequence, Optional
 
 import numpy as np
 from frozendict import frozendict
 from geometry import T2value, SO2_from_angle, SO2value
 
 from dg_commons.sim.models import Pacejka4p, Pacejka
+from dg_commons.sim.models.integrators import Integrator
 from dg_commons.sim.models.model_structures import TwoWheelsTypes
 from dg_commons.sim.models.model_utils import apply_full_acceleration_limits
 from dg_commons.sim.models.utils import G, rho
-from dg_commons.sim.models.vehicle import VehicleCommands, VehicleState, VehicleModel
+from dg_commons.sim.models.vehicle import VehicleCommands, VehicleState, VehicleModel, VehicleBatchDynamics
 from dg_commons.sim.models.vehicle_structures import VehicleGeometry
 from dg_commons.sim.models.vehicle_utils import steering_constraint, VehicleParameters
+from dg_commons.sim.simulator_structures import BatchDynamics
 
 
 @dataclass(unsafe_hash=True, eq=True, order=True)
@@ -239,3 +241,96 @@ class VehicleModelDyn(VehicleModel):
             return frictionx, frictiony, frictionpsi
         else:
             return 0, 0, 0
+
+    @classmethod
+    def get_batch_dynamics(cls, models: Sequence["VehicleModelDyn"]) -> Optional["VehicleDynBatchDynamics"]:
+        # subclasses might change the dynamics, and custom tyre models cannot be vectorized
+        if cls is not VehicleModelDyn:
+            return None
+        for m in models:
+            if type(m.pacejka_front) not in (Pacejka, Pacejka4p) or type(m.pacejka_rear) not in (Pacejka, Pacejka4p):
+                return None
+        return VehicleDynBatchDynamics(models)
+
+
+class VehicleDynBatchDynamics(VehicleBatchDynamics):
+    """Vectorized single track dynamic model (see `VehicleModelDyn.dynamics`)"""
+
+    def __init__(self, models: Sequence[VehicleModelDyn]):
+        super().__init__(models)
+        self.m = np.array([m.vg.m for m in models])
+        self.Iz = np.array([m.vg.Iz for m in models])
+        self.lf = np.array([m.vg.lf for m in models])
+        self.h_cog = np.array([m.vg.h_cog for m in models])
+        self.c_rr_f = np.array([m.vg.c_rr_f for m in models])
+        self.c_rr_r = np.array([m.vg.c_rr_r for m in models])
+        self.drag = np.array([0.5 * m.vg.a_drag * m.vg.c_drag * rho**2 for m in models])
+        # a Pacejka is a Pacejka4p with E=0
+        self.tyre_front = np.array([_pacejka_coeffs(m.pacejka_front) for m in models]).reshape(-1, 4)
+        self.tyre_rear = np.array([_pacejka_coeffs(m.pacejka_rear) for m in models]).reshape(-1, 4)
+        # the friction after a collision depends on the state at the beginning of the step
+        self.friction = np.array([m.get_extra_collision_friction_acc() for m in models], dtype=float).reshape(-1, 3)
+
+    def step(self, x0: np.ndarray, u: np.ndarray, dt: float, integrator: Integrator) -> np.ndarray:
+        # no closed-form update for the dynamic model
+        return BatchDynamics.step(self, x0, u, dt, integrator)
+
+    def dynamics(self, x: np.ndarray, u: np.ndarray) -> np.ndarray:
+        psi, vx, vy, dpsi, delta = x[:, 2], x[:, 3], x[:, 4], x[:, 5], x[:, 6]
+        friction_x, friction_y, friction_psi = self.friction.T
+        xdot_kin, ydot_kin, dtheta_kin, acc, ddelta = self.kinematic_derivatives(x, u)
+        kinematic = vx < 0.1
+
+        m = self.m
+        # vertical forces
+        load_transfer = self.h_cog * acc
+        F1_n = -m * (G * self.lr - load_transfer) / self.wheelbase
+        F2_n = -m * (G * self.lf + load_transfer) / self.wheelbase
+        # acceleration split and rolling resistance
+        Facc = m * acc
+        braking = Facc <= 0
+        Facc1 = np.where(braking, 0.6, 0.5) * Facc + self.c_rr_f * F1_n
+        Facc2 = np.where(braking, 0.4, 0.5) * Facc + self.c_rr_r * F2_n
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # front wheel forces, rotated in the tyre frame
+            cosd, sind = np.cos(delta), np.sin(delta)
+            vy_1 = vy + self.lf * dpsi
+            slip_angle_1 = np.arctan((-sind * vx + cosd * vy_1) / (cosd * vx + sind * vy_1))
+            F1y_tyre = _pacejka_evaluate(self.tyre_front, slip_angle_1) * F1_n
+            Facc1_sat = Facc1 * np.sqrt(1 - (F1y_tyre / (F1_n * self.tyre_front[:, 2])) ** 2)
+            F1x = cosd * Facc1_sat - sind * F1y_tyre
+            F1y = sind * Facc1_sat + cosd * F1y_tyre
+            # back wheel forces
+            slip_angle_2 = np.arctan((vy - self.lr * dpsi) / vx)
+            F2y = _pacejka_evaluate(self.tyre_rear, slip_angle_2) * F2_n
+            Facc2_sat = Facc2 * np.sqrt(1 - (F2y / (F2_n * self.tyre_rear[:, 2])) ** 2)
+
+        F_drag = -vx * self.drag
+        acc_x = (F1x + F_drag + Facc2_sat) / m + dpsi * vy
+        acc_y = (F1y + F2y) / m - dpsi * vx
+        ddtheta = (F1y * self.lf - F2y * self.lr) / self.Iz
+        costh, sinth = np.cos(psi), np.sin(psi)
+
+        return np.stack(
+            [
+                np.where(kinematic, xdot_kin, vx * costh - vy * sinth),
+                np.where(kinematic, ydot_kin, vx * sinth + vy * costh),
+                np.where(kinematic, dtheta_kin, dpsi),
+                np.where(kinematic, acc, acc_x) + friction_x,
+                np.where(kinematic, 0.0, acc_y) + friction_y,
+                np.where(kinematic, 0.0, ddtheta) + friction_psi,
+                ddelta,
+            ],
+            axis=1,
+        )
+
+
+def _pacejka_coeffs(pacejka: Pacejka) -> tuple[float, float, float, float]:
+    return pacejka.B, pacejka.C, pacejka.D, getattr(pacejka, "E", 0.0)
+
+
+def _pacejka_evaluate(coeffs: np.ndarray, slip: np.ndarray) -> np.ndarray:
+    """Vectorized `Pacejka4p.evaluate`, coefficients are stacked as (B, C, D, E) rows"""
+    B, C, D, E = coeffs.T
+    return D * np.sin(C * np.arctan(B * slip - E * (B * slip - E * np.arctan(B * slip))))
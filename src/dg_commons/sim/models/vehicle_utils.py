@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+import numpy as np
+
 from dg_commons.sim import logger
 from dg_commons.sim.models.model_structures import ModelParameters
 from dg_commons.sim.models.utils import kmh2ms
@@ -51,3 +53,13 @@ def steering_constraint(steering_angle: float, steering_velocity: float, vp: Veh
         )
         steering_velocity = vp.ddelta_max
     return steering_velocity
+
+
+def steering_constraint_batch(
+    steering_angle: np.ndarray, steering_velocity: np.ndarray, delta_max: np.ndarray, ddelta_max: np.ndarray
+) -> np.ndarray:
+    """Vectorized version of `steering_constraint`"""
+    at_limit = ((steering_angle <= -delta_max) & (steering_velocity < 0)) | (
+        (steering_angle >= delta_max) & (steering_velocity > 0)
+    )
+    return np.where(at_limit, 0.0, np.clip(steering_velocity, -ddelta_max, ddelta_max))
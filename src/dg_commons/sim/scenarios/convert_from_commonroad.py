@@ -1,7 +1,10 @@
+from typing import Optional
+
 from commonroad.scenario.lanelet import LaneletNetwork
 from commonroad.scenario.obstacle import DynamicObstacle
 
 from dg_commons import Color
+from dg_commons.maps.lanelet_index import LaneletIndex
 from dg_commons.sim import SimModel
 from dg_commons.sim.agents.agent import Agent
 from dg_commons.sim.agents.lane_follower import LFAgent
@@ -11,7 +14,10 @@ from dg_commons.sim.scenarios.utils_dyn_obstacle import infer_lane_from_dyn_obs
 
 
 def model_agent_from_dynamic_obstacle(
-    dyn_obs: DynamicObstacle, lanelet_network: LaneletNetwork, color: Color = "royalblue"
+    dyn_obs: DynamicObstacle,
+    lanelet_network: LaneletNetwork,
+    color: Color = "royalblue",
+    lanelet_index: Optional[LaneletIndex] = None,
 ) -> (VehicleModelDyn, Agent):
     """
     This function aims to create a non-playing character (fixed sequence of commands) in our simulation environment from
@@ -21,11 +27,12 @@ def model_agent_from_dynamic_obstacle(
     :param color:
     :param dyn_obs:
     :param lanelet_network:
+    :param lanelet_index: the index of the lanelet network, to share its cache among the obstacles
     :return:
     """
 
     model: SimModel = infer_model_from_cr_dyn_obstacle(dyn_obs, color)
     # Agent
-    dglane = infer_lane_from_dyn_obs(dyn_obs=dyn_obs, network=lanelet_network)
+    dglane = infer_lane_from_dyn_obs(dyn_obs=dyn_obs, network=lanelet_network, lanelet_index=lanelet_index)
     agent = LFAgent(dglane, model_params=model.model_params, model_geo=model.model_geometry)
     return model, agent
@@ -4,6 +4,7 @@ from commonroad.prediction.prediction import TrajectoryPrediction
 from geometry import SE2_from_xytheta
 
 from dg_commons import PlayerName, apply_SE2_to_shapely_geo
+from dg_commons.maps.lanelet_index import LaneletIndex
 from dg_commons.sim import SimLog, SimParameters, logger
 from dg_commons.sim.models.obstacles import StaticObstacle
 from dg_commons.sim.scenarios import NotSupportedConversion, load_commonroad_scenario
@@ -23,6 +24,7 @@ def get_scenario_commonroad_replica(
     seed: int = 0,
     assign_missions: bool = False,
     description: str = "",
+    cache_dir: Optional[str] = None,
 ) -> SimContext:
     """
     This function loads a CommonRoad scenario and tries to convert the dynamic obstacles into the Model/Agent paradigm
@@ -33,11 +35,13 @@ def get_scenario_commonroad_replica(
     :param ego_player:
     :param seed:
     :param assign_missions:
+    :param cache_dir: on-disk cache of the parsed scenarios, see `load_commonroad_scenario`
     :return:
     """
-    scenario, planning_problem_set = load_commonroad_scenario(scenario_name, scenarios_dir)
+    scenario, planning_problem_set = load_commonroad_scenario(scenario_name, scenarios_dir, cache_dir=cache_dir)
     players, models = {}, {}
     static_obstacles: list[StaticObstacle] = []
+    lanelet_index = LaneletIndex.of(scenario)
 
     for i, dyn_obs in enumerate(scenario.dynamic_obstacles):
         assert isinstance(dyn_obs.prediction, TrajectoryPrediction), "Only trajectory predictions are supported"
@@ -56,10 +60,12 @@ def get_scenario_commonroad_replica(
                     # todo this part is not elegant, make separate function that given a sim context can modify it
                     p_name = PlayerName("Ego")
                     model, agent = model_agent_from_dynamic_obstacle(
-                        dyn_obs, scenario.lanelet_network, color="firebrick"
+                        dyn_obs, scenario.lanelet_network, color="firebrick", lanelet_index=lanelet_index
                     )
                 else:
-                    model, agent = model_agent_from_dynamic_obstacle(dyn_obs, scenario.lanelet_network)
+                    model, agent = model_agent_from_dynamic_obstacle(
+                        dyn_obs, scenario.lanelet_network, lanelet_index=lanelet_index
+                    )
 
                 players.update({p_name: agent})
                 models.update({p_name: model})
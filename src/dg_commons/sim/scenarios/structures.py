@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, Iterable, Sequence
 
 from commonroad.scenario.lanelet import LaneletNetwork
@@ -6,15 +7,20 @@ from commonroad.scenario.scenario import Scenario
 from shapely.strtree import STRtree
 
 from dg_commons import logger
+from dg_commons.maps.lanelet_index import LaneletIndex
 from dg_commons.maps.road_bounds import build_road_boundary_obstacle
 from dg_commons.sim.models.obstacles import StaticObstacle
 
 __all__ = ["DgScenario"]
 
 
-@dataclass(unsafe_hash=True)
+@dataclass(frozen=True, unsafe_hash=True)
 class DgScenario:
-    """Mainly a thin wrapper around CommonRoad scenarios. Yet it can work also as an empty world."""
+    """
+    Mainly a thin wrapper around CommonRoad scenarios. Yet it can work also as an empty world.
+    It is frozen since it is shared by the simulator and all the agents, the CommonRoad scenario shall not be
+    modified either (the static obstacles and their spatial index are computed once at creation).
+    """
 
     scenario: Optional[Scenario] = None
     """A CommonRoad scenario"""
@@ -42,10 +48,16 @@ class DgScenario:
         elif self.use_road_boundaries and self.scenario is None:
             logger.warn("Road boundaries requested but no scenario provided, ignoring...")
         obs_shapes = [sobstacle.shape for sobstacle in static_obstacles]
-        self.strtree_obstacles = STRtree(obs_shapes, node_capacity=3)
-        self.static_obstacles = tuple(static_obstacles)
+        object.__setattr__(self, "strtree_obstacles", STRtree(obs_shapes, node_capacity=3))
+        object.__setattr__(self, "static_obstacles", tuple(static_obstacles))
 
     @property
     def lanelet_network(self) -> Optional[LaneletNetwork]:
         """Just for ease of use to avoid dg_scenario.scenario..."""
         return self.scenario.lanelet_network if self.scenario else None
+
+    @cached_property
+    def lanelet_index(self) -> Optional[LaneletIndex]:
+        """Spatial index and cache of `DgLanelet` conversions over the lanelet network, shared by all the users of
+        the CommonRoad scenario (see `LaneletIndex.of`)"""
+        return LaneletIndex.of(self.scenario) if self.scenario else None
@@ -1,65 +1,162 @@
+import hashlib
 import os
+import pickle
 import re
+import tempfile
+from importlib.metadata import version
 from typing import Optional
 
 from commonroad.common.file_reader import CommonRoadFileReader
 from commonroad.planning.planning_problem import PlanningProblemSet
-from commonroad.scenario.lanelet import LaneletNetwork, Lanelet
+from commonroad.scenario.lanelet import LaneletNetwork
 from commonroad.scenario.scenario import Scenario
 from geometry import T2value
 from zuper_commons.types import ZException
 
+from dg_commons import logger
 from dg_commons.maps import DgLanelet
+from dg_commons.maps.lanelet_index import LaneletIndex
+from dg_commons.maps.road_bounds import build_road_boundary_obstacle, share_road_boundaries
 
-__all__ = ["load_commonroad_scenario", "dglane_from_position", "NotSupportedConversion"]
+__all__ = [
+    "load_commonroad_scenario",
+    "find_commonroad_scenario",
+    "dglane_from_position",
+    "NotSupportedConversion",
+    "SCENARIO_CACHE_VERSION",
+]
 
 
 class NotSupportedConversion(ZException):
     pass
 
 
-def load_commonroad_scenario(
-    scenario_name: str, scenarios_dir: Optional[str] = None
-) -> tuple[Scenario, PlanningProblemSet]:
-    """Loads a CommonRoad scenario.
-    If no directory is provided it looks for a `scenarios` folder at the src level of the current project."""
-    if scenarios_dir is None:
-        dg_root_dir = __file__
-        src_folder = "src"
-        assert src_folder in dg_root_dir, dg_root_dir
-        dg_root_dir = re.split(src_folder, dg_root_dir)[0]
-        assert os.path.isdir(dg_root_dir)
-        scenarios_dir = os.path.join(dg_root_dir, "scenarios")
-
-    # generate path of the file to be opened
-    scenario_name = scenario_name if scenario_name.endswith(".xml") else scenario_name + ".xml"
-    scenario_path = None
+_SCENARIO_PATHS: dict[str, dict[str, str]] = {}
+"""For each scenarios directory (absolute path) the path of each scenario file by file name"""
+
+SCENARIO_CACHE_VERSION = 2
+"""Version of the entries of the on-disk cache of the scenarios, older entries are ignored"""
+_ROAD_BOUNDARIES_BUFFER = 0.1
+"""The buffer of the road boundaries stored in the cache, the default of `DgScenario.road_boundaries_buffer`"""
+
+
+def _default_scenarios_dir() -> str:
+    """The `scenarios` folder at the src level of the current project"""
+    dg_root_dir = __file__
+    src_folder = "src"
+    assert src_folder in dg_root_dir, dg_root_dir
+    dg_root_dir = re.split(src_folder, dg_root_dir)[0]
+    assert os.path.isdir(dg_root_dir)
+    return os.path.join(dg_root_dir, "scenarios")
+
+
+def _index_scenarios(scenarios_dir: str) -> dict[str, str]:
+    paths = {}
     for root, dirs, files in os.walk(scenarios_dir, followlinks=True):
         for name in files:
-            if name == scenario_name:
-                scenario_path = os.path.abspath(os.path.join(root, name))
-                break
-    if scenario_path is None:
+            if name.endswith(".xml"):
+                paths[name] = os.path.abspath(os.path.join(root, name))
+    _SCENARIO_PATHS[os.path.abspath(scenarios_dir)] = paths
+    return paths
+
+
+def find_commonroad_scenario(scenario_name: str, scenarios_dir: Optional[str] = None) -> str:
+    """The path of the scenario file within the directory (default as in `load_commonroad_scenario`).
+    The directory is walked once, again only if the scenario is not found (e.g. a file has been added since)."""
+    scenarios_dir = _default_scenarios_dir() if scenarios_dir is None else scenarios_dir
+    scenario_name = scenario_name if scenario_name.endswith(".xml") else scenario_name + ".xml"
+    paths = _SCENARIO_PATHS.get(os.path.abspath(scenarios_dir))
+    if paths is None or not os.path.isfile(paths.get(scenario_name, "")):
+        paths = _index_scenarios(scenarios_dir)
+    if scenario_name not in paths:
         raise FileNotFoundError(
             f"Unable to find commonroad scenario {scenario_name} within {scenarios_dir}.\n"
             f"Be aware that currently interactive scenarios cannot be loaded."
         )
+    return paths[scenario_name]
+
+
+def _load_cached(scenario_path: str, cache_dir: str) -> tuple[Scenario, PlanningProblemSet]:
+    """
+    Loads the parsed scenario from the cache, otherwise parses it and stores it in the cache.
+    An entry holds the scenario, the planning problems, the lanelet index with all the lanelets converted
+    to `DgLanelet` and the road boundaries (default buffer of `DgScenario`).
+    It is valid as long as the modification time and the size of the file do not change.
+    """
+    stat = os.stat(scenario_path)
+    key = {
+        "version": SCENARIO_CACHE_VERSION,
+        "commonroad": version("commonroad-io"),
+        "path": scenario_path,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+    path_hash = hashlib.sha1(scenario_path.encode()).hexdigest()[:12]
+    entry_path = os.path.join(cache_dir, f"{os.path.basename(scenario_path)[:-4]}-{path_hash}.pickle")
+    if os.path.exists(entry_path):
+        try:
+            with open(entry_path, "rb") as f:
+                entry = pickle.load(f)
+            if entry["key"] == key:
+                entry["lanelet_index"].share(entry["scenario"])
+                for buffer, boundaries in entry["road_boundaries"].items():
+                    share_road_boundaries(entry["scenario"], buffer, boundaries)
+                return entry["scenario"], entry["planning_problem_set"]
+        except Exception as e:
+            logger.warn(f"Ignoring the invalid cache entry {entry_path}: {e}")
+
+    scenario, planning_problem_set = CommonRoadFileReader(scenario_path).open(lanelet_assignment=True)
+    lanelet_index = LaneletIndex.of(scenario)
+    for lanelet in scenario.lanelet_network.lanelets:
+        lanelet_index.dglanelet(lanelet.lanelet_id)
+    entry = {
+        "key": key,
+        "scenario": scenario,
+        "planning_problem_set": planning_problem_set,
+        "lanelet_index": lanelet_index,
+        "road_boundaries": {_ROAD_BOUNDARIES_BUFFER: build_road_boundary_obstacle(scenario, _ROAD_BOUNDARIES_BUFFER)},
+    }
+    os.makedirs(cache_dir, exist_ok=True)
+    # written aside and moved, concurrent loads (e.g. of a batch of simulations) never read a partial entry
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entry_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return scenario, planning_problem_set
+
+
+def load_commonroad_scenario(
+    scenario_name: str, scenarios_dir: Optional[str] = None, cache_dir: Optional[str] = None
+) -> tuple[Scenario, PlanningProblemSet]:
+    """Loads a CommonRoad scenario.
+    If no directory is provided it looks for a `scenarios` folder at the src level of the current project.
+    :param cache_dir: if given (or set by the environment variable DG_COMMONS_SCENARIOS_CACHE), the parsed scenarios
+        are cached on disk in this directory, loading them again skips the parsing of the XML file and the conversion
+        of the lanelets (see `LaneletIndex.of`)
+    """
+    scenario_path = find_commonroad_scenario(scenario_name, scenarios_dir)
+    cache_dir = os.environ.get("DG_COMMONS_SCENARIOS_CACHE") if cache_dir is None else cache_dir
+    if cache_dir:
+        return _load_cached(scenario_path, cache_dir)
     # read in the scenario and planning problem set
     return CommonRoadFileReader(scenario_path).open(lanelet_assignment=True)
 
 
 def dglane_from_position(
-    p: T2value, network: LaneletNetwork, init_lane_selection: int = 0, succ_lane_selection: int = 0
+    p: T2value,
+    network: LaneletNetwork,
+    init_lane_selection: int = 0,
+    succ_lane_selection: int = 0,
+    lanelet_index: Optional[LaneletIndex] = None,
 ) -> DgLanelet:
-    """Gets the merged lane from init lane select to the successive lane from the current position"""
-    lane_id = network.find_lanelet_by_position(
-        [
-            p,
-        ]
-    )
-    assert len(lane_id[0]) > 0, p
-    lane = network.find_lanelet_by_id(lane_id[0][init_lane_selection])
-    merged_lane = Lanelet.all_lanelets_by_merging_successors_from_lanelet(lanelet=lane, network=network)[0][
-        succ_lane_selection
-    ]
-    return DgLanelet.from_commonroad_lanelet(merged_lane)
+    """Gets the merged lane from init lane select to the successive lane from the current position.
+    The merged lanes are cached in the lanelet index of the network (e.g. `DgScenario.lanelet_index`),
+    by default in the one shared by the users of the network (see `LaneletIndex.of`)."""
+    lanelet_index = LaneletIndex.of(network) if lanelet_index is None else lanelet_index
+    lane_ids = lanelet_index.lanelet_ids_at(p)
+    assert len(lane_ids) > 0, p
+    return lanelet_index.merged_dglanelets(lane_ids[init_lane_selection])[succ_lane_selection]
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import numpy as np
 from commonroad.scenario.lanelet import LaneletNetwork
 from commonroad.scenario.obstacle import DynamicObstacle
@@ -5,28 +7,33 @@ from commonroad.scenario.trajectory import State
 from geometry import angle_from_SE2
 
 from dg_commons import SE2Transform
+from dg_commons.maps.lanelet_index import LaneletIndex
 from dg_commons.maps.lanes import DgLanelet, LaneCtrPoint
 
 __all__ = ["infer_lane_from_dyn_obs", "is_dyn_obstacle_static"]
 
 
-def infer_lane_from_dyn_obs(dyn_obs: DynamicObstacle, network: LaneletNetwork) -> DgLanelet:
-    """Tries to find a lane corresponding to the trajectory, if no lane is found it creates one from the trajectory"""
+def infer_lane_from_dyn_obs(
+    dyn_obs: DynamicObstacle, network: LaneletNetwork, lanelet_index: Optional[LaneletIndex] = None
+) -> DgLanelet:
+    """Tries to find a lane corresponding to the trajectory, if no lane is found it creates one from the trajectory.
+    The merged lanes are cached in the lanelet index of the network (e.g. `DgScenario.lanelet_index`),
+    by default in the one shared by the users of the network (see `LaneletIndex.of`)."""
+    lanelet_index = LaneletIndex.of(network) if lanelet_index is None else lanelet_index
     init_position = dyn_obs.initial_state.position
     end_position = dyn_obs.prediction.trajectory.state_list[-1].position
 
-    init_ids = network.find_lanelet_by_position([init_position])[0]
-    final_ids = network.find_lanelet_by_position([end_position])[0]
+    init_ids, final_ids = lanelet_index.lanelet_ids_at_points(np.array([init_position, end_position]))
     if not init_ids or not final_ids:
         return _dglane_from_trajectory(dyn_obs.prediction.trajectory.state_list)
 
     candidates: list[DgLanelet] = []
     for init_id in init_ids:
-        lanelet = network.find_lanelet_by_id(init_id)
-        merged_lanelets, _ = lanelet.all_lanelets_by_merging_successors_from_lanelet(lanelet=lanelet, network=network)
-        for merged_lanelet in merged_lanelets:
+        merged_lanelets = lanelet_index.merged_lanelets(init_id)
+        merged_dglanelets = lanelet_index.merged_dglanelets(init_id)
+        for merged_lanelet, merged_dglanelet in zip(merged_lanelets, merged_dglanelets):
             if any(str(id) in str(merged_lanelet.lanelet_id) for id in final_ids):
-                candidates.append(DgLanelet.from_commonroad_lanelet(merged_lanelet))
+                candidates.append(merged_dglanelet)
 
     if len(candidates) == 1:
         return candidates[0]
@@ -0,0 +1,336 @@
+import json
+import pickle
+from dataclasses import fields, is_dataclass
+from decimal import Decimal as D
+from typing import Any, Collection, Optional, Sequence, Union
+
+import numpy as np
+import shapely
+from zuper_commons.types import ZValueError
+
+from dg_commons import DgSampledSequence, DgColumnarSequence, PlayerName
+from dg_commons.seq.sequence import Timestamp
+from dg_commons.sim.collision_structures import CollisionReport, CollisionReportPlayer
+from dg_commons.sim.log_encoding import is_numeric, type_from_path, type_path
+from dg_commons.sim.simulator_structures import PlayerLog, SimLog
+
+__all__ = [
+    "SIM_IO_VERSION",
+    "save_sim_log",
+    "load_sim_log",
+    "save_player_log",
+    "load_player_log",
+    "save_collision_reports",
+    "load_collision_reports",
+]
+
+SIM_IO_VERSION = 2
+"""Version of the binary format, files written with a different version are refused"""
+
+_FIELDS = ("states", "commands", "extra", "info")
+_META = "meta"
+
+
+def _pack_bytes(items: Sequence[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    """Concatenates variable length records, returns the buffer and the offsets (len(items)+1)"""
+    offsets = np.zeros(len(items) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(item) for item in items])
+    return np.frombuffer(b"".join(items), dtype=np.uint8), offsets
+
+
+def _unpack_bytes(buffer: np.ndarray, offsets: np.ndarray, start: int = 0, stop: Optional[int] = None) -> list[bytes]:
+    stop = len(offsets) - 1 if stop is None else stop
+    return [buffer[offsets[i] : offsets[i + 1]].tobytes() for i in range(start, stop)]
+
+
+def _timestamps_from_floats(ts: np.ndarray, decimal: bool) -> list[Timestamp]:
+    # the shortest representation round trips the Decimal timestamps of the simulation (e.g. 0.05 multiples)
+    return [D(repr(t)) for t in ts.tolist()] if decimal else ts.tolist()
+
+
+# ----- sampled sequences -----
+
+
+def _encode_sequence(prefix: str, seq: DgSampledSequence, arrays: dict[str, np.ndarray]) -> dict:
+    if len(seq) == 0:
+        return {"kind": "empty"}
+    ts, values = seq.timestamps, seq.values
+    arrays[f"{prefix}/t"] = np.array([float(t) for t in ts], dtype=np.float64)
+    meta = {"decimal": isinstance(ts[0], D), "type": type_path(type(values[0]))}
+    if is_numeric(values[0]) and all(type(v) == type(values[0]) for v in values):
+        meta["kind"] = "numeric"
+        if isinstance(values[0], (int, float, D)):
+            arrays[f"{prefix}/v"] = np.array([float(v) for v in values], dtype=np.float64)
+        else:
+            arrays[f"{prefix}/v"] = np.array([v.as_ndarray() for v in values], dtype=np.float64)
+    elif _is_flat_dataclass(values):
+        # e.g. commands with lights, numeric fields become arrays the others are pickled one record at a time
+        meta["kind"] = "columns"
+        meta["columns"] = {}
+        for f in fields(values[0]):
+            column = [getattr(v, f.name) for v in values]
+            if all(isinstance(x, (float, np.floating)) for x in column):
+                meta["columns"][f.name] = "float"
+                arrays[f"{prefix}/c/{f.name}"] = np.array(column, dtype=np.float64)
+            elif all(isinstance(x, (int, np.integer)) and not isinstance(x, bool) for x in column):
+                meta["columns"][f.name] = "int"
+                arrays[f"{prefix}/c/{f.name}"] = np.array(column, dtype=np.int64)
+            else:
+                meta["columns"][f.name] = "pickle"
+                records = [pickle.dumps(x, protocol=pickle.HIGHEST_PROTOCOL) for x in column]
+                arrays[f"{prefix}/c/{f.name}/blob"], arrays[f"{prefix}/c/{f.name}/offsets"] = _pack_bytes(records)
+    else:
+        meta["kind"] = "pickle"
+        records = [pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL) for v in values]
+        arrays[f"{prefix}/blob"], arrays[f"{prefix}/offsets"] = _pack_bytes(records)
+    return meta
+
+
+def _is_flat_dataclass(values: Sequence[Any]) -> bool:
+    """Whether all the values are instances of the same dataclass that can be rebuilt from its fields"""
+    XT = type(values[0])
+    if not is_dataclass(XT) or any(not f.init for f in fields(XT)):
+        return False
+    return all(type(v) == XT for v in values)
+
+
+def _decode_sequence(
+    prefix: str,
+    meta: dict,
+    data,
+    from_ts: Optional[Timestamp],
+    to_ts: Optional[Timestamp],
+    columnar: bool,
+) -> Union[DgSampledSequence, DgColumnarSequence]:
+    if meta["kind"] == "empty":
+        return DgSampledSequence[object](timestamps=[], values=[])
+    ts = data[f"{prefix}/t"]
+    start = 0 if from_ts is None else int(np.searchsorted(ts, float(from_ts), side="left"))
+    stop = len(ts) if to_ts is None else int(np.searchsorted(ts, float(to_ts), side="right"))
+    ts = ts[start:stop]
+    if meta["kind"] == "numeric":
+        XT = type_from_path(meta["type"])
+        values = data[f"{prefix}/v"][start:stop]
+        if columnar:
+            return DgColumnarSequence(ts, values, XT)
+        if XT in (int, float, D):
+            objects = [XT(repr(v)) if XT is D else XT(v) for v in values.tolist()]
+        else:
+            objects = [XT.from_array(v) for v in values]
+    elif meta["kind"] == "columns":
+        XT = type_from_path(meta["type"])
+        columns = {}
+        for name, column_type in meta["columns"].items():
+            if column_type == "pickle":
+                records = _unpack_bytes(
+                    data[f"{prefix}/c/{name}/blob"], data[f"{prefix}/c/{name}/offsets"], start, stop
+                )
+                columns[name] = [pickle.loads(r) for r in records]
+            else:
+                columns[name] = data[f"{prefix}/c/{name}"][start:stop].tolist()
+        objects = [XT(**dict(zip(columns, row))) for row in zip(*columns.values())]
+    else:
+        XT = object
+        records = _unpack_bytes(data[f"{prefix}/blob"], data[f"{prefix}/offsets"], start, stop)
+        objects = [pickle.loads(r) for r in records]
+    return DgSampledSequence[XT](timestamps=_timestamps_from_floats(ts, meta["decimal"]), values=objects)
+
+
+def _encode_player_log(prefix: str, log: PlayerLog, arrays: dict[str, np.ndarray]) -> dict:
+    return {f: _encode_sequence(f"{prefix}/{f}", getattr(log, f), arrays) for f in _FIELDS}
+
+
+def _decode_player_log(prefix: str, meta: dict, data, from_ts, to_ts, columnar: bool) -> PlayerLog:
+    return PlayerLog(**{f: _decode_sequence(f"{prefix}/{f}", meta[f], data, from_ts, to_ts, columnar) for f in _FIELDS})
+
+
+# ----- collision reports -----
+
+
+def _encode_collision_reports(reports: Sequence[CollisionReport], arrays: dict[str, np.ndarray]) -> dict:
+    at_time, decimal, impact_points, impact_normals = [], False, [], []
+    entry_report, entry_player, entry_none, at_fault, footprints, velocities, energies = [], [], [], [], [], [], []
+    location_entry, location_names, location_polygons = [], [], []
+    for i, report in enumerate(reports):
+        at_time.append(float(report.at_time))
+        decimal = decimal or isinstance(report.at_time, D)
+        impact_points.append(report.impact_point)
+        normal = report.impact_normal
+        impact_normals.append([np.nan, np.nan] if normal is None else np.asarray(normal, dtype=float).reshape(2))
+        for player_name, player_report in report.players.items():
+            entry_report.append(i)
+            entry_player.append(player_name)
+            entry_none.append(player_report is None)
+            if player_report is None:
+                at_fault.append(False)
+                footprints.append(None)
+                velocities.append([np.nan] * 6)
+                energies.append(np.nan)
+                continue
+            at_fault.append(player_report.at_fault)
+            footprints.append(player_report.footprint)
+            (v, omega), (v_after, omega_after) = player_report.velocity, player_report.velocity_after
+            velocities.append([*np.asarray(v, dtype=float), omega, *np.asarray(v_after, dtype=float), omega_after])
+            energies.append(player_report.energy_delta)
+            for location_name, polygon in player_report.locations:
+                location_entry.append(len(entry_report) - 1)
+                location_names.append(location_name)
+                location_polygons.append(polygon)
+
+    def _wkb(prefix: str, geometries: list):
+        wkb = [b"" if g is None else shapely.to_wkb(g) for g in geometries]
+        arrays[f"{prefix}/blob"], arrays[f"{prefix}/offsets"] = _pack_bytes(wkb)
+
+    arrays["cr/at_time"] = np.array(at_time, dtype=np.float64)
+    arrays["cr/impact_normal"] = np.array(impact_normals, dtype=np.float64).reshape(-1, 2)
+    _wkb("cr/impact_point", impact_points)
+    arrays["cr/entry/report"] = np.array(entry_report, dtype=np.int64)
+    arrays["cr/entry/none"] = np.array(entry_none, dtype=bool)
+    arrays["cr/entry/at_fault"] = np.array(at_fault, dtype=bool)
+    arrays["cr/entry/velocity"] = np.array(velocities, dtype=np.float64).reshape(-1, 6)
+    arrays["cr/entry/energy_delta"] = np.array(energies, dtype=np.float64)
+    _wkb("cr/entry/footprint", footprints)
+    arrays["cr/location/entry"] = np.array(location_entry, dtype=np.int64)
+    _wkb("cr/location/polygon", location_polygons)
+    return {"n": len(reports), "decimal": decimal, "players": entry_player, "locations": location_names}
+
+
+def _decode_collision_reports(meta: dict, data) -> list[CollisionReport]:
+    def _geometries(prefix: str) -> list:
+        wkb = _unpack_bytes(data[f"{prefix}/blob"], data[f"{prefix}/offsets"])
+        return [shapely.from_wkb(b) if b else None for b in wkb]
+
+    impact_points = _geometries("cr/impact_point")
+    footprints = _geometries("cr/entry/footprint")
+    location_polygons = _geometries("cr/location/polygon")
+    locations: list[list] = [[] for _ in footprints]
+    for entry, name, polygon in zip(data["cr/location/entry"].tolist(), meta["locations"], location_polygons):
+        locations[entry].append((name, polygon))
+    players: list[dict] = [{} for _ in range(meta["n"])]
+    entries = zip(
+        data["cr/entry/report"].tolist(),
+        meta["players"],
+        data["cr/entry/none"].tolist(),
+        data["cr/entry/at_fault"].tolist(),
+        footprints,
+        data["cr/entry/velocity"],
+        data["cr/entry/energy_delta"].tolist(),
+        locations,
+    )
+    for report_idx, player_name, is_none, at_fault, footprint, vel, energy, player_locations in entries:
+        players[report_idx][PlayerName(player_name)] = (
+            None
+            if is_none
+            else CollisionReportPlayer(
+                locations=player_locations,
+                at_fault=at_fault,
+                footprint=footprint,
+                velocity=(vel[0:2].copy(), float(vel[2])),
+                velocity_after=(vel[3:5].copy(), float(vel[5])),
+                energy_delta=energy,
+            )
+        )
+    at_times = _timestamps_from_floats(data["cr/at_time"], meta["decimal"])
+    reports = []
+    for i, normal in enumerate(data["cr/impact_normal"]):
+        reports.append(
+            CollisionReport(
+                players=players[i],
+                impact_point=impact_points[i],
+                impact_normal=None if np.isnan(normal).all() else normal.copy(),
+                at_time=at_times[i],
+            )
+        )
+    return reports
+
+
+# ----- files -----
+
+
+def _write(path: str, meta: dict, arrays: dict[str, np.ndarray], compress: bool):
+    meta = {"version": SIM_IO_VERSION, **meta}
+    arrays[_META] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+    with open(path, "wb") as f:
+        (np.savez_compressed if compress else np.savez)(f, **arrays)
+
+
+def _read_meta(data) -> dict:
+    meta = json.loads(data[_META].tobytes().decode())
+    if meta.get("version") != SIM_IO_VERSION:
+        raise ZValueError("Unsupported file version", version=meta.get("version"), supported=SIM_IO_VERSION)
+    return meta
+
+
+def save_sim_log(
+    path: str, log: SimLog, collision_reports: Optional[Sequence[CollisionReport]] = None, compress: bool = False
+):
+    """
+    Saves a simulation log (and optionally the collision reports) in a compact binary format.
+    Each field of each player is stored as columnar arrays: timestamps and values as float64 for numeric values
+    (e.g. states), pickled records otherwise (e.g. extra). Geometries of the collision reports are stored as WKB.
+    """
+    arrays: dict[str, np.ndarray] = {}
+    players = list(log)
+    meta: dict[str, Any] = {
+        "players": players,
+        "logs": [_encode_player_log(f"log/{i}", log[p], arrays) for i, p in enumerate(players)],
+    }
+    if collision_reports is not None:
+        meta["collision_reports"] = _encode_collision_reports(collision_reports, arrays)
+    _write(path, meta, arrays, compress)
+
+
+def load_sim_log(
+    path: str,
+    players: Optional[Collection[PlayerName]] = None,
+    from_ts: Optional[Timestamp] = None,
+    to_ts: Optional[Timestamp] = None,
+    columnar: bool = False,
+) -> SimLog:
+    """
+    Loads a log saved with `save_sim_log`. Only the arrays of the requested players are read (each one whole),
+    and only the records within the time window are unpickled or converted back to objects.
+    :param path:
+    :param players: the players to load, all if None
+    :param from_ts: start of the time window (included)
+    :param to_ts: end of the time window (included)
+    :param columnar: if True, the numeric fields are returned as `DgColumnarSequence`
+    :return:
+    """
+    sim_log = SimLog()
+    with np.load(path, allow_pickle=False) as data:
+        meta = _read_meta(data)
+        for i, player_name in enumerate(meta["players"]):
+            if players is not None and player_name not in players:
+                continue
+            sim_log[PlayerName(player_name)] = _decode_player_log(
+                f"log/{i}", meta["logs"][i], data, from_ts, to_ts, columnar
+            )
+    return sim_log
+
+
+def save_player_log(path: str, log: PlayerLog, compress: bool = False):
+    arrays: dict[str, np.ndarray] = {}
+    _write(path, {"player_log": _encode_player_log("player", log, arrays)}, arrays, compress)
+
+
+def load_player_log(
+    path: str, from_ts: Optional[Timestamp] = None, to_ts: Optional[Timestamp] = None, columnar: bool = False
+) -> PlayerLog:
+    with np.load(path, allow_pickle=False) as data:
+        meta = _read_meta(data)
+        return _decode_player_log("player", meta["player_log"], data, from_ts, to_ts, columnar)
+
+
+def save_collision_reports(path: str, collision_reports: Sequence[CollisionReport], compress: bool = False):
+    arrays: dict[str, np.ndarray] = {}
+    _write(path, {"collision_reports": _encode_collision_reports(collision_reports, arrays)}, arrays, compress)
+
+
+def load_collision_reports(path: str) -> list[CollisionReport]:
+    """Loads the collision reports saved with `save_collision_reports` or `save_sim_log`"""
+    with np.load(path, allow_pickle=False) as data:
+        meta = _read_meta(data)
+        if "collision_reports" not in meta:
+            raise ZValueError("The file does not contain collision reports", path=path)
+        return _decode_collision_reports(meta["collision_reports"], data)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from bisect import bisect_left
+from collections import deque
 from dataclasses import replace
+from typing import Mapping, Optional
 
 import numpy as np
 from commonroad_dc.pycrcc import Polygon as crPolygon
@@ -15,6 +16,40 @@ from dg_commons.sim.models import (
     extract_pose_from_state,
 )
 from dg_commons.sim.scenarios import DgScenario
+from dg_commons.utils_cache import IdentityCache
+
+
+class _CrObstaclesCache:
+    """
+    Conversions of the obstacles to CommonRoad polygons shared by all the `FovObsFilter`.
+    The static obstacles are converted once per scenario (kept as long as the scenario is alive),
+    the occupancies of the players once per step (the observations of the last step are kept).
+    """
+
+    def __init__(self):
+        self._static: IdentityCache[list[crPolygon]] = IdentityCache()
+        self._players: Optional[Mapping[PlayerName, PlayerObservations]] = None
+        self._occupancies: dict[PlayerName, list[crPolygon]] = {}
+
+    def static_obstacles(self, scenario: DgScenario) -> list[crPolygon]:
+        """The static obstacles of the scenario, the returned list is shared and must not be modified"""
+        # DgScenario is not hashable in general (CommonRoad scenarios are not), hence the identity
+        if scenario not in self._static:
+            self._static.put(
+                scenario, list(interleave([shapely2crPolygons(o.shape) for o in scenario.static_obstacles]))
+            )
+        return self._static.get(scenario)
+
+    def occupancy(self, players: Mapping[PlayerName, PlayerObservations], player: PlayerName) -> list[crPolygon]:
+        """The occupancy of the player among the observations of a step, the returned list must not be modified"""
+        if players is not self._players:
+            self._players, self._occupancies = players, {}
+        if player not in self._occupancies:
+            self._occupancies[player] = shapely2crPolygons(players[player].occupancy)
+        return self._occupancies[player]
+
+
+_CR_OBSTACLES = _CrObstaclesCache()
 
 
 class ObsFilter(ABC):
@@ -45,7 +80,9 @@ class FovObsFilter(ObsFilter):
     def __init__(self, sensor: Sensor):
         self.sensor: Sensor = sensor
         self._static_obstacles: list[crPolygon] = []
+        self._static_obstacles_of: Optional[DgScenario] = None
         self._tmp_debug: int = 0
+        self._cr_obstacles: _CrObstaclesCache = _CR_OBSTACLES
 
     def sense(self, scenario: DgScenario, full_obs: SimObservations, pov: PlayerName) -> SimObservations:
         """
@@ -58,17 +95,26 @@ class FovObsFilter(ObsFilter):
         # first update sensor pose
         self.sensor.pose = SE2Transform.from_SE2(extract_pose_from_state(full_obs.players[pov].state))
         # then filter
-        if not self._static_obstacles:
-            self._static_obstacles = list(interleave([shapely2crPolygons(o.shape) for o in scenario.static_obstacles]))
+        if self._static_obstacles_of is not scenario:
+            # the static obstacles are handed to the sensor once, their conversion is shared by all the filters
+            self._static_obstacles = self._cr_obstacles.static_obstacles(scenario)
+            self.sensor.set_static_obstacles(self._static_obstacles)
+            self._static_obstacles_of = scenario
 
         self._tmp_debug += 1
+        x, y = self.sensor.pose.p
+        r = self.sensor.range
         dynamic_obstacles = list(
-            interleave([shapely2crPolygons(p_obs.occupancy) for p, p_obs in full_obs.players.items() if p != pov])
+            interleave(
+                [
+                    self._cr_obstacles.occupancy(full_obs.players, p)
+                    for p, p_obs in full_obs.players.items()
+                    if p != pov and _bounds_within(p_obs.occupancy.bounds, x - r, y - r, x + r, y + r)
+                ]
+            )
         )
 
-        all_obstacles = self._static_obstacles + dynamic_obstacles
-
-        fov_poly = self.sensor.fov_as_polygon(all_obstacles)
+        fov_poly = self.sensor.fov_as_polygon_dynamic(dynamic_obstacles)
         new_players: dict[PlayerName, PlayerObservations] = {pov: full_obs.players[pov]}
         for p, p_obs in full_obs.players.items():
             if p == pov:
@@ -95,6 +141,11 @@ class FovObsFilter(ObsFilter):
         return replace(full_obs, players=fd(new_players))
 
 
+def _bounds_within(bounds: tuple[float, float, float, float], min_x, min_y, max_x, max_y) -> bool:
+    """Whether the bounding box (min x, min y, max x, max y) intersects the other one"""
+    return bounds[0] <= max_x and bounds[2] >= min_x and bounds[1] <= max_y and bounds[3] >= min_y
+
+
 class DelayedObsFilter(ObsFilter):
     """
     Wrapper around an ObsFilter that introduces delay/latency.
@@ -105,18 +156,20 @@ class DelayedObsFilter(ObsFilter):
         assert issubclass(type(obs_filter), ObsFilter)
         self.obs_filter = obs_filter
         self.latency = latency
-        self.obs_history: list[tuple[SimTime, SimObservations]] = []
+        # (shifted time, shifted observations), only the ones that can still be returned are kept
+        self.obs_history: deque[tuple[SimTime, SimObservations]] = deque()
 
     def sense(self, scenario: DgScenario, full_obs: SimObservations, pov: PlayerName) -> SimObservations:
         obs = self.obs_filter.sense(scenario, full_obs, pov)
         shifted_t = obs.time + self.latency
+        if self.obs_history and shifted_t < self.obs_history[-1][0]:
+            # time went backwards (e.g. a new simulation), the history does not apply anymore
+            self.obs_history.clear()
         self.obs_history.append((shifted_t, replace(obs, time=shifted_t)))
-        history_ts = self._get_obs_history_timestamps()
-        idx = bisect_left(history_ts, obs.time)
-        return self.obs_history[idx][1]
-
-    def _get_obs_history_timestamps(self) -> list[SimTime]:
-        return [_[0] for _ in self.obs_history]
+        # the time does not decrease, the observations shifted before the current time are not needed anymore
+        while self.obs_history[0][0] < obs.time:
+            self.obs_history.popleft()
+        return self.obs_history[0][1]
 
 
 class GhostObsFilter(ObsFilter):
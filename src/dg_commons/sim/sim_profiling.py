@@ -0,0 +1,137 @@
+import csv
+import json
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import Iterator, Optional
+
+import numpy as np
+
+from dg_commons import PlayerName
+
+__all__ = [
+    "SimStats",
+    "PhaseStats",
+    "measure",
+    "SENSING",
+    "AGENTS",
+    "MODELS_UPDATE",
+    "GOALS",
+    "ENV_COLLISIONS",
+    "PLAYERS_COLLISIONS",
+    "SWEPT_COLLISIONS",
+]
+
+SENSING = "sensing"
+"""The observation filters (`ObsFilter.sense`), per player"""
+AGENTS = "agents"
+"""The policies of the agents (`Agent.get_commands`), per player"""
+MODELS_UPDATE = "models_update"
+"""The update of the dynamics, per player (for the batched update per group of players with the same model)"""
+GOALS = "goals"
+"""The check of the missions and the removal of the players that fulfilled them"""
+ENV_COLLISIONS = "env_collisions"
+"""Collisions of the players with the static obstacles"""
+PLAYERS_COLLISIONS = "players_collisions"
+"""Collisions among the players"""
+SWEPT_COLLISIONS = "swept_collisions"
+"""Collisions in between two steps (see `SimParameters.continuous_collision`)"""
+
+_NOT_MEASURED = nullcontext()
+
+_ACTIVE: list["SimStats"] = []
+"""The stats of the simulations running in this process (innermost last), see `SimStats.activated`"""
+
+
+class PhaseStats:
+    """Durations [s] (perf_counter) of the executions of a phase"""
+
+    def __init__(self):
+        self.durations: list[float] = []
+
+    def summary(self) -> dict[str, float]:
+        d = np.array(self.durations)
+        p50, p90, p99 = np.percentile(d, [50, 90, 99]) if len(d) else (np.nan,) * 3
+        return {
+            "count": len(d),
+            "total_s": float(d.sum()),
+            "mean_s": float(d.mean()) if len(d) else np.nan,
+            "p50_s": float(p50),
+            "p90_s": float(p90),
+            "p99_s": float(p99),
+            "max_s": float(d.max()) if len(d) else np.nan,
+        }
+
+
+class SimStats:
+    """
+    Timing counters of the phases of the simulation loop, per player where it applies (player None otherwise).
+    Enabled with `SimParameters.profile`, when disabled the measurements are skipped altogether.
+    Other code can be measured with `measure` (e.g. parts of an agent), see the module-level `measure`.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.phases: dict[tuple[str, Optional[PlayerName]], PhaseStats] = {}
+
+    def add(self, phase: str, duration: float, player: Optional[PlayerName] = None):
+        """Records a duration [s] of the phase"""
+        key = (phase, player)
+        if key not in self.phases:
+            self.phases[key] = PhaseStats()
+        self.phases[key].durations.append(duration)
+
+    def measure(self, phase: str, player: Optional[PlayerName] = None):
+        """Context manager recording the duration of its body as an execution of the phase"""
+        if not self.enabled:
+            return _NOT_MEASURED
+        return self._measure(phase, player)
+
+    @contextmanager
+    def _measure(self, phase: str, player: Optional[PlayerName]) -> Iterator[None]:
+        tic = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, perf_counter() - tic, player)
+
+    @contextmanager
+    def activated(self) -> Iterator["SimStats"]:
+        """Within this context the module-level `measure` records in these stats"""
+        _ACTIVE.append(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE.remove(self)
+
+    def clear(self):
+        self.phases.clear()
+
+    def summary(self) -> list[dict]:
+        """One row per phase and player with the count, the total, the mean and the percentiles of the durations"""
+        return [
+            {"phase": phase, "player": player, **stats.summary()}
+            for (phase, player), stats in sorted(self.phases.items(), key=lambda kv: (kv[0][0], str(kv[0][1])))
+        ]
+
+    def to_json(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def to_csv(self, path: str):
+        rows = self.summary()
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["phase", "player", *PhaseStats().summary()])
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def measure(phase: str, player: Optional[PlayerName] = None):
+    """
+    Context manager recording the duration of its body in the stats of the simulation running in this process.
+    Meant for the code of the agents, e.g. `with measure("planning", self.name): ...`.
+    It does nothing outside of a simulation, if the profiling is disabled, or in the workers of the
+    PROCESS_POOL agents execution.
+    """
+    if not _ACTIVE:
+        return _NOT_MEASURED
+    return _ACTIVE[-1].measure(phase, player)
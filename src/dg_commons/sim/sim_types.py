@@ -3,7 +3,15 @@ from typing import NewType, Sequence
 
 from dg_commons import DgSampledSequence, X, Color
 
-__all__ = ["SimTime", "ImpactLocation", "DrawableTrajectoryType"]
+__all__ = [
+    "SimTime",
+    "ImpactLocation",
+    "DrawableTrajectoryType",
+    "AgentsExecution",
+    "SEQUENTIAL",
+    "THREAD_POOL",
+    "PROCESS_POOL",
+]
 
 SimTime = Decimal
 """The time of the simulation time"""
@@ -12,3 +20,12 @@ ImpactLocation = NewType("ImpactLocation", str)
 DrawableTrajectoryType = Sequence[tuple[DgSampledSequence[X], Color]]
 """The interface for the supported visualisation of trajectories.
 Each trajectory shall come paired with a color, setting to None will pick the agent's color """
+
+AgentsExecution = NewType("AgentsExecution", str)
+"""How the simulator evaluates the commands of the agents at each step"""
+SEQUENTIAL = AgentsExecution("sequential")
+"""One agent after the other in the main process"""
+THREAD_POOL = AgentsExecution("thread_pool")
+"""Concurrently on a pool of threads, useful for agents releasing the GIL (e.g. calling numerical solvers)"""
+PROCESS_POOL = AgentsExecution("process_pool")
+"""Concurrently on persistent worker processes, each agent lives in one of the workers for the whole episode"""
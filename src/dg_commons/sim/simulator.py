@@ -2,22 +2,40 @@ from collections import defaultdict
 from copy import deepcopy
 from dataclasses import dataclass, field, replace
 from decimal import Decimal
-from itertools import combinations
-from time import perf_counter
-from typing import Mapping, MutableMapping, Optional
+from typing import Mapping, MutableMapping, Optional, Union
 
-from dg_commons import PlayerName, U, fd
+import numpy as np
+from shapely import GeometryCollection
+from shapely.geometry import Polygon
+from shapely.strtree import STRtree
+
+from dg_commons import PlayerName, U, X, fd
 from dg_commons.sim import CollisionReport, SimTime, logger
 from dg_commons.sim.agents.agent import Agent, TAgent
-from dg_commons.sim.collision_utils import CollisionException
+from dg_commons.sim.agents.executors import AgentsExecutor, SequentialAgentsExecutor, get_agents_executor
+from dg_commons.sim.collision_utils import CollisionException, first_contact_along_translation, time_of_impact
 from dg_commons.sim.goals import PlanningGoal, TPlanningGoal
+from dg_commons.sim.log_stream import StreamingPlayerLogger, init_log_stream
 from dg_commons.sim.models.obstacles_dyn import DynObstacleModel
 from dg_commons.sim.scenarios.structures import DgScenario
 from dg_commons.sim.sim_perception import IdObsFilter, ObsFilter
+from dg_commons.sim.sim_profiling import (
+    AGENTS,
+    ENV_COLLISIONS,
+    GOALS,
+    MODELS_UPDATE,
+    PLAYERS_COLLISIONS,
+    SENSING,
+    SWEPT_COLLISIONS,
+    SimStats,
+)
 from dg_commons.sim.simulator_structures import *
 from dg_commons.sim.simulator_structures import InitSimObservations
 from dg_commons.time import time_function
 
+_CCD_PENETRATION = 1e-2
+"""How far [m] the footprints are moved past the contact found by the continuous collision detection"""
+
 
 @dataclass
 class SimContext:
@@ -52,6 +70,8 @@ class SimContext:
     "The first collision time"
     description: str = ""
     "A string description for the specific simulation context"
+    stats: SimStats = field(default_factory=SimStats)
+    "Timing of the phases of the simulation loop, recorded if `SimParameters.profile` is set"
 
     def __post_init__(self):
         assert self.models.keys() == self.players.keys()
@@ -73,33 +93,51 @@ class Simulator:
         - A post-update function that checks the new states of all the models and resolves collisions
     """
 
-    # fixme check if this is okay once you have multiple simulators running together
-    last_observations: SimObservations = SimObservations(players=fd({}), time=Decimal(0))
-    last_get_commands_ts: SimTime = SimTime("-Infinity")
-    last_commands: dict[PlayerName, U] = {}
-    simlogger: dict[PlayerName, PlayerLogger] = {}
+    def __init__(self):
+        # the state of the simulator belongs to the instance, multiple simulators can run side by side
+        self.last_observations: SimObservations = SimObservations(players=fd({}), time=Decimal(0))
+        self.last_get_commands_ts: SimTime = SimTime("-Infinity")
+        self.last_commands: dict[PlayerName, U] = {}
+        self.simlogger: dict[PlayerName, Union[PlayerLogger, StreamingPlayerLogger]] = {}
+        self.agents_executor: AgentsExecutor = SequentialAgentsExecutor()
+        self.previous_states: dict[PlayerName, X] = {}
+        """The states before the last update, used for the continuous collision detection"""
+        self.previous_footprints: dict[PlayerName, Polygon] = {}
+        """The footprints before the last update, used for the continuous collision detection"""
 
     @time_function
     def run(self, sim_context: SimContext):
         logger.info("~~~~~> Beginning simulation")
         # initialize the simulation
-        for player_name, player in sim_context.players.items():
-            scenario = deepcopy(sim_context.dg_scenario)
-            init_obs = InitSimObservations(
+        init_observations: dict[PlayerName, InitSimObservations] = {}
+        if sim_context.param.log_dir is not None:
+            init_log_stream(sim_context.param.log_dir)
+        # the scenario and the goals are shared with the agents (read-only), unless they get their own copies
+        maybe_copy = deepcopy if sim_context.param.copy_init_observations else lambda x: x
+        for player_name in sim_context.players:
+            init_observations[player_name] = InitSimObservations(
                 my_name=player_name,
                 seed=sim_context.seed,
-                dg_scenario=scenario,
-                goal=deepcopy(sim_context.missions.get(player_name)),
+                dg_scenario=maybe_copy(sim_context.dg_scenario),
+                goal=maybe_copy(sim_context.missions.get(player_name)),
                 model_geometry=sim_context.models[player_name].model_geometry,
                 model_params=sim_context.models[player_name].model_params,
             )
-            player.on_episode_init(init_obs)
-            self.simlogger[player_name] = PlayerLogger()
-        # actual simulation loop
-        while not sim_context.sim_terminated:
-            self.pre_update(sim_context)
-            self.update(sim_context)
-            self.post_update(sim_context)
+            sim_context.models[player_name].integrator = sim_context.param.integrator
+            if sim_context.param.log_dir is None:
+                self.simlogger[player_name] = PlayerLogger()
+            else:
+                self.simlogger[player_name] = StreamingPlayerLogger(sim_context.param.log_dir, player_name)
+        self.agents_executor = get_agents_executor(sim_context.param.agents_execution, sim_context.param.n_workers)
+        sim_context.stats.enabled = sim_context.param.profile
+        with self.agents_executor, sim_context.stats.activated():
+            self.agents_executor.on_episode_init(sim_context.players, init_observations)
+            # actual simulation loop
+            while not sim_context.sim_terminated:
+                self.pre_update(sim_context)
+                self.update(sim_context)
+                self.post_update(sim_context)
+        self.agents_executor = SequentialAgentsExecutor()
         logger.info("<~~~~~ Completed simulation")
         for player_name in sim_context.models:
             sim_context.log[player_name] = self.simlogger[player_name].as_sequence()
@@ -127,33 +165,66 @@ class Simulator:
 
     def update(self, sim_context: SimContext):
         """The real step of the simulation"""
-        # fixme this can be parallelized later with ProcessPoolExecutor?
         t = sim_context.time
-        for player_name, agent in sim_context.players.items():
+        need_commands = self._need_to_update_commands(sim_context)
+        observations: dict[PlayerName, SimObservations] = {}
+        if sim_context.param.continuous_collision:
+            self.previous_states, self.previous_footprints = {}, {}
+        for player_name in sim_context.players:
             state = sim_context.models[player_name].get_state()
             self.simlogger[player_name].states.add(t=t, v=state)
-            if self._need_to_update_commands(sim_context):
-                p_observations = sim_context.sensors[player_name].sense(
-                    sim_context.dg_scenario, self.last_observations, player_name
-                )
-                tic = perf_counter()
-                cmds = agent.get_commands(p_observations)
-                toc = perf_counter()
-                self.last_commands[player_name] = cmds
-                self.simlogger[player_name].commands.add(t=t, v=cmds)
-                self.simlogger[player_name].info.add(t=t, v=toc - tic)
-                extra = agent.on_get_extra()
-                if extra is not None:
-                    self.simlogger[player_name].extra.add(t=t, v=extra)
-            cmds = self.last_commands[player_name]
-            model = sim_context.models[player_name]
-            model.update(cmds, dt=sim_context.param.dt)
-            logger.debug(f"Update function, sim time {sim_context.time:.2f}, player: {player_name}")
-            logger.debug(f"New state {model.get_state()} reached applying {cmds}")
-        if self._need_to_update_commands(sim_context):
+            if sim_context.param.continuous_collision:
+                self.previous_states[player_name] = state
+                self.previous_footprints[player_name] = sim_context.models[player_name].get_footprint()
+            if need_commands:
+                with sim_context.stats.measure(SENSING, player_name):
+                    observations[player_name] = sim_context.sensors[player_name].sense(
+                        sim_context.dg_scenario, self.last_observations, player_name
+                    )
+        if need_commands:
+            # the agents might be evaluated concurrently, see SimParameters.agents_execution
+            outputs = self.agents_executor.get_commands(sim_context.players, observations)
+            for player_name, output in outputs.items():
+                self.last_commands[player_name] = output.commands
+                self.simlogger[player_name].commands.add(t=t, v=output.commands)
+                self.simlogger[player_name].info.add(t=t, v=output.elapsed)
+                if sim_context.stats.enabled:
+                    sim_context.stats.add(AGENTS, output.elapsed, player_name)
+                if output.extra is not None:
+                    self.simlogger[player_name].extra.add(t=t, v=output.extra)
+        if sim_context.param.batch_update:
+            self._batch_update_models(sim_context)
+        else:
+            for player_name in sim_context.players:
+                cmds = self.last_commands[player_name]
+                model = sim_context.models[player_name]
+                with sim_context.stats.measure(MODELS_UPDATE, player_name):
+                    model.update(cmds, dt=sim_context.param.dt)
+                logger.debug(f"Update function, sim time {sim_context.time:.2f}, player: {player_name}")
+                logger.debug(f"New state {model.get_state()} reached applying {cmds}")
+        if need_commands:
             self.last_get_commands_ts = t
         return
 
+    def _batch_update_models(self, sim_context: SimContext):
+        """Steps the models of the active players grouping them by model class.
+        The classes that do not provide batch dynamics are updated one by one."""
+        groups: dict[type, list[PlayerName]] = defaultdict(list)
+        for player_name in sim_context.players:
+            groups[type(sim_context.models[player_name])].append(player_name)
+        for model_type, player_names in groups.items():
+            models = [sim_context.models[p] for p in player_names]
+            commands = [self.last_commands[p] for p in player_names]
+            batch_dynamics = model_type.get_batch_dynamics(models)
+            if batch_dynamics is None:
+                for player_name, model, cmds in zip(player_names, models, commands):
+                    with sim_context.stats.measure(MODELS_UPDATE, player_name):
+                        model.update(cmds, dt=sim_context.param.dt)
+            else:
+                with sim_context.stats.measure(MODELS_UPDATE):
+                    batch_dynamics.update(commands, dt=sim_context.param.dt, integrator=sim_context.param.integrator)
+            logger.debug(f"Update function, sim time {sim_context.time:.2f}, players: {player_names}")
+
     def post_update(self, sim_context: SimContext):
         """
         Here all the operations that happen after we have stepped the simulation, e.g. collision checking
@@ -161,14 +232,21 @@ class Simulator:
         # after all the computations advance simulation time
         sim_context.time += sim_context.param.dt
         # remove finished players
-        self._remove_finished_players(sim_context)
+        with sim_context.stats.measure(GOALS):
+            self._remove_finished_players(sim_context)
         # check if the simulation is over
         self._maybe_terminate_simulation(sim_context)
         if sim_context.sim_terminated:
             return
         # collision checking
-        _ = self._check_collisions_with_environment(sim_context)
-        _ = self._check_collisions_among_players(sim_context)
+        with sim_context.stats.measure(ENV_COLLISIONS):
+            _ = self._check_collisions_with_environment(sim_context)
+        with sim_context.stats.measure(PLAYERS_COLLISIONS):
+            _ = self._check_collisions_among_players(sim_context)
+        if sim_context.param.continuous_collision:
+            with sim_context.stats.measure(SWEPT_COLLISIONS):
+                _ = self._check_swept_collisions_with_environment(sim_context)
+                _ = self._check_swept_collisions_among_players(sim_context)
         return
 
     @staticmethod
@@ -224,6 +302,29 @@ class Simulator:
                         sim_context.first_collision_ts = sim_context.time
         return collision
 
+    @staticmethod
+    def _colliding_pairs(sim_context: SimContext) -> list[tuple[PlayerName, PlayerName]]:
+        """
+        Returns the pairs of active players whose footprints intersect, in the same order as
+        `combinations(sim_context.players, 2)`.
+        The footprints are computed once and the candidate pairs come from a bounding-box query on a STRtree,
+        only these are checked exactly.
+        """
+        players = list(sim_context.players)
+        if len(players) < 2:
+            return []
+        footprints = [sim_context.models[p].get_footprint() for p in players]
+        tree = STRtree(footprints)
+        idx_a, idx_b = tree.query(footprints)
+        candidates = idx_a < idx_b
+        idx_a, idx_b = idx_a[candidates], idx_b[candidates]
+        order = np.lexsort((idx_b, idx_a))
+        return [
+            (players[i], players[j])
+            for i, j in zip(idx_a[order], idx_b[order])
+            if footprints[i].intersects(footprints[j])
+        ]
+
     @staticmethod
     def _check_collisions_among_players(sim_context: SimContext) -> bool:
         """
@@ -236,21 +337,148 @@ class Simulator:
         )
 
         collision = False
-        for p1, p2 in combinations(sim_context.players, 2):
-            a_shape = sim_context.models[p1].get_footprint()
-            b_shape = sim_context.models[p2].get_footprint()
-            if a_shape.intersects(b_shape):
-                try:
-                    report: Optional[CollisionReport] = resolve_collision(p1, p2, sim_context)
-                except CollisionException as e:
-                    logger.warn(f"Failed to resolve collision between {p1} and {p2} because:\n{e.args}")
-                    report = CollisionReport.get_empty(players={p1: None, p2: None}, at_time=sim_context.time)
-                if report is not None:
-                    logger.debug(f"Detected a collision between {p1} and {p2}")
-                    collision = True
-                    if report.at_time < sim_context.first_collision_ts:
-                        sim_context.first_collision_ts = report.at_time
-                    sim_context.collision_reports.append(report)
+        for p1, p2 in Simulator._colliding_pairs(sim_context):
+            try:
+                report: Optional[CollisionReport] = resolve_collision(p1, p2, sim_context)
+            except CollisionException as e:
+                logger.warn(f"Failed to resolve collision between {p1} and {p2} because:\n{e.args}")
+                report = CollisionReport.get_empty(players={p1: None, p2: None}, at_time=sim_context.time)
+            if report is not None:
+                logger.debug(f"Detected a collision between {p1} and {p2}")
+                collision = True
+                if report.at_time < sim_context.first_collision_ts:
+                    sim_context.first_collision_ts = report.at_time
+                sim_context.collision_reports.append(report)
+        return collision
+
+    def _rewind(self, sim_context: SimContext, player: PlayerName, fraction: float) -> X:
+        """Moves the player back to where it was at the given fraction of the last step, returns its current state"""
+        model = sim_context.models[player]
+        state = model.get_state()
+        model.set_state(self.previous_states[player] * (1 - fraction) + state * fraction)
+        return state
+
+    @staticmethod
+    def _time_at_fraction(sim_context: SimContext, fraction: float) -> SimTime:
+        """The simulation time at the given fraction of the last step"""
+        return sim_context.time - sim_context.param.dt * (1 - SimTime(f"{fraction:.6f}"))
+
+    def _swept_footprints(self, sim_context: SimContext) -> dict[PlayerName, tuple[Polygon, Polygon, np.ndarray]]:
+        """Previous footprint, footprint swept during the last step (convex hull) and displacement of the players"""
+        swept = {}
+        for p in sim_context.players:
+            if p not in self.previous_footprints:
+                continue
+            previous, current = self.previous_footprints[p], sim_context.models[p].get_footprint()
+            displacement = np.array(current.centroid.coords[0]) - np.array(previous.centroid.coords[0])
+            swept[p] = (previous, GeometryCollection([previous, current]).convex_hull, displacement)
+        return swept
+
+    def _check_swept_collisions_among_players(self, sim_context: SimContext) -> bool:
+        """
+        Continuous collision detection among players, it finds the collisions that happened in between two steps
+        (tunneling). The footprints swept during the step are intersected, the time of impact of the candidate pairs
+        is solved exactly assuming that the footprints translated during the step (`time_of_impact`).
+        The players involved are moved back to the time of impact and the collision is resolved there.
+        Pairs that overlap at the beginning or at the end of the step are left to `_check_collisions_among_players`.
+        :return: True if at least one collision happened, False otherwise
+        """
+        from dg_commons.sim.collision import resolve_collision  # import here to avoid circular imports
+
+        swept = self._swept_footprints(sim_context)
+        players = list(swept)
+        if len(players) < 2:
+            return False
+        tree = STRtree([swept[p][1] for p in players])
+        idx_a, idx_b = tree.query([swept[p][1] for p in players], predicate="intersects")
+        impacts: list[tuple[float, PlayerName, PlayerName]] = []
+        for i, j in zip(idx_a.tolist(), idx_b.tolist()):
+            if i >= j:
+                continue
+            a, b = players[i], players[j]
+            (a_previous, _, a_displacement), (b_previous, _, b_displacement) = swept[a], swept[b]
+            if a_previous.intersects(b_previous):
+                continue
+            if sim_context.models[a].get_footprint().intersects(sim_context.models[b].get_footprint()):
+                continue
+            rel_displacement = b_displacement - a_displacement
+            fraction = time_of_impact(a_previous, b_previous, rel_displacement, max_time=1)
+            if np.isfinite(fraction):
+                # slightly after the contact, the footprints need to overlap for resolving the collision
+                fraction += _CCD_PENETRATION / max(float(np.linalg.norm(rel_displacement)), _CCD_PENETRATION)
+                impacts.append((min(fraction, 1.0), a, b))
+
+        collision = False
+        rewound: set[PlayerName] = set()
+        for fraction, a, b in sorted(impacts):
+            if a in rewound or b in rewound:
+                continue
+            at_time = self._time_at_fraction(sim_context, fraction)
+            a_state, b_state = self._rewind(sim_context, a, fraction), self._rewind(sim_context, b, fraction)
+            try:
+                report: Optional[CollisionReport] = resolve_collision(a, b, sim_context, at_time=at_time)
+            except CollisionException as e:
+                logger.warn(f"Failed to resolve the swept collision between {a} and {b} because:\n{e.args}")
+                report = CollisionReport.get_empty(players={a: None, b: None}, at_time=at_time)
+            if report is None:
+                sim_context.models[a].set_state(a_state)
+                sim_context.models[b].set_state(b_state)
+                continue
+            logger.debug(f"Detected a collision between {a} and {b} in between two steps")
+            rewound.update((a, b))
+            collision = True
+            if report.at_time < sim_context.first_collision_ts:
+                sim_context.first_collision_ts = report.at_time
+            sim_context.collision_reports.append(report)
+        return collision
+
+    def _check_swept_collisions_with_environment(self, sim_context: SimContext) -> bool:
+        """
+        Continuous collision detection with the static obstacles, see `_check_swept_collisions_among_players`.
+        The obstacles can be non-convex, the first contact is searched along the translation of the footprint
+        (`first_contact_along_translation`).
+        :return: True if at least one collision happened, False otherwise
+        """
+        from dg_commons.sim.collision import (
+            resolve_collision_with_environment,  # import here to avoid circular imports
+        )
+
+        collision = False
+        env_obstacles = sim_context.dg_scenario.strtree_obstacles
+        for p, (previous, swept, displacement) in self._swept_footprints(sim_context).items():
+            p_model = sim_context.models[p]
+            if isinstance(p_model, DynObstacleModel):
+                continue
+            current = p_model.get_footprint()
+            impacts = []
+            for idx in env_obstacles.query(swept, predicate="intersects"):
+                sobstacle = sim_context.dg_scenario.static_obstacles[idx]
+                if previous.intersects(sobstacle.shape) or current.intersects(sobstacle.shape):
+                    continue
+                fraction = first_contact_along_translation(
+                    previous, displacement, sobstacle.shape, tol=_CCD_PENETRATION
+                )
+                if fraction is not None:
+                    impacts.append((fraction, idx))
+            if not impacts:
+                continue
+            fraction, idx = min(impacts)
+            sobstacle = sim_context.dg_scenario.static_obstacles[idx]
+            at_time = self._time_at_fraction(sim_context, fraction)
+            state = self._rewind(sim_context, p, fraction)
+            try:
+                report: Optional[CollisionReport] = resolve_collision_with_environment(p, p_model, sobstacle, at_time)
+            except CollisionException as e:
+                logger.warn(f"Failed to resolve the swept collision of {p} with environment because:\n{e.args}")
+                report = CollisionReport.get_empty(players={p: None}, at_time=at_time)
+            if report is None:
+                p_model.set_state(state)
+                continue
+            logger.debug(f"Player {p} collided with the environment in between two steps")
+            collision = True
+            sim_context.collision_reports.append(report)
+            if at_time < sim_context.first_collision_ts:
+                sim_context.first_collision_ts = at_time
         return collision
 
     def _remove_finished_players(self, sim_context: SimContext):
@@ -1,16 +1,19 @@
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Generic, Any, Mapping, Optional
+from functools import wraps
+from typing import Generic, Any, Callable, Mapping, Optional, Sequence
 
+import numpy as np
 from geometry import SE2value, T2value
 from shapely.geometry import Polygon
 from zuper_commons.types import ZValueError
 
 from dg_commons import DgSampledSequence, PlayerName, X, U
 from dg_commons.seq.sequence import DgSampledSequenceBuilder, Timestamp, UndefinedAtTime
-from dg_commons.sim import SimTime, ImpactLocation
+from dg_commons.sim import SimTime, ImpactLocation, AgentsExecution, SEQUENTIAL
 from dg_commons.sim.goals import TPlanningGoal
+from dg_commons.sim.models.integrators import Integrator, RK45, integrate
 from dg_commons.sim.models.model_structures import ModelType, TModelGeometry, TModelParameters
 from dg_commons.sim.scenarios import DgScenario
 
@@ -19,6 +22,7 @@ __all__ = [
     "InitSimObservations",
     "SimParameters",
     "SimModel",
+    "BatchDynamics",
     "SimLog",
     "PlayerLog",
     "LogEntry",
@@ -37,6 +41,37 @@ class SimParameters:
     """Max Simulation time overall [s]"""
     sim_time_after_collision: SimTime = SimTime(0)
     """The simulation time for which to continue after the first collision is detected [s]"""
+    batch_update: bool = False
+    """If True, the players sharing the same model class are stepped together with vectorized dynamics.
+    Models that do not support it (see `SimModel.get_batch_dynamics`) are still updated one by one."""
+    log_dir: Optional[str] = None
+    """If given, the logs are streamed to this directory while simulating (see `dg_commons.sim.log_stream`)
+    rather than being kept in memory, at the end `SimContext.log` reads them lazily from disk"""
+    agents_execution: AgentsExecution = SEQUENTIAL
+    """How to evaluate the agents at each step (see `dg_commons.sim.agents.executors`).
+    With THREAD_POOL or PROCESS_POOL the agents are evaluated concurrently, the commands do not depend on the
+    execution as long as the agents do not share state (e.g. a global random generator)."""
+    n_workers: Optional[int] = None
+    """Number of workers for the concurrent agents execution, defaults to the number of CPUs"""
+    integrator: Integrator = RK45
+    """The integration scheme used to update the models (see `dg_commons.sim.models.integrators`).
+    RK45 is the adaptive reference, the fixed-step schemes (EULER, RK4) and the closed-form EXACT_KINEMATIC
+    (kinematic bicycle only, the other models fall back to RK4) are considerably cheaper.
+    RK4 is accurate for kinematic models, yet the tyre forces of the dynamic vehicle model are stiff at low speeds
+    and a single RK4 step can deviate up to ~0.5 m/s. The fixed-step schemes might also overshoot the velocity limits.
+    For the batched update with RK45 the adaptive step is shared by the whole batch, the resulting states match the
+    per-player update within the solver tolerances (rtol=1e-3, atol=1e-6)."""
+    continuous_collision: bool = False
+    """If True, collisions happening in between two steps are detected as well (no tunneling of fast players).
+    The footprints swept during the step are checked, the players involved are moved back to the estimated time of
+    impact where the collision gets resolved. This allows larger steps (dt) without missing collisions."""
+    copy_init_observations: bool = False
+    """If True each agent receives its own deep copy of the scenario and of its goal on episode init.
+    By default they are shared by the agents and the simulator, the agents shall not modify them
+    (the fields of `DgScenario` and of the goals are frozen, the CommonRoad scenario inside is not)."""
+    profile: bool = False
+    """If True, the time spent in each phase of the simulation loop (sensing, agents, models update, goals and
+    collisions) is recorded per player in `SimContext.stats` (see `dg_commons.sim.sim_profiling`)"""
 
 
 @dataclass(frozen=True, unsafe_hash=True)
@@ -145,6 +180,41 @@ class SimLog(dict[PlayerName, PlayerLog]):
         return max([self[p].states.get_end() for p in self])
 
 
+def _invalidates_geometry(method: Callable) -> Callable:
+    """Decorates the methods of a SimModel that change its state"""
+
+    @wraps(method)
+    def wrapper(self: "SimModel", *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_geometry()
+
+    return wrapper
+
+
+def _cached_geometry(method: Callable) -> Callable:
+    """Decorates the geometry getters of a SimModel, the result is cached until the state changes"""
+
+    @wraps(method)
+    def wrapper(self: "SimModel"):
+        cache = self._geometry_cache
+        if cache is None:
+            cache = self._geometry_cache = {}
+        key = method.__name__
+        if key not in cache:
+            cache[key] = method(self)
+        value = cache[key]
+        # poses and meshes are mutable, shapely geometries are not
+        if isinstance(value, np.ndarray):
+            return value.copy()
+        if isinstance(value, dict):
+            return dict(value)
+        return value
+
+    return wrapper
+
+
 class SimModel(ABC, Generic[X, U]):
     _state: X
     """State of the model"""
@@ -152,6 +222,27 @@ class SimModel(ABC, Generic[X, U]):
     """Type of the state"""
     has_collided: bool = False
     """Whether or not the object has already collided"""
+    integrator: Integrator = RK45
+    """The integration scheme used by `update`, the simulator sets it according to `SimParameters.integrator`"""
+    _state_version: int = 0
+    """Incremented at every change of the state via `update`, `set_state` or `set_velocity`"""
+    _geometry_cache: Optional[dict[str, Any]] = None
+    """The footprint, mesh and pose computed at the current state version"""
+
+    def __init_subclass__(cls, **kwargs):
+        """The geometry of the subclasses is computed once per state version.
+        State changes need to go through `update`, `set_state` or `set_velocity` (not `_state` directly)."""
+        super().__init_subclass__(**kwargs)
+        for name in ("update", "set_state", "set_velocity"):
+            if name in cls.__dict__:
+                setattr(cls, name, _invalidates_geometry(cls.__dict__[name]))
+        for name in ("get_footprint", "get_mesh", "get_pose"):
+            if name in cls.__dict__:
+                setattr(cls, name, _cached_geometry(cls.__dict__[name]))
+
+    def _invalidate_geometry(self):
+        self._state_version += 1
+        self._geometry_cache = None
 
     @abstractmethod
     def update(self, commands: U, dt: SimTime):
@@ -208,9 +299,48 @@ class SimModel(ABC, Generic[X, U]):
     def set_state(self, new_state: X):
         # logger.warn("Setting a new state to simulation model, this is a dangerous operation")
         self._state = new_state
+        self._invalidate_geometry()
 
     @abstractmethod
     def get_extra_collision_friction_acc(
         self,
     ) -> tuple[float, float, float]:
         pass
+
+    @classmethod
+    def get_batch_dynamics(cls, models: Sequence["SimModel"]) -> Optional["BatchDynamics"]:
+        """Returns the vectorized dynamics for a group of models of this exact class.
+        The default returns None, i.e. the models do not support batched updates and get updated one by one."""
+        return None
+
+
+class BatchDynamics(ABC, Generic[X, U]):
+    """Vectorized dynamics for a group of models of the same class.
+    States and commands of the n models are stacked row-wise in arrays of shape (n, n_states) and (n, n_commands),
+    so that they can be integrated all together in a single call."""
+
+    def __init__(self, models: Sequence[SimModel[X, U]]):
+        self.models: list[SimModel[X, U]] = list(models)
+
+    @abstractmethod
+    def commands_as_array(self, commands: Sequence[U]) -> np.ndarray:
+        """Stacks the commands of the models, shape (n, n_commands)"""
+        pass
+
+    @abstractmethod
+    def dynamics(self, x: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """Returns the stacked state derivatives for the stacked states and commands"""
+        pass
+
+    def step(self, x0: np.ndarray, u: np.ndarray, dt: float, integrator: Integrator) -> np.ndarray:
+        """Returns the stacked states after dt, override it to provide closed-form updates"""
+        return integrate(lambda x: self.dynamics(x, u), x0, dt, method=integrator)
+
+    def update(self, commands: Sequence[U], dt: SimTime, integrator: Integrator = RK45):
+        """Equivalent to calling `update` on each model, but integrating all the models together"""
+        assert len(commands) == len(self.models)
+        x0 = np.stack([model._state.as_ndarray() for model in self.models])
+        u = self.commands_as_array(commands)
+        x1 = self.step(x0, u, float(dt), integrator)
+        for model, x in zip(self.models, x1):
+            model.set_state(type(model._state).from_array(x))
@@ -0,0 +1,32 @@
+import weakref
+from typing import Any, Generic, Optional, TypeVar
+
+__all__ = ["IdentityCache"]
+
+V = TypeVar("V")
+
+
+class IdentityCache(Generic[V]):
+    """
+    Values computed from objects by their identity, e.g. for the objects that are not hashable (CommonRoad scenarios).
+    A value is kept as long as its object is alive, so that the id of the object cannot be reused meanwhile.
+    """
+
+    def __init__(self):
+        self._values: dict[int, V] = {}
+
+    def get(self, obj: Any) -> Optional[V]:
+        """The value of the object, None if there is none"""
+        return self._values.get(id(obj))
+
+    def put(self, obj: Any, value: V):
+        """Sets the value of the object (replacing the previous one, if any)"""
+        if id(obj) not in self._values:
+            weakref.finalize(obj, self._values.pop, id(obj), None)
+        self._values[id(obj)] = value
+
+    def __contains__(self, obj: Any) -> bool:
+        return id(obj) in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -0,0 +1,14 @@
+from time import perf_counter
+from typing import Callable
+
+__all__ = ["timeit"]
+
+
+def timeit(fun: Callable[[], object], repeat: int) -> float:
+    """The best wall time [s] of `repeat` calls of fun, the measure used by all the benchmarks"""
+    best = float("inf")
+    for _ in range(repeat):
+        tic = perf_counter()
+        fun()
+        best = min(best, perf_counter() - tic)
+    return best
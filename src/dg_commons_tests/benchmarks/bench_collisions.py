@@ -0,0 +1,59 @@
+"""
+Scaling of the player-vs-player collision checking of the simulator, and resolution of the collisions found.
+Run with `python -m dg_commons_tests.benchmarks.bench_collisions`.
+"""
+
+from copy import deepcopy
+from time import perf_counter
+
+from dg_commons import PlayerName
+from dg_commons.sim.collision import resolve_collision
+from dg_commons.sim.collision_utils import CollisionException
+from dg_commons.sim.simulator import SimContext, Simulator
+from dg_commons_tests.benchmarks import timeit
+from dg_commons_tests.fixtures import all_colliding_pairs, get_dense_traffic
+
+__all__ = ["run"]
+
+
+def _time_resolve(sim_context: SimContext, pairs: list[tuple[PlayerName, PlayerName]], repeat: int) -> float:
+    """Resolving the collisions changes the states, each repetition resolves them on a fresh copy"""
+    best = float("inf")
+    for _ in range(repeat):
+        ctx = deepcopy(sim_context)
+        tic = perf_counter()
+        for p1, p2 in pairs:
+            try:
+                resolve_collision(p1, p2, ctx)
+            except CollisionException:
+                # unsupported geometries, skipped as in the simulator
+                pass
+        best = min(best, perf_counter() - tic)
+    return best
+
+
+def run(n_players: tuple[int, ...] = (10, 30, 100, 300, 1000), repeat: int = 3) -> list[dict]:
+    results = []
+    for n in n_players:
+        sim_context = get_dense_traffic(n)
+        broad_phase = Simulator._colliding_pairs(sim_context)
+        assert broad_phase == all_colliding_pairs(sim_context)
+        results.append(
+            {
+                "n_players": n,
+                "colliding_pairs": len(broad_phase),
+                "broad_phase_s": timeit(lambda: Simulator._colliding_pairs(sim_context), repeat),
+                "all_pairs_s": timeit(lambda: all_colliding_pairs(sim_context), repeat if n <= 300 else 1),
+                "resolve_s": _time_resolve(sim_context, broad_phase, repeat),
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    for r in run():
+        print(
+            f"{r['n_players']:5d} players, {r['colliding_pairs']:4d} colliding pairs: "
+            f"broad phase {1e3 * r['broad_phase_s']:9.2f} ms, all pairs {1e3 * r['all_pairs_s']:9.2f} ms, "
+            f"resolution {1e3 * r['resolve_s']:9.2f} ms"
+        )
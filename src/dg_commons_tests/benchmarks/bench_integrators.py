@@ -0,0 +1,68 @@
+"""
+Accuracy and throughput of the integrators available for `SimModel.update`.
+Run with `python -m dg_commons_tests.benchmarks.bench_integrators`.
+"""
+
+from copy import deepcopy
+from decimal import Decimal as D
+from time import perf_counter
+
+import numpy as np
+
+from dg_commons.sim.models.integrators import EULER, EXACT_KINEMATIC, RK4, RK45, Integrator, integrate
+from dg_commons_tests.fixtures import get_random_vehicles
+
+__all__ = ["run"]
+
+
+def _reference(models, commands, dt: D, n_steps: int) -> np.ndarray:
+    """States after n_steps steps, integrated with RK4 and a very small step"""
+    batch_dynamics = type(models[0]).get_batch_dynamics(deepcopy(models))
+    x = np.stack([m.get_state().as_ndarray() for m in models])
+    u = batch_dynamics.commands_as_array(commands)
+    for _ in range(n_steps):
+        # friction after collisions is frozen at the beginning of each step, as in the simulation
+        x = integrate(lambda y: batch_dynamics.dynamics(y, u), x, float(dt), method=RK4, n_steps=200)
+    return x
+
+
+def _run_integrator(models, commands, integrator: Integrator, dt: D, n_steps: int) -> tuple[np.ndarray, float]:
+    models = deepcopy(models)
+    for m in models:
+        m.integrator = integrator
+    t0 = perf_counter()
+    for _ in range(n_steps):
+        for m, cmds in zip(models, commands):
+            m.update(cmds, dt)
+    elapsed = perf_counter() - t0
+    return np.stack([m.get_state().as_ndarray() for m in models]), elapsed
+
+
+def run(n_players: int = 30, n_steps: int = 20, dt: D = D("0.05"), seed: int = 0) -> list[dict]:
+    results = []
+    for dyn in (False, True):
+        models, commands = get_random_vehicles(dyn, n=n_players, seed=seed)
+        x_ref = _reference(models, commands, dt, n_steps)
+        for integrator in (RK45, RK4, EULER, EXACT_KINEMATIC):
+            x, elapsed = _run_integrator(models, commands, integrator, dt, n_steps)
+            err = np.abs(x - x_ref)
+            results.append(
+                {
+                    "model": "VehicleModelDyn" if dyn else "VehicleModel",
+                    "integrator": integrator,
+                    "n_players": n_players,
+                    "n_steps": n_steps,
+                    "updates_per_s": n_players * n_steps / elapsed,
+                    "max_pos_err": float(np.max(err[:, :2])),
+                    "max_vx_err": float(np.max(err[:, 3])),
+                }
+            )
+    return results
+
+
+if __name__ == "__main__":
+    for r in run():
+        print(
+            f"{r['model']:>16} {r['integrator']:>16}: {r['updates_per_s']:10.0f} updates/s, "
+            f"max position error {r['max_pos_err']:.2e} m, max vx error {r['max_vx_err']:.2e} m/s"
+        )
@@ -0,0 +1,91 @@
+"""
+Lane poses on the lanes of a CommonRoad scenario and on synthetic lanes with more and more control points,
+closed-form projection (one by one and batched) vs numerical minimization.
+Run with `python -m dg_commons_tests.benchmarks.bench_lanes`.
+"""
+
+import numpy as np
+from geometry import SE2_from_translation_angle
+
+from dg_commons import SE2Transform
+from dg_commons.maps.lanes import DgLanelet, LaneCtrPoint
+from dg_commons.sim.scenarios import load_commonroad_scenario
+from dg_commons_tests.benchmarks import timeit
+
+__all__ = ["run"]
+
+
+def _queries(lane: DgLanelet, n: int, rng: np.random.Generator) -> list[np.ndarray]:
+    """Poses scattered around the center line"""
+    betas = rng.uniform(0, len(lane.control_points) - 1, n)
+    queries = []
+    for beta in betas:
+        q = lane.center_point(beta)
+        queries.append(q @ SE2_from_translation_angle(rng.normal(0, 1, 2), rng.normal(0, 0.3)))
+    return queries
+
+
+def get_winding_lane(n_control_points: int, spacing: float = 2.0) -> DgLanelet:
+    """A lane following a sine wave, with control points every `spacing` meters along x"""
+    x = spacing * np.arange(n_control_points)
+    y = 10 * np.sin(x / 30)
+    theta = np.arctan(np.cos(x / 30) / 3)
+    return DgLanelet([LaneCtrPoint(SE2Transform([xi, yi], ti), r=2) for xi, yi, ti in zip(x, y, theta)])
+
+
+def _timings(lanes: list[DgLanelet], n_queries: int, repeat: int, rng: np.random.Generator) -> dict:
+    queries = [(lane, q) for lane in lanes for q in _queries(lane, n_queries, rng)]
+
+    def closed_form():
+        for lane, q in queries:
+            lane.lane_pose_from_SE2_generic(q)
+
+    batches = [
+        (lane, np.array([[q[0, 2], q[1, 2], np.arctan2(q[1, 0], q[0, 0])] for q in _queries(lane, n_queries, rng)]))
+        for lane in lanes
+    ]
+
+    def batched():
+        for lane, poses in batches:
+            lane.lane_poses(poses)
+
+    def minimization():
+        for lane, q in queries:
+            lane.find_along_lane_closest_point_fast(q[:2, 2])
+
+    return {
+        "n_queries": len(queries),
+        "closed_form_s": timeit(closed_form, repeat),
+        "batched_s": timeit(batched, repeat),
+        "minimization_s": timeit(minimization, repeat),
+    }
+
+
+def run(
+    scenario_name: str = "USA_Lanker-1_1_T-1",
+    n_queries: int = 20,
+    n_control_points: tuple[int, ...] = (10, 100, 1000),
+    repeat: int = 3,
+) -> list[dict]:
+    """
+    :param n_queries: number of queries per lane
+    :param n_control_points: sizes of the synthetic lanes (see `get_winding_lane`)
+    """
+    scenario, _ = load_commonroad_scenario(scenario_name)
+    rng = np.random.default_rng(0)
+    lanes = [DgLanelet.from_commonroad_lanelet(lanelet) for lanelet in scenario.lanelet_network.lanelets]
+    results = [{"n_lanes": len(lanes), **_timings(lanes, n_queries, repeat, rng)}]
+    for n in n_control_points:
+        results.append({"n_control_points": n, **_timings([get_winding_lane(n)], n_queries, repeat, rng)})
+    return results
+
+
+if __name__ == "__main__":
+    for r in run():
+        lanes = f"{r['n_lanes']} lanes" if "n_lanes" in r else f"a lane of {r['n_control_points']} control points"
+        print(
+            f"{r['n_queries']} lane poses on {lanes}: "
+            f"closed form {1e6 * r['closed_form_s'] / r['n_queries']:8.1f} us/pose, "
+            f"batched by lane {1e6 * r['batched_s'] / r['n_queries']:8.1f} us/pose, "
+            f"minimize_scalar (closest point only) {1e6 * r['minimization_s'] / r['n_queries']:8.1f} us/pose"
+        )
@@ -0,0 +1,99 @@
+"""
+Road boundaries of growing maps (tiled copies of a CommonRoad scenario), vectorized pipeline vs the previous
+sequential differences, and `DgScenario` construction with the boundaries already built.
+Run with `python -m dg_commons_tests.benchmarks.bench_road_bounds`.
+"""
+
+import numpy as np
+from commonroad.scenario.lanelet import Lanelet, LaneletNetwork
+from commonroad.scenario.scenario import Scenario
+from shapely import MultiPolygon
+from shapely.geometry import LineString, Polygon
+from shapely.ops import unary_union
+
+from dg_commons.maps.road_bounds import _build_road_boundaries
+from dg_commons.sim.scenarios import load_commonroad_scenario
+from dg_commons.sim.scenarios.structures import DgScenario
+from dg_commons_tests.benchmarks import timeit
+
+__all__ = ["get_tiled_scenario", "run"]
+
+
+def get_tiled_scenario(n_tiles: int, scenario_name: str = "USA_Lanker-1_1_T-1") -> Scenario:
+    """The lanelets of the scenario copied over a grid of n_tiles x n_tiles"""
+    scenario, _ = load_commonroad_scenario(scenario_name)
+    lanelets = scenario.lanelet_network.lanelets
+    vertices = np.concatenate([lanelet.center_vertices for lanelet in lanelets])
+    size = vertices.max(axis=0) - vertices.min(axis=0) + 10
+    offset = max(lanelet.lanelet_id for lanelet in lanelets) + 1
+    tiled = []
+    for k, (i, j) in enumerate(np.ndindex(n_tiles, n_tiles)):
+        shift = size * (i, j)
+
+        def new_id(lanelet_id: int) -> int:
+            return lanelet_id + k * offset
+
+        for lanelet in lanelets:
+            tiled.append(
+                Lanelet(
+                    left_vertices=lanelet.left_vertices + shift,
+                    center_vertices=lanelet.center_vertices + shift,
+                    right_vertices=lanelet.right_vertices + shift,
+                    lanelet_id=new_id(lanelet.lanelet_id),
+                    predecessor=[new_id(p) for p in lanelet.predecessor],
+                    successor=[new_id(s) for s in lanelet.successor],
+                )
+            )
+    tiled_scenario = Scenario(dt=scenario.dt)
+    tiled_scenario.add_objects(LaneletNetwork.create_from_lanelet_list(tiled))
+    return tiled_scenario
+
+
+def _sequential_differences(scenario: Scenario, buffer: float = 0.1) -> list[LineString]:
+    """The previous implementation, each gate is removed from each exterior in turn, used as a reference"""
+    lane_polygons: list[Polygon] = []
+    gates = []
+    for lanelet in scenario.lanelet_network.lanelets:
+        lane_polygons.append(lanelet.polygon.shapely_object.buffer(buffer))
+        if len(lanelet.successor) == 0:
+            gates.append(LineString([lanelet.right_vertices[-1], lanelet.left_vertices[-1]]).buffer(buffer * 2))
+        if len(lanelet.predecessor) == 0:
+            gates.append(LineString([lanelet.right_vertices[0], lanelet.left_vertices[0]]).buffer(buffer * 2))
+    overall_poly = unary_union(lane_polygons)
+    if isinstance(overall_poly, Polygon):
+        overall_poly = MultiPolygon([overall_poly])
+    bounds = []
+    for geo in overall_poly.geoms:
+        bounds += list(geo.interiors)
+        ext_bounds = geo.exterior
+        for gate in gates:
+            ext_bounds = ext_bounds.difference(gate)
+        bounds += list(ext_bounds.geoms)
+    return bounds
+
+
+def run(n_tiles: tuple[int, ...] = (1, 2, 4, 6), repeat: int = 3) -> list[dict]:
+    results = []
+    for n in n_tiles:
+        scenario = get_tiled_scenario(n)
+        bounds, _ = _build_road_boundaries(scenario.lanelet_network, 0.1)
+        assert len(bounds) == len(_sequential_differences(scenario))
+        DgScenario(scenario, use_road_boundaries=True)
+        results.append(
+            {
+                "n_lanelets": len(scenario.lanelet_network.lanelets),
+                "vectorized_s": timeit(lambda: _build_road_boundaries(scenario.lanelet_network, 0.1), repeat),
+                "sequential_s": timeit(lambda: _sequential_differences(scenario), repeat if n <= 4 else 1),
+                "dg_scenario_cached_s": timeit(lambda: DgScenario(scenario, use_road_boundaries=True), repeat),
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    for r in run():
+        print(
+            f"{r['n_lanelets']:5d} lanelets: vectorized {1e3 * r['vectorized_s']:9.2f} ms, "
+            f"sequential differences {1e3 * r['sequential_s']:9.2f} ms, "
+            f"DgScenario (boundaries cached) {1e3 * r['dg_scenario_cached_s']:7.2f} ms"
+        )
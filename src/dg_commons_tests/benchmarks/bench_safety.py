@@ -0,0 +1,46 @@
+"""
+Safety metrics of a simulation log, iterative (`eval.safety`) vs array based (`eval.safety_vectorized`).
+Run with `python -m dg_commons_tests.benchmarks.bench_safety`.
+"""
+
+import pickle
+
+from dg_commons import PlayerName
+from dg_commons.eval.safety import get_min_dist, get_min_ttc_max_drac
+from dg_commons.eval.safety_vectorized import get_min_dist_vectorized, get_min_ttc_max_drac_vectorized
+from dg_commons_tests import REPO_DIR
+from dg_commons_tests.benchmarks import timeit
+
+__all__ = ["run"]
+
+
+def _load(name: str):
+    with open(REPO_DIR / "src/dg_commons_tests/test_eval/logs" / name, "rb") as f:
+        return pickle.load(f)
+
+
+def run(repeat: int = 3) -> list[dict]:
+    log, models, missions = _load("log.pickle"), _load("models.pickle"), _load("missions.pickle")
+    args = (log, models, missions, PlayerName("Ego"))
+    results = []
+    for metric, iterative, vectorized in [
+        ("min_dist", get_min_dist, get_min_dist_vectorized),
+        ("min_ttc_max_drac", get_min_ttc_max_drac, get_min_ttc_max_drac_vectorized),
+    ]:
+        results.append(
+            {
+                "metric": metric,
+                "n_players": len(log),
+                "iterative_s": timeit(lambda: iterative(*args), repeat),
+                "vectorized_s": timeit(lambda: vectorized(*args), repeat),
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    for r in run():
+        print(
+            f"{r['metric']:>16s} ({r['n_players']} players): "
+            f"iterative {1e3 * r['iterative_s']:9.2f} ms, vectorized {1e3 * r['vectorized_s']:9.2f} ms"
+        )
@@ -0,0 +1,50 @@
+"""
+Interpolation of sampled sequences of states with a growing number of samples,
+`DgSampledSequence.at_interp` (one by one and batched) vs `DgColumnarSequence.at_interp_array`.
+Run with `python -m dg_commons_tests.benchmarks.bench_sequences`.
+"""
+
+from decimal import Decimal as D
+
+import numpy as np
+
+from dg_commons import DgColumnarSequence, DgSampledSequence
+from dg_commons.sim.models.vehicle import VehicleState
+from dg_commons_tests.benchmarks import timeit
+
+__all__ = ["get_sequence", "run"]
+
+
+def get_sequence(n_samples: int, dt: D = D("0.1"), seed: int = 0) -> DgSampledSequence[VehicleState]:
+    rng = np.random.default_rng(seed)
+    values = [VehicleState.from_array(x) for x in rng.normal(0, 1, (n_samples, len(VehicleState.idx)))]
+    return DgSampledSequence[VehicleState](timestamps=[i * dt for i in range(n_samples)], values=values)
+
+
+def run(n_samples: tuple[int, ...] = (100, 1000, 10000, 100000), n_queries: int = 1000, repeat: int = 3) -> list[dict]:
+    results = []
+    rng = np.random.default_rng(0)
+    for n in n_samples:
+        seq = get_sequence(n)
+        columnar = DgColumnarSequence.from_sequence(seq)
+        ts = [D(f"{t:.3f}") for t in rng.uniform(float(seq.get_start()), float(seq.get_end()), n_queries)]
+        float_ts = np.array([float(t) for t in ts])
+        results.append(
+            {
+                "n_samples": n,
+                "n_queries": n_queries,
+                "at_interp_s": timeit(lambda: [seq.at_interp(t) for t in ts], repeat),
+                "at_interp_many_s": timeit(lambda: seq.at_interp_many(ts), repeat),
+                "columnar_s": timeit(lambda: columnar.at_interp_array(float_ts), repeat),
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    for r in run():
+        print(
+            f"{r['n_queries']} queries on {r['n_samples']:6d} samples: "
+            f"at_interp {1e3 * r['at_interp_s']:8.2f} ms, at_interp_many {1e3 * r['at_interp_many_s']:8.2f} ms, "
+            f"columnar {1e3 * r['columnar_s']:8.2f} ms"
+        )
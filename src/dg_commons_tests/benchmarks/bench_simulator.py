@@ -0,0 +1,60 @@
+"""
+Simulation of the vehicles of a CommonRoad scenario (lane following agents) for a growing number of players,
+with the time spent in each phase of the simulation loop (see `dg_commons.sim.sim_profiling`).
+Run with `python -m dg_commons_tests.benchmarks.bench_simulator`.
+"""
+
+from copy import deepcopy
+from decimal import Decimal as D
+from time import perf_counter
+
+from dg_commons import PlayerName
+from dg_commons.sim import SimParameters
+from dg_commons.sim.scenarios import load_commonroad_scenario
+from dg_commons.sim.scenarios.convert_from_commonroad import model_agent_from_dynamic_obstacle
+from dg_commons.sim.scenarios.structures import DgScenario
+from dg_commons.sim.simulator import SimContext, Simulator
+
+__all__ = ["get_scenario_traffic", "run"]
+
+
+def get_scenario_traffic(
+    n_players: int, n_steps: int, scenario_name: str = "USA_Lanker-1_1_T-1", dt: D = D("0.05")
+) -> SimContext:
+    """The first n_players dynamic obstacles of the scenario as lane following players, simulated for n_steps"""
+    scenario, _ = load_commonroad_scenario(scenario_name)
+    dg_scenario = DgScenario(scenario)
+    models, players = {}, {}
+    for dyn_obs in scenario.dynamic_obstacles[:n_players]:
+        name = PlayerName(f"P{dyn_obs.obstacle_id}")
+        models[name], players[name] = model_agent_from_dynamic_obstacle(
+            dyn_obs, scenario.lanelet_network, lanelet_index=dg_scenario.lanelet_index
+        )
+    param = SimParameters(dt=dt, dt_commands=2 * dt, max_sim_time=dt * (n_steps - 1), profile=True)
+    return SimContext(dg_scenario=dg_scenario, models=models, players=players, param=param)
+
+
+def run(n_players: tuple[int, ...] = (5, 10, 24), n_steps: int = 40, repeat: int = 3) -> list[dict]:
+    results = []
+    for n in n_players:
+        sim_context = get_scenario_traffic(n, n_steps)
+        best, best_context = float("inf"), None
+        for _ in range(repeat):
+            # the context is consumed by the simulation
+            ctx = deepcopy(sim_context)
+            tic = perf_counter()
+            Simulator().run(ctx)
+            elapsed = perf_counter() - tic
+            if elapsed < best:
+                best, best_context = elapsed, ctx
+        phases: dict[str, float] = {}
+        for row in best_context.stats.summary():
+            phases[f"{row['phase']}_s"] = phases.get(f"{row['phase']}_s", 0) + row["total_s"]
+        results.append({"n_players": len(sim_context.players), "n_steps": n_steps, "run_s": best, **phases})
+    return results
+
+
+if __name__ == "__main__":
+    for r in run():
+        phases = ", ".join(f"{k[:-2]} {1e3 * v:.1f} ms" for k, v in r.items() if k.endswith("_s") and k != "run_s")
+        print(f"{r['n_players']:3d} players, {r['n_steps']} steps: run {1e3 * r['run_s']:8.1f} ms ({phases})")
@@ -0,0 +1,51 @@
+"""
+Field of view among a growing number of obstacles, ray casting (`VisRangeSensor`) vs angular sweep (`SweepVisSensor`).
+Run with `python -m dg_commons_tests.benchmarks.bench_visibility`.
+"""
+
+import numpy as np
+from cytoolz import interleave
+from shapely import affinity
+from shapely.geometry import Point, Polygon
+
+from dg_commons import SE2Transform, shapely2crPolygons
+from dg_commons.perception.sensor import SweepVisSensor, VisRangeSensor
+from dg_commons_tests.benchmarks import timeit
+
+__all__ = ["get_obstacles", "run"]
+
+
+def get_obstacles(n_obstacles: int, side: float = 100, seed: int = 0) -> list[Polygon]:
+    """Boxes and discs with random poses over a square centered at the origin, away from the origin"""
+    rng = np.random.default_rng(seed)
+    obstacles = []
+    while len(obstacles) < n_obstacles:
+        center = rng.uniform(-side / 2, side / 2, 2)
+        if np.linalg.norm(center) < 5:
+            continue
+        if len(obstacles) % 2:
+            shape = affinity.rotate(Polygon([(-2, -1), (2, -1), (2, 1), (-2, 1)]), rng.uniform(0, 180))
+        else:
+            shape = Point(0, 0).buffer(rng.uniform(0.5, 2), quad_segs=4)
+        obstacles.append(affinity.translate(shape, *center))
+    return obstacles
+
+
+def run(n_obstacles: tuple[int, ...] = (10, 30, 100, 300, 1000), sensor_range: float = 50, repeat: int = 3):
+    results = []
+    for n in n_obstacles:
+        obstacles = list(interleave([shapely2crPolygons(o) for o in get_obstacles(n)]))
+        timings = {}
+        for name, sensor_type in [("ray_casting", VisRangeSensor), ("sweep", SweepVisSensor)]:
+            sensor = sensor_type(pose=SE2Transform([0, 0], 0), range=sensor_range)
+            timings[name] = timeit(lambda: sensor.fov_as_polygon(obstacles), repeat)
+        results.append({"n_obstacles": n, "range": sensor_range, **{f"{k}_s": v for k, v in timings.items()}})
+    return results
+
+
+if __name__ == "__main__":
+    for r in run():
+        print(
+            f"{r['n_obstacles']:5d} obstacles (range {r['range']:.0f}): "
+            f"ray casting {1e3 * r['ray_casting_s']:8.2f} ms, sweep {1e3 * r['sweep_s']:8.2f} ms"
+        )
@@ -0,0 +1,199 @@
+"""
+Benchmark suite of the hot paths: runs the `bench_*` modules at a given scale and writes the results as JSON,
+two results files (e.g. of two commits) can be compared to flag the regressions.
+Everything runs offline on the scenarios and logs bundled with the repository.
+Run with
+    `python -m dg_commons_tests.benchmarks.suite run [--scale quick|full] [--only lanes,safety] [-o results.json]`
+    `python -m dg_commons_tests.benchmarks.suite compare baseline.json results.json [--threshold 0.2]`
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Optional
+
+import numpy as np
+import shapely
+
+from dg_commons_tests import REPO_DIR
+
+__all__ = ["BENCHMARKS", "SCALES", "RESULTS_VERSION", "run_suite", "compare", "main"]
+
+RESULTS_VERSION = 1
+"""Version of the layout of the results files"""
+
+SCALES = ("quick", "full")
+"""The quick scale takes some seconds (e.g. for checking a change), the full one runs the modules with their defaults"""
+
+BENCHMARKS: dict[str, dict[str, dict[str, Any]]] = {
+    "collisions": {"quick": dict(n_players=(10, 100, 300)), "full": {}},
+    "integrators": {"quick": dict(n_players=10, n_steps=10), "full": {}},
+    "lanes": {"quick": dict(n_queries=5, n_control_points=(10, 100, 1000)), "full": {}},
+    "road_bounds": {"quick": dict(n_tiles=(1, 2), repeat=2), "full": {}},
+    "safety": {"quick": dict(repeat=2), "full": {}},
+    "sequences": {"quick": dict(n_samples=(100, 10000)), "full": {}},
+    "simulator": {"quick": dict(n_players=(5,), n_steps=20, repeat=2), "full": {}},
+    "visibility": {"quick": dict(n_obstacles=(10, 100)), "full": {}},
+}
+"""The keyword arguments of `run` of each module `bench_<name>` for each scale"""
+
+
+def _is_throughput(key: str) -> bool:
+    return key.endswith("_per_s")
+
+
+def _is_timing(key: str) -> bool:
+    return key.endswith("_s") and not _is_throughput(key)
+
+
+def _row_key(row: dict) -> tuple:
+    """The parameters identifying a result row: its integer and string fields that are not metrics"""
+    return tuple(
+        sorted(
+            (k, v)
+            for k, v in row.items()
+            if not (_is_timing(k) or _is_throughput(k)) and isinstance(v, (int, str)) and not isinstance(v, bool)
+        )
+    )
+
+
+def _metadata() -> dict[str, Any]:
+    def git(*args: str) -> Optional[str]:
+        try:
+            out = subprocess.run(["git", *args], cwd=REPO_DIR, capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return out.stdout.strip()
+
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": None if status is None else bool(status),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "shapely": shapely.__version__,
+    }
+
+
+def run_suite(scale: str = "quick", only: Optional[list[str]] = None) -> dict[str, Any]:
+    """
+    Runs the benchmarks at the given scale.
+    :param scale: one of `SCALES`
+    :param only: names of the benchmarks to run (keys of `BENCHMARKS`), all if None
+    :return: the results with the metadata of the run (commit, versions, machine)
+    """
+    if scale not in SCALES:
+        raise ValueError(f"Unknown scale {scale}, expected one of {SCALES}")
+    names = list(BENCHMARKS) if only is None else only
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks {sorted(unknown)}, expected some of {list(BENCHMARKS)}")
+    benchmarks = {}
+    for name in names:
+        module = importlib.import_module(f"dg_commons_tests.benchmarks.bench_{name}")
+        tic = perf_counter()
+        rows = module.run(**BENCHMARKS[name][scale])
+        print(f"{name}: {len(rows)} results in {perf_counter() - tic:.1f} s", file=sys.stderr)
+        benchmarks[name] = rows
+    return {"version": RESULTS_VERSION, "scale": scale, "metadata": _metadata(), "benchmarks": benchmarks}
+
+
+def compare(baseline: dict, results: dict, threshold: float = 0.2, min_time: float = 1e-4) -> list[dict]:
+    """
+    Compares the metrics of the rows with the same parameters in both results.
+    Timings (`*_s`) regress if they grow, throughputs (`*_per_s`) if they shrink, by more than the threshold.
+    :param threshold: relative change considered significant
+    :param min_time: timings [s] below this in both results are too noisy to be compared
+    :return: one entry per compared metric with the baseline and new values, their ratio (> 1 is slower)
+        and the status ("regression", "improvement" or "ok")
+    """
+    comparisons = []
+    for name in sorted(baseline["benchmarks"].keys() & results["benchmarks"].keys()):
+        baseline_rows = {_row_key(row): row for row in baseline["benchmarks"][name]}
+        for row in results["benchmarks"][name]:
+            key = _row_key(row)
+            if key not in baseline_rows:
+                continue
+            for metric, new in row.items():
+                old = baseline_rows[key].get(metric)
+                if old is None or not (_is_timing(metric) or _is_throughput(metric)):
+                    continue
+                if _is_timing(metric) and max(old, new) < min_time:
+                    continue
+                ratio = old / new if _is_throughput(metric) else new / old
+                status = (
+                    "regression" if ratio > 1 + threshold else "improvement" if ratio < 1 / (1 + threshold) else "ok"
+                )
+                comparisons.append(
+                    {
+                        "benchmark": name,
+                        "params": dict(key),
+                        "metric": metric,
+                        "baseline": old,
+                        "new": new,
+                        "ratio": ratio,
+                        "status": status,
+                    }
+                )
+    return comparisons
+
+
+def _load(path: str) -> dict:
+    with open(path) as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path} has version {results.get('version')}, expected {RESULTS_VERSION}")
+    return results
+
+
+def main(args: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_parser = sub.add_parser("run", help="run the benchmarks and write the results as JSON")
+    run_parser.add_argument("--scale", choices=SCALES, default="quick")
+    run_parser.add_argument("--only", help="comma separated names of the benchmarks", default=None)
+    run_parser.add_argument("-o", "--output", help="results file, printed if not given", default=None)
+    compare_parser = sub.add_parser("compare", help="compare two results files, fails if anything regressed")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("--threshold", type=float, default=0.2)
+    compare_parser.add_argument("--min-time", type=float, default=1e-4)
+    parsed = parser.parse_args(args)
+
+    if parsed.command == "run":
+        results = run_suite(parsed.scale, None if parsed.only is None else parsed.only.split(","))
+        if parsed.output is None:
+            print(json.dumps(results, indent=2))
+        else:
+            with open(parsed.output, "w") as f:
+                json.dump(results, f, indent=2)
+        return 0
+
+    baseline, results = _load(parsed.baseline), _load(parsed.results)
+    for r in (baseline, results):
+        print(f"{r['metadata']['commit']} ({r['scale']}, {r['metadata']['date']}, {r['metadata']['platform']})")
+    if baseline["scale"] != results["scale"]:
+        print("Warning: comparing results of different scales, only the common parameters are compared")
+    comparisons = compare(baseline, results, threshold=parsed.threshold, min_time=parsed.min_time)
+    for c in comparisons:
+        params = ", ".join(f"{k}={v}" for k, v in c["params"].items())
+        print(
+            f"{c['status']:>11} {c['benchmark']:>12} {c['metric']:>20} ({params}): "
+            f"{c['baseline']:.4g} -> {c['new']:.4g} (x{c['ratio']:.2f})"
+        )
+    regressions = [c for c in comparisons if c["status"] == "regression"]
+    print(f"{len(comparisons)} metrics compared, {len(regressions)} regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
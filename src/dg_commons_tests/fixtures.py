@@ -0,0 +1,72 @@
+"""Scenes and references shared by the tests and the benchmarks"""
+
+from itertools import combinations
+from typing import Union
+
+import numpy as np
+
+from dg_commons import PlayerName, DgSampledSequence
+from dg_commons.sim import SimParameters
+from dg_commons.sim.agents import NPAgent
+from dg_commons.sim.models.vehicle import VehicleCommands, VehicleModel, VehicleState
+from dg_commons.sim.models.vehicle_dynamic import VehicleModelDyn, VehicleStateDyn
+from dg_commons.sim.scenarios.structures import DgScenario
+from dg_commons.sim.simulator import SimContext
+
+__all__ = ["get_dense_traffic", "all_colliding_pairs", "get_random_vehicles"]
+
+
+def get_dense_traffic(n_players: int, density: float = 0.005, seed: int = 0) -> SimContext:
+    """Cars with random poses over a square whose area keeps the density of players [1/m^2] constant"""
+    rng = np.random.default_rng(seed)
+    side = np.sqrt(n_players / density)
+    models, players = {}, {}
+    for i in range(n_players):
+        x0 = VehicleState(x=rng.uniform(0, side), y=rng.uniform(0, side), psi=rng.uniform(-np.pi, np.pi), vx=5, delta=0)
+        name = PlayerName(f"P{i}")
+        models[name] = VehicleModel.default_car(x0)
+        players[name] = NPAgent(DgSampledSequence[VehicleCommands](timestamps=[0], values=[VehicleCommands(0, 0)]))
+    return SimContext(dg_scenario=DgScenario(), models=models, players=players, param=SimParameters())
+
+
+def all_colliding_pairs(sim_context: SimContext) -> list[tuple[PlayerName, PlayerName]]:
+    """The colliding pairs of players found by the exhaustive narrow phase, a reference for the broad phase"""
+    return [
+        (p1, p2)
+        for p1, p2 in combinations(sim_context.players, 2)
+        if sim_context.models[p1].get_footprint().intersects(sim_context.models[p2].get_footprint())
+    ]
+
+
+def get_random_vehicles(
+    dyn: bool, n: int = 30, seed: int = 0
+) -> tuple[list[Union[VehicleModel, VehicleModelDyn]], list[VehicleCommands]]:
+    """Cars, bicycles and trucks (kinematic, or dynamic if dyn) with random states and commands,
+    the first one has collided"""
+    rng = np.random.default_rng(seed)
+    models, commands = [], []
+    for i in range(n):
+        if dyn:
+            x0 = VehicleStateDyn(
+                x=rng.uniform(-50, 50),
+                y=rng.uniform(-50, 50),
+                psi=rng.uniform(-3, 3),
+                vx=rng.uniform(0, 15),
+                delta=rng.uniform(-0.3, 0.3),
+                vy=rng.uniform(-0.3, 0.3),
+                dpsi=rng.uniform(-0.2, 0.2),
+            )
+            factory = [VehicleModelDyn.default_car, VehicleModelDyn.default_bicycle, VehicleModelDyn.default_truck]
+        else:
+            x0 = VehicleState(
+                x=rng.uniform(-50, 50),
+                y=rng.uniform(-50, 50),
+                psi=rng.uniform(-3, 3),
+                vx=rng.uniform(-1, 15),
+                delta=rng.uniform(-0.3, 0.3),
+            )
+            factory = [VehicleModel.default_car, VehicleModel.default_bicycle, VehicleModel.default_truck]
+        models.append(factory[i % 3](x0))
+        commands.append(VehicleCommands(acc=rng.uniform(-5, 4), ddelta=rng.uniform(-1, 1)))
+    models[0].has_collided = True
+    return models, commands
@@ -0,0 +1,47 @@
+import json
+
+from dg_commons_tests.benchmarks.suite import RESULTS_VERSION, compare, main
+
+
+def _results(rows: list[dict]) -> dict:
+    return {
+        "version": RESULTS_VERSION,
+        "scale": "quick",
+        "metadata": {"commit": None, "date": None, "platform": None},
+        "benchmarks": {"bench": rows},
+    }
+
+
+def test_compare_results():
+    baseline = _results(
+        [
+            {"n_players": 10, "integrator": "RK4", "run_s": 1.0, "updates_per_s": 100.0, "max_err": 1e-3},
+            {"n_players": 100, "integrator": "RK4", "run_s": 1.0, "updates_per_s": 100.0, "max_err": 1e-3},
+            {"n_players": 1000, "run_s": 1.0},
+        ]
+    )
+    results = _results(
+        [
+            {"n_players": 100, "integrator": "RK4", "run_s": 0.5, "updates_per_s": 70.0, "max_err": 1e-2},
+            {"n_players": 10, "integrator": "RK4", "run_s": 1.1, "updates_per_s": 100.0, "max_err": 1e-3},
+            {"n_players": 300, "run_s": 10.0},
+        ]
+    )
+    status = {(c["params"]["n_players"], c["metric"]): c["status"] for c in compare(baseline, results, threshold=0.2)}
+    # rows matched by their parameters, errors and unmatched rows are not compared
+    assert status == {
+        (100, "run_s"): "improvement",
+        (100, "updates_per_s"): "regression",
+        (10, "run_s"): "ok",
+        (10, "updates_per_s"): "ok",
+    }
+    # tiny timings are not compared
+    assert compare(_results([{"n": 1, "run_s": 1e-6}]), _results([{"n": 1, "run_s": 1e-5}])) == []
+
+
+def test_compare_exit_code(tmp_path):
+    for name, run_s in [("baseline", 1.0), ("same", 1.05), ("slower", 2.0)]:
+        with open(tmp_path / f"{name}.json", "w") as f:
+            json.dump(_results([{"n": 1, "run_s": run_s}]), f)
+    assert main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "same.json")]) == 0
+    assert main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "slower.json")]) == 1
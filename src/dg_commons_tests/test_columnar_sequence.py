@@ -0,0 +1,50 @@
+from decimal import Decimal as D
+
+import numpy as np
+from numpy.testing import assert_raises
+
+from dg_commons import DgSampledSequence, DgColumnarSequence, UndefinedAtTime
+from dg_commons.sim.models.vehicle import VehicleState
+
+
+def _get_states_sequence(n: int = 50) -> DgSampledSequence[VehicleState]:
+    rng = np.random.default_rng(0)
+    timestamps = [D(i) / 10 for i in range(n)]
+    values = [VehicleState(*rng.uniform(-5, 5, size=5)) for _ in range(n)]
+    return DgSampledSequence[VehicleState](timestamps, values)
+
+
+def test_columnar_sequence():
+    seq = _get_states_sequence()
+    col = DgColumnarSequence.from_sequence(seq)
+    assert len(col) == len(seq)
+    assert col.XT == VehicleState
+    assert col.values.shape == (len(seq), VehicleState.get_n_states())
+
+    for t in [D("-1"), D("0.1"), D("0.33"), D("2.05"), D("4.9"), D("10")]:
+        np.testing.assert_allclose(col.at_interp(t).as_ndarray(), seq.at_interp(t).as_ndarray())
+        if D(0) <= t:
+            assert col.at_or_previous(t) == seq.at_or_previous(t)
+    assert col.at(D("0.3")) == seq.at(D("0.3"))
+    assert_raises(UndefinedAtTime, lambda: col.at(0.35))
+    assert_raises(UndefinedAtTime, lambda: col.at_or_previous(-1))
+
+    ts = np.linspace(-1, 6, 100)
+    interp = col.at_interp_array(ts)
+    np.testing.assert_allclose(interp, [seq.at_interp(t).as_ndarray() for t in ts])
+    np.testing.assert_allclose(col.column("vx"), [x.vx for x in seq.values])
+
+    # views and round trip
+    sub = col.get_subsequence(D("1"), D("2"))
+    assert np.shares_memory(sub.values, col.values)
+    assert sub.to_sequence() == seq.get_subsequence(D("1"), D("2"))
+    assert col.to_sequence() == seq
+    assert not col.values.flags.writeable
+
+
+def test_columnar_sequence_numbers():
+    col = DgColumnarSequence([1, 2.2, 3, 4, 5], values=[1, 2, 3, 4, 5])
+    assert col.at_interp(3.5) == 3.5
+    assert col.at_or_previous(4.9) == 4
+    np.testing.assert_allclose(col.at_interp_array([0, 3.2, 6]).ravel(), [1, 3.2, 5])
+    assert col[1:3].to_sequence(decimal_timestamps=False) == DgSampledSequence[float]([2.2, 3], [2, 3])
@@ -42,9 +42,9 @@ def test_dist_ttc_drac(debug: bool = False):
     ttc_sim, dtc1, dtc2 = _get_ttc(state1, state2, model1, model2)
     
     min_dist_expected = 5.17
-    ttc_sim_expected = 1.10
-    dtc1_expected = 8.80
-    dtc2_expected = 3.63
+    ttc_sim_expected = 1.06
+    dtc1_expected = 8.51
+    dtc2_expected = 3.51
     eps = 1e-2
     assert min_dist_expected - eps <= dist <= min_dist_expected + eps
     assert ttc_sim_expected - eps <= ttc_sim <= ttc_sim_expected + eps
@@ -100,10 +100,10 @@ def test_safety_eval():
     min_dist_expected = 0.47
     min_dist_agent_expected = "P18"
     min_dist_t_expected = 0.35
-    min_ttc_expected = 1.10
+    min_ttc_expected = 1.05
     min_ttc_agent_expected = "P18"
     min_ttc_t_expected = 0.25
-    max_drac_expected = 6.79
+    max_drac_expected = 7.13
     max_drac_agent_expected = "P18"
     max_drac_t_expected = 0.25
     eps = 1e-2
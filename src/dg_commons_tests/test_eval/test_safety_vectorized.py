@@ -0,0 +1,78 @@
+import pickle
+
+import numpy as np
+
+from dg_commons import PlayerName
+from dg_commons.eval.safety import get_min_dist, get_min_ttc_max_drac, _get_dist, _get_ttc
+from dg_commons.eval.safety_vectorized import (
+    get_min_dist_vectorized,
+    get_min_ttc_max_drac_vectorized,
+    sample_players,
+    ego_distances,
+    ego_ttc_drac,
+)
+from dg_commons.sim.goals import PolygonGoal
+from dg_commons.sim.models.vehicle_dynamic import VehicleStateDyn, VehicleModelDyn
+from dg_commons.sim.simulator_structures import SimLog, PlayerLog
+from dg_commons.seq import DgSampledSequence
+from dg_commons_tests import REPO_DIR
+from shapely.geometry import Polygon
+
+_LOGS = REPO_DIR / "src/dg_commons_tests/test_eval/logs"
+
+
+def _load(name: str):
+    with open(_LOGS / name, "rb") as f:
+        return pickle.load(f)
+
+
+def test_vectorized_matches_safety_eval():
+    log, models, missions = _load("log.pickle"), _load("models.pickle"), _load("missions.pickle")
+    ego_name = PlayerName("Ego")
+    for t_range in [(None, None), (0.2, 3.0)]:
+        min_dist = get_min_dist(log, models, missions, ego_name, t_range)
+        min_dist_vec = get_min_dist_vectorized(log, models, missions, ego_name, t_range)
+        np.testing.assert_allclose(min_dist_vec[0], min_dist[0], rtol=1e-9)
+        assert min_dist_vec[1:] == min_dist[1:]
+
+        ttc_drac = get_min_ttc_max_drac(log, models, missions, ego_name, t_range)
+        ttc_drac_vec = get_min_ttc_max_drac_vectorized(log, models, missions, ego_name, t_range)
+        np.testing.assert_allclose([ttc_drac_vec[0], ttc_drac_vec[3]], [ttc_drac[0], ttc_drac[3]], rtol=1e-9)
+        assert ttc_drac_vec[1:3] == ttc_drac[1:3]
+        assert ttc_drac_vec[4:] == ttc_drac[4:]
+
+
+def _two_players_log(state1: VehicleStateDyn, state2: VehicleStateDyn) -> SimLog:
+    def _player_log(state):
+        seq = DgSampledSequence[VehicleStateDyn](timestamps=[0], values=[state])
+        return PlayerLog(states=seq, commands=seq, extra=seq, info=seq)
+
+    return SimLog({PlayerName("Ego"): _player_log(state1), PlayerName("P1"): _player_log(state2)})
+
+
+def test_vectorized_pairwise():
+    far_away = PolygonGoal(Polygon([(100, 100), (101, 100), (101, 101)]))
+    cases = [
+        (
+            VehicleStateDyn(x=0, y=0.0, psi=-0.72, vx=8.0, delta=0),
+            VehicleStateDyn(x=8.0, y=0.0, psi=-1.5, vx=3.3, delta=0),
+        ),
+        (VehicleStateDyn(x=0, y=0.0, psi=0, vx=10.0, delta=0), VehicleStateDyn(x=20.0, y=0.5, psi=3.0, vx=5, delta=0)),
+        (VehicleStateDyn(x=0, y=0.0, psi=0, vx=2.0, delta=0), VehicleStateDyn(x=1.0, y=1.0, psi=1.0, vx=1, delta=0)),
+    ]
+    for state1, state2 in cases:
+        models = {
+            PlayerName("Ego"): VehicleModelDyn.default_car(state1),
+            PlayerName("P1"): VehicleModelDyn.default_car(state2),
+        }
+        missions = {p: far_away for p in models}
+        samples = sample_players(_two_players_log(state1, state2), models, missions, PlayerName("Ego"))
+        dist, _ = _get_dist(state1, state2, *models.values())
+        np.testing.assert_allclose(ego_distances(samples)[0, 0], dist, atol=1e-9)
+
+        ttc, dtc1, _ = _get_ttc(state1, state2, *models.values())
+        exact_ttc, _ = ego_ttc_drac(samples)
+        np.testing.assert_allclose(exact_ttc[0, 0], ttc, atol=1e-9)
+        # on a time grid the first step after the exact time of contact is reported
+        stepped_ttc, _ = ego_ttc_drac(samples, ttc_step=0.1)
+        assert ttc - 1e-9 <= stepped_ttc[0, 0] <= ttc + 0.1 + 1e-9
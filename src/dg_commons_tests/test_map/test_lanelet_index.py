@@ -0,0 +1,63 @@
+import gc
+import weakref
+
+import numpy as np
+from commonroad.scenario.lanelet import Lanelet
+
+from dg_commons.maps.lanelet_index import LaneletIndex
+from dg_commons.maps.lanes import DgLanelet
+from dg_commons.sim.scenarios import load_commonroad_scenario, dglane_from_position
+from dg_commons.sim.scenarios.structures import DgScenario
+
+
+def test_lanelet_ids_at_points():
+    scenario, _ = load_commonroad_scenario("USA_Lanker-1_1_T-1")
+    network = scenario.lanelet_network
+    index = LaneletIndex(network)
+    rng = np.random.default_rng(0)
+    centers = np.concatenate([lanelet.center_vertices for lanelet in network.lanelets])
+    points = centers + rng.normal(0, 2, centers.shape)
+    expected = network.find_lanelet_by_position(list(points))
+    assert [sorted(ids) for ids in index.lanelet_ids_at_points(points)] == [sorted(ids) for ids in expected]
+    assert index.lanelet_ids_at(np.array([1e6, 1e6])) == []
+    # shared by the users of the network, e.g. `DgLanelet.get_lanelets`
+    assert LaneletIndex.of(network) is LaneletIndex.of(network)
+    inside = [p for p, ids in zip(points, expected) if ids]
+    assert [lanelet.lanelet_id for lanelet in DgLanelet.get_lanelets(network, inside)] == [
+        ids[0] for ids in index.lanelet_ids_at_points(np.array(inside))
+    ]
+
+
+def test_lanelet_index_caches():
+    scenario, _ = load_commonroad_scenario("USA_Lanker-1_1_T-1")
+    dg_scenario = DgScenario(scenario)
+    index = dg_scenario.lanelet_index
+    assert index is dg_scenario.lanelet_index
+    assert DgScenario().lanelet_index is None
+
+    lanelet = scenario.lanelet_network.lanelets[0]
+    assert index.dglanelet(lanelet.lanelet_id) is index.dglanelet(lanelet.lanelet_id)
+    merged, _ = Lanelet.all_lanelets_by_merging_successors_from_lanelet(lanelet, scenario.lanelet_network)
+    merged_dglanes = index.merged_dglanelets(lanelet.lanelet_id)
+    assert merged_dglanes is index.merged_dglanelets(lanelet.lanelet_id)
+    for m, dglane in zip(merged, merged_dglanes):
+        assert dglane.get_lane_length() == DgLanelet.from_commonroad_lanelet(m).get_lane_length()
+
+    p = lanelet.center_vertices[1]
+    dglane = dglane_from_position(p, scenario.lanelet_network, lanelet_index=index)
+    assert dglane is dglane_from_position(p, scenario.lanelet_network, lanelet_index=index)
+    assert dglane.get_lane_length() == dglane_from_position(p, scenario.lanelet_network).get_lane_length()
+    # without an index the one shared by the users of the network is used
+    assert dglane_from_position(p, scenario.lanelet_network) is dglane_from_position(p, scenario.lanelet_network)
+
+
+def test_lanelet_index_lifetime():
+    # the shared indices do not keep their scenario, nor their network, alive
+    scenario, _ = load_commonroad_scenario("USA_Lanker-1_1_T-1")
+    network = scenario.lanelet_network
+    LaneletIndex.of(scenario)
+    DgLanelet.get_lanelets(network, [network.lanelets[0].center_vertices[1]])
+    scenario_ref, network_ref = weakref.ref(scenario), weakref.ref(network)
+    del scenario, network
+    gc.collect()
+    assert scenario_ref() is None and network_ref() is None
@@ -1,13 +1,15 @@
 import os.path
+import warnings
 from math import isclose
 from typing import Hashable
 
 import numpy as np
-from geometry import translation_angle_from_SE2
+import pytest
+from geometry import SE2, SE2_from_translation_angle, translation_angle_from_SE2
 from matplotlib import pyplot as plt
 from numpy import linspace
 
-from dg_commons import SE2_apply_T2
+from dg_commons import SE2Transform, SE2_apply_T2, SE2_interpolate, get_distance_SE2
 from dg_commons.maps.lanes import DgLanelet
 from dg_commons.sim.scenarios import load_commonroad_scenario
 from dg_commons_tests import OUT_TESTS_DIR
@@ -73,3 +75,104 @@ def test_find_along_lane_closest_point():
         os.makedirs(os.path.dirname(file_name), exist_ok=True)
         plt.savefig(file_name)
         plt.close()
+
+
+def test_closest_point_tol_deprecated():
+    scenario, _ = load_commonroad_scenario("USA_Lanker-1_1_T-1")
+    lane = DgLanelet.from_commonroad_lanelet(scenario.lanelet_network.lanelets[0])
+    p = translation_angle_from_SE2(lane.center_point(1.5))[0]
+    beta, _ = lane.find_along_lane_closest_point(p)
+    with pytest.warns(DeprecationWarning):
+        assert lane.find_along_lane_closest_point(p, tol=1e-3)[0] == beta
+    with pytest.warns(DeprecationWarning):
+        assert lane.is_inside_from_T2value(p, tol=1e-3) == lane.is_inside_from_T2value(p)
+    q = lane.center_point(1.5)
+    with pytest.warns(DeprecationWarning):
+        assert lane.lane_pose_from_SE2_generic(q, tol=1e-3).along_lane == lane.lane_pose_from_SE2_generic(q).along_lane
+    with pytest.warns(DeprecationWarning):
+        lane.lane_pose_from_SE2Transform(SE2Transform.from_SE2(q), tol=1e-3)
+    with pytest.warns(DeprecationWarning):
+        assert lane.along_lane_from_T2value(p, tol=1e-3) == lane.along_lane_from_T2value(p)
+    # the numerical minimization still uses it
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        lane.along_lane_from_T2value(p, tol=1e-3, fast=True)
+
+
+def test_lane_tables_match_se2_interpolation():
+    scenario, _ = load_commonroad_scenario("USA_Lanker-1_1_T-1")
+    for lanelet in scenario.lanelet_network.lanelets:
+        lane = DgLanelet.from_commonroad_lanelet(lanelet)
+        ctr = [cp.q.as_SE2() for cp in lane.control_points]
+        lengths = [get_distance_SE2(q0, q1) for q0, q1 in zip(ctr[:-1], ctr[1:])]
+        np.testing.assert_allclose(lane.get_lane_lengths(), lengths, atol=1e-9)
+        extension = SE2_from_translation_angle([0.1, 0], 0)
+        n = len(ctr)
+        for beta in linspace(-1.5, n + 0.5, 37):
+            i = int(np.floor(beta))
+            if i < 0:
+                expected = SE2_interpolate(ctr[0], SE2.multiply(ctr[0], extension), beta)
+            elif i >= n - 1:
+                expected = SE2_interpolate(ctr[-1], SE2.multiply(ctr[-1], extension), beta - (n - 1))
+            else:
+                expected = SE2_interpolate(ctr[i], ctr[i + 1], beta - i)
+            np.testing.assert_allclose(lane.center_point(beta), expected, atol=1e-7)
+            along = lane.along_lane_from_beta(beta)
+            assert isclose(lane.beta_from_along_lane(along), beta, abs_tol=1e-9)
+
+
+def test_lane_projection_is_optimal():
+    scenario, _ = load_commonroad_scenario("USA_Lanker-1_1_T-1")
+    rng = np.random.default_rng(0)
+    for lanelet in scenario.lanelet_network.lanelets:
+        lane = DgLanelet.from_commonroad_lanelet(lanelet)
+        n = len(lane.control_points)
+        dense = np.array([translation_angle_from_SE2(lane.center_point(b))[0] for b in linspace(-2, n + 1, 3000)])
+        for beta in rng.uniform(0, n - 1, 5):
+            p = translation_angle_from_SE2(lane.center_point(beta))[0] + rng.normal(0, 2.0, 2)
+            beta_p, along, lateral = lane.projection_from_T2value(p)
+            t, theta = translation_angle_from_SE2(lane.center_point(beta_p))
+            assert np.linalg.norm(p - t) <= np.min(np.linalg.norm(dense - p, axis=1)) + 1e-9
+            # the heading of the center line is not always tangent to it (lateral twist), lateral is along its normal
+            assert isclose(lateral, np.dot([-np.sin(theta), np.cos(theta)], p - t), abs_tol=1e-9)
+            assert isclose(along, lane.along_lane_from_beta(beta_p))
+            # on the center line the projection is the point itself
+            beta_c, _, lateral_c = lane.projection_from_T2value(translation_angle_from_SE2(lane.center_point(beta))[0])
+            assert isclose(beta_c, beta, abs_tol=1e-6) and isclose(lateral_c, 0, abs_tol=1e-6)
+
+
+def test_lane_poses_match_lane_pose():
+    scenario, _ = load_commonroad_scenario("USA_Lanker-1_1_T-1")
+    rng = np.random.default_rng(1)
+    for lanelet in scenario.lanelet_network.lanelets:
+        lane = DgLanelet.from_commonroad_lanelet(lanelet)
+        n = len(lane.control_points)
+        centers = np.array([translation_angle_from_SE2(lane.center_point(b))[0] for b in rng.uniform(-2, n + 1, 20)])
+        poses = np.column_stack([centers + rng.normal(0, 3, (20, 2)), rng.uniform(-4, 4, 20)])
+        lane_poses = lane.lane_poses(poses)
+        for pose, batched in zip(poses, lane_poses):
+            lane_pose = lane.lane_pose_from_SE2_generic(SE2_from_translation_angle(pose[:2], pose[2]))
+            for field in ("along_lane", "lateral", "relative_heading", "distance_from_left", "distance_from_right"):
+                assert isclose(getattr(lane_pose, field), batched[field], abs_tol=1e-9)
+            for field in (
+                "inside",
+                "outside_left",
+                "outside_right",
+                "along_inside",
+                "along_after",
+                "correct_direction",
+            ):
+                assert getattr(lane_pose, field) == batched[field]
+            np.testing.assert_allclose(lane_pose.center_point.p, [batched["center_x"], batched["center_y"]], atol=1e-6)
+        # a bracket around the solution does not change it
+        brackets = np.column_stack([lane_poses["beta"] - 0.5, lane_poses["beta"] + 0.5])
+        np.testing.assert_allclose(lane.lane_poses(poses, brackets)["along_lane"], lane_poses["along_lane"])
+        # with brackets of different widths, the closest point within each bracket
+        lo = rng.uniform(-1, n, 20)
+        brackets = np.column_stack([lo, lo + rng.uniform(0, 3, 20)])
+        bracketed = lane.lane_poses(poses, brackets)
+        for pose, (b0, b1), batched in zip(poses, brackets, bracketed):
+            assert b0 <= batched["beta"] <= b1
+            dist = np.hypot(pose[0] - batched["center_x"], pose[1] - batched["center_y"])
+            sampled = [translation_angle_from_SE2(lane.center_point(b))[0] for b in np.linspace(b0, b1, 200)]
+            assert dist <= np.min(np.linalg.norm(np.array(sampled) - pose[:2], axis=1)) + 1e-6
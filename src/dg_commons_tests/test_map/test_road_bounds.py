@@ -4,6 +4,7 @@ from commonroad.visualization.mp_renderer import MPRenderer
 from matplotlib import pyplot as plt
 from shapely.affinity import affine_transform
 from shapely.geometry import Polygon
+from shapely.ops import unary_union
 
 from dg_commons.maps.road_bounds import build_road_boundary_obstacle
 from dg_commons.sim.models.obstacles import StaticObstacle
@@ -68,3 +69,33 @@ def test_road_bounds_dgscenario():
 
     plt.savefig(OUT_TESTS_DIR + "/road_bounds_dgscenario.png")
     # plt.show()
+
+
+@pytest.mark.parametrize("scenario_name", test_scenarios)
+def test_road_bounds_open_at_gates(scenario_name: str):
+    scenario, _ = load_commonroad_scenario(scenario_name)
+    lane_boundaries, gates = build_road_boundary_obstacle(scenario)
+    lanes = unary_union([lanelet.polygon.shapely_object.buffer(0.1) for lanelet in scenario.lanelet_network.lanelets])
+    border = lanes.boundary.buffer(1e-6)
+    assert len(gates) > 0
+    for bound in lane_boundaries:
+        assert bound.length > 0
+        # along the border of the lanes, but not across the gates
+        assert border.contains(bound)
+        assert all(bound.intersection(gate).length < 1e-6 for gate in gates)
+    # the whole border except for the gates
+    open_border = lanes.boundary.difference(unary_union(gates))
+    assert abs(sum(b.length for b in lane_boundaries) - open_border.length) < 1e-6 * open_border.length
+
+
+def test_road_bounds_cached():
+    scenario, _ = load_commonroad_scenario("USA_Lanker-1_1_T-1")
+    lane_boundaries, gates = build_road_boundary_obstacle(scenario)
+    lane_boundaries_again, _ = build_road_boundary_obstacle(scenario)
+    assert lane_boundaries_again is not lane_boundaries
+    assert all(a is b for a, b in zip(lane_boundaries, lane_boundaries_again))
+    assert build_road_boundary_obstacle(scenario, buffer=0.2)[0][0] is not lane_boundaries[0]
+    # building the same scenario again is free
+    dgscenario = DgScenario(scenario, use_road_boundaries=True)
+    assert [o.shape for o in dgscenario.static_obstacles] == lane_boundaries
+    assert all(a is b for a, b in zip(lane_boundaries, (o.shape for o in dgscenario.static_obstacles)))
@@ -0,0 +1,31 @@
+from math import ceil
+
+from dg_commons import PlayerName, fd
+from dg_commons.sim import PlayerObservations, SimObservations, SimTime
+from dg_commons.sim.models.vehicle import VehicleState
+from dg_commons.sim.scenarios.structures import DgScenario
+from dg_commons.sim.sim_perception import DelayedObsFilter, IdObsFilter
+
+
+def _observations(t: SimTime) -> SimObservations:
+    state = VehicleState(x=float(t), y=0, psi=0, vx=1, delta=0)
+    return SimObservations(players=fd({PlayerName("P0"): PlayerObservations(state=state, occupancy=None)}), time=t)
+
+
+def test_delayed_obs_filter():
+    dt, latency = SimTime("0.1"), SimTime("0.25")
+    obs_filter = DelayedObsFilter(IdObsFilter(), latency=latency)
+    scenario = DgScenario()
+    for k in range(100):
+        t = k * dt
+        obs = obs_filter.sense(scenario, _observations(t), PlayerName("P0"))
+        # the first observation shifted at or after the current time
+        sensed_t = max(SimTime(0), ceil((t - latency) / dt) * dt)
+        assert obs.players[PlayerName("P0")].state.x == float(sensed_t)
+        assert obs.time == sensed_t + latency
+        # only the observations within the latency are kept
+        assert len(obs_filter.obs_history) <= 4
+
+    # a new simulation starting from the beginning
+    obs = obs_filter.sense(scenario, _observations(SimTime(0)), PlayerName("P0"))
+    assert obs.time == latency and len(obs_filter.obs_history) == 1
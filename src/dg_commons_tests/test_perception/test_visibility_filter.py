@@ -1,13 +1,23 @@
+from dataclasses import dataclass
 from math import pi
 
+import numpy as np
+import pytest
+
 import matplotlib.pyplot as plt
+from commonroad_dc import pycrcc
 from cytoolz import interleave
-from shapely import LineString, LinearRing
+from shapely import LineString, LinearRing, affinity
 from shapely.geometry import Point, Polygon
 
-from dg_commons import SE2Transform, shapely2crPolygons
+from dg_commons import PlayerName, SE2Transform, fd, shapely2crPolygons
+from dg_commons.sim import PlayerObservations, SimObservations
+from dg_commons.sim.models.obstacles import StaticObstacle
+from dg_commons.sim.models.vehicle import VehicleModel, VehicleState
+from dg_commons.sim.scenarios.structures import DgScenario
+from dg_commons.sim.sim_perception import FovObsFilter
 from dg_commons.maps.shapely_viz import ShapelyViz
-from dg_commons.perception.sensor import VisRangeSensor
+from dg_commons.perception.sensor import Sensor, SweepVisSensor, VisRangeSensor
 from dg_commons_tests import OUT_TESTS_DIR
 
 
@@ -42,3 +52,160 @@ def test_visibility_filter():
     plt.plot(pov_x, pov_y, "r+")
     plt.gca().set_aspect("equal")
     plt.savefig(OUT_TESTS_DIR + "/visibility_filter.png")
+
+
+def test_vis_range_sensor_static_obstacles():
+    obstacles = [
+        Polygon([(10, 10), (10, 15), (15, 15), (15, 10)]),
+        Polygon([(-3, -3), (-3, -7), (-8, -10), (-12, -9), (-12, -3)]),
+        Point(4, -6).buffer(2),
+        LinearRing([[-20, -20], [-20, 20], [20, 20], [20, -20], [-20, -20]]),
+    ]
+    cr_obstacles = [list(shapely2crPolygons(o)) for o in obstacles]
+    for fov in [2 * pi, pi / 2]:
+        sensor = VisRangeSensor(field_of_view=fov, range=30)
+        sensor.pose = SE2Transform(p=[-2, -1], theta=2.3)
+        all_obstacles = list(interleave(cr_obstacles))
+        view = sensor.fov_as_polygon(all_obstacles)
+        # the static obstacles given once are equivalent to passing them at every call
+        sensor.set_static_obstacles(list(interleave(cr_obstacles[1:])))
+        view_static = sensor.fov_as_polygon_dynamic(cr_obstacles[0])
+        np.testing.assert_allclose(view.exterior.coords, view_static.exterior.coords)
+        # the rays stop at the closest obstacle
+        for vertex in view.exterior.coords:
+            assert (
+                min(o.distance(Point(vertex)) for o in obstacles) < 0.02
+                or np.isclose(Point(vertex).distance(Point(sensor.pose.p)), sensor.range)
+                or np.allclose(vertex, sensor.pose.p)
+            )
+
+    # a sensor inside an obstacle does not see anything
+    sensor = VisRangeSensor(field_of_view=2 * pi)
+    sensor.pose = SE2Transform(p=[12, 12], theta=0)
+    assert sensor.fov_as_polygon(cr_obstacles[0]).area == 0
+
+
+def test_vis_range_sensor_ray_distances():
+    """Each ray stops where the segment to its end first meets an obstacle (shapely for the polygons,
+    analytically for the circles)"""
+    rng = np.random.default_rng(0)
+    for _ in range(5):
+        polygons = [
+            affinity.translate(
+                affinity.rotate(Polygon([(-2, -1), (2, -1), (2, 1), (-2, 1)]), rng.uniform(0, 180)),
+                *rng.uniform(-25, 25, 2),
+            )
+            for _ in range(15)
+        ]
+        circles = [(rng.uniform(0.5, 3), *rng.uniform(-25, 25, 2)) for _ in range(5)]
+        origin = np.array([0.3, -0.2])
+        polygons = [p for p in polygons if p.distance(Point(origin)) > 0.5]
+        circles = [(r, x, y) for r, x, y in circles if np.hypot(x - origin[0], y - origin[1]) > r + 0.5]
+        obstacles = list(interleave([shapely2crPolygons(p) for p in polygons])) + [
+            pycrcc.Circle(r, x, y) for r, x, y in circles
+        ]
+        # an integer range as well, the distances must not be truncated
+        sensor = VisRangeSensor(range=30, pose=SE2Transform(p=origin, theta=0.4))
+        vertices = np.array(sensor.fov_as_polygon(obstacles).exterior.coords)[:-1] - origin
+        distances = np.linalg.norm(vertices, axis=1)
+        directions = vertices / distances[:, None]
+        for direction, distance in zip(directions, distances):
+            ray = LineString([origin, origin + sensor.range * direction])
+            expected = sensor.range
+            for p in polygons:
+                if ray.intersects(p):
+                    expected = min(expected, Point(origin).distance(ray.intersection(p)))
+            for r, x, y in circles:
+                # |origin + t direction - center| = r
+                w = origin - (x, y)
+                b, c = np.dot(w, direction), np.dot(w, w) - r**2
+                if b**2 - c >= 0 and -b - np.sqrt(b**2 - c) >= 0:
+                    expected = min(expected, -b - np.sqrt(b**2 - c))
+            assert distance == pytest.approx(expected, abs=1e-6)
+
+
+@dataclass
+class _AllObstaclesSensor(Sensor):
+    """A sensor that only considers the obstacles passed to `fov_as_polygon`"""
+
+    def fov_as_polygon(self, obstacles):
+        return VisRangeSensor(pose=self.pose, range=self.range).fov_as_polygon(obstacles)
+
+
+def test_fov_filters_share_conversions():
+    scenario = DgScenario(
+        static_obstacles=[
+            StaticObstacle(Polygon([(5, -5), (5, 5), (6, 5), (6, -5)])),
+            StaticObstacle(Polygon([(-20, 10), (-20, 12), (20, 12), (20, 10)])),
+        ]
+    )
+    players = {}
+    for i, (x, y) in enumerate([(0, 0), (10, 0), (0, 5), (100, 100)]):
+        footprint = VehicleModel.default_car(VehicleState(x=x, y=y, psi=0, vx=0, delta=0)).get_footprint()
+        players[PlayerName(f"P{i}")] = PlayerObservations(
+            state=VehicleState(x=x, y=y, psi=0, vx=0, delta=0), occupancy=footprint
+        )
+    full_obs = SimObservations(players=fd(players), time=0)
+    filters = {p: FovObsFilter(VisRangeSensor(range=30)) for p in players}
+    seen = {p: set(filters[p].sense(scenario, full_obs, p).players) for p in players}
+    # P1 is behind the wall, P3 is out of range
+    assert seen[PlayerName("P0")] == {"P0", "P2"}
+    assert seen[PlayerName("P3")] == {"P3"}
+    # the sensors that do not process the static obstacles themselves still get them
+    assert set(FovObsFilter(_AllObstaclesSensor(range=30)).sense(scenario, full_obs, "P0").players) == {"P0", "P2"}
+    # the conversions are shared
+    static_obstacles = [f._static_obstacles for f in filters.values()]
+    assert all(s is static_obstacles[0] for s in static_obstacles)
+    assert all(f.sensor._static_edges is filters[PlayerName("P0")].sensor._static_edges for f in filters.values())
+    cache = filters[PlayerName("P0")]._cr_obstacles
+    assert cache.occupancy(full_obs.players, PlayerName("P1")) is cache.occupancy(full_obs.players, PlayerName("P1"))
+
+
+def test_sweep_vis_sensor():
+    obstacles = [
+        Polygon([(10, 10), (10, 15), (15, 15), (15, 10)]),
+        Polygon([(-3, -3), (-3, -7), (-8, -10), (-12, -9), (-12, -3)]),
+        Polygon([(1, 3), (8, 2), (6, 6)]),
+        Polygon([(5, 1), (9, 5), (9, 3)]),  # crossing the triangle above
+        Point(4, -6).buffer(2),
+    ]
+    cr_obstacles = list(interleave([shapely2crPolygons(o) for o in obstacles]))
+    rng = np.random.default_rng(0)
+    points = [Point(p) for p in rng.uniform(-30, 30, (500, 2))]
+    for fov in [2 * pi, pi / 2]:
+        sensor = SweepVisSensor(field_of_view=fov, range=20)
+        sensor.pose = SE2Transform(p=[-2, -1], theta=0.7)
+        view = sensor.fov_as_polygon(cr_obstacles)
+        assert view.is_valid
+        # same as ray casting up to the discretization of the rays
+        ray_casting = VisRangeSensor(field_of_view=fov, range=20, pose=sensor.pose).fov_as_polygon(cr_obstacles)
+        assert view.symmetric_difference(ray_casting).area < 0.05 * view.area
+        # exact: a point is in the view iff the segment from the sensor to it does not cross any obstacle
+        origin = Point(sensor.pose.p)
+        for p in points:
+            if min(abs(view.exterior.distance(p)), *(o.distance(p) for o in obstacles)) < 1e-6:
+                continue
+            angle = np.arctan2(p.y - origin.y, p.x - origin.x) - sensor.pose.theta
+            visible = (
+                origin.distance(p) < sensor.range
+                and abs((angle + pi) % (2 * pi) - pi) < fov / 2
+                and not any(LineString([origin, p]).intersects(o) for o in obstacles)
+            )
+            assert view.contains(p) == visible
+
+    # without anything within range, the disk or the sector
+    for fov in [2 * pi, pi / 2]:
+        for scene in [[], cr_obstacles]:
+            sensor = SweepVisSensor(field_of_view=fov, range=10, pose=SE2Transform(p=[100, 100], theta=0.7))
+            view = sensor.fov_as_polygon(scene)
+            assert view.is_valid
+            assert view.area == pytest.approx(fov / 2 * 10**2, rel=1e-2)
+    # a sensor inside an obstacle does not see anything
+    sensor = SweepVisSensor(pose=SE2Transform(p=[12, 12], theta=0))
+    assert sensor.fov_as_polygon(cr_obstacles).area == 0
+    # it can be used by the observation filters as well
+    scenario = DgScenario(static_obstacles=[StaticObstacle(o) for o in obstacles])
+    state = VehicleState(x=-2, y=-1, psi=0, vx=0, delta=0)
+    player = PlayerObservations(state=state, occupancy=VehicleModel.default_car(state).get_footprint())
+    full_obs = SimObservations(players=fd({PlayerName("P0"): player}), time=0)
+    assert set(FovObsFilter(SweepVisSensor(range=20)).sense(scenario, full_obs, PlayerName("P0")).players) == {"P0"}
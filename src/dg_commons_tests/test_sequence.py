@@ -60,6 +60,22 @@ def test_dg_sampledsequence():
     assert_raises(ZValueError, illegal_timestamps)
 
 
+def test_vectorized_lookups():
+    for s in [seq, seqD]:
+        queries = [-2, 1, 2.2, D("3.2"), 4, 4.9, D(5), 6]
+        assert s.at_interp_many(queries) == [s.at_interp(t) for t in queries]
+        assert s.at_many([D(1), 3.0, 5]) == [1, 3, 5]
+        assert_raises(UndefinedAtTime, lambda: s.at_many([1, 4.4]))
+    # the float mirror must not change the exact comparisons of Decimal timestamps
+    s = DgSampledSequence[int]([D("0.1"), D("0.2"), D("0.3")], values=[1, 2, 3])
+    assert s.at(D("0.2")) == 2
+    assert_raises(UndefinedAtTime, lambda: s.at(0.2))
+    assert s.at_or_previous(0.3) == 2
+    assert s.at_or_previous(D("0.3")) == 3
+    assert s.at_or_previous(D("0.30000000000000000001")) == 3
+    assert s.at_or_previous(D("0.29999999999999999999")) == 2
+
+
 class TestHash:
     def __init__(self):
         self.wow = [1, 2, 3]
@@ -0,0 +1,40 @@
+from dataclasses import replace
+from decimal import Decimal as D
+
+import numpy as np
+
+from dg_commons import PlayerName, DgSampledSequence
+from dg_commons.sim import SimParameters, SEQUENTIAL, THREAD_POOL, PROCESS_POOL
+from dg_commons.sim.agents import NPAgent
+from dg_commons.sim.models.vehicle import VehicleCommands, VehicleModel, VehicleState
+from dg_commons.sim.scenarios.structures import DgScenario
+from dg_commons.sim.simulator import SimContext, Simulator
+
+
+def _get_sim_context(param: SimParameters) -> SimContext:
+    models, players = {}, {}
+    for i in range(5):
+        name = PlayerName(f"P{i}")
+        models[name] = VehicleModel.default_car(VehicleState(x=0, y=10 * i, psi=0, vx=5, delta=0))
+        commands = DgSampledSequence[VehicleCommands](
+            timestamps=[0, 1], values=[VehicleCommands(acc=i / 2, ddelta=0.1), VehicleCommands(acc=-1, ddelta=-0.1)]
+        )
+        players[name] = NPAgent(commands)
+    return SimContext(dg_scenario=DgScenario(), models=models, players=players, param=param)
+
+
+def test_agents_execution():
+    param = SimParameters(dt=D("0.05"), dt_commands=D("0.1"), max_sim_time=D(2))
+    logs = {}
+    for execution in [SEQUENTIAL, THREAD_POOL, PROCESS_POOL]:
+        sim_context = _get_sim_context(replace(param, agents_execution=execution, n_workers=2))
+        Simulator().run(sim_context)
+        logs[execution] = sim_context.log
+    for execution in [THREAD_POOL, PROCESS_POOL]:
+        for p, log in logs[SEQUENTIAL].items():
+            assert log.commands.values == logs[execution][p].commands.values
+            np.testing.assert_array_equal(
+                [x.as_ndarray() for x in log.states.values], [x.as_ndarray() for x in logs[execution][p].states.values]
+            )
+            assert len(logs[execution][p].info) == len(log.info)
+            assert all(dt >= 0 for dt in logs[execution][p].info.values)
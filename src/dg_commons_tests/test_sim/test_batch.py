@@ -0,0 +1,89 @@
+import os
+import pickle
+from functools import partial
+from decimal import Decimal as D
+
+from dg_commons import PlayerName, DgSampledSequence
+from dg_commons.sim import SimParameters
+from dg_commons.sim.agents import NPAgent
+from dg_commons.sim.batch import run_batch, load_batch_outcomes
+from dg_commons.sim.models.vehicle import VehicleCommands
+from dg_commons.sim.models.vehicle_dynamic import VehicleModelDyn, VehicleStateDyn
+from dg_commons.sim.scenarios.structures import DgScenario
+from dg_commons.sim.simulator import SimContext
+from dg_commons_tests import OUT_TESTS_DIR
+
+
+def _head_on(seed: int) -> SimContext:
+    """Two cars driving towards each other, they collide only for the even seeds"""
+    lateral_offset = 0 if seed % 2 == 0 else 5
+    models = {
+        PlayerName("P1"): VehicleModelDyn.default_car(VehicleStateDyn(x=0, y=0, psi=0, vx=5, delta=0)),
+        PlayerName("P2"): VehicleModelDyn.default_car(VehicleStateDyn(x=20, y=lateral_offset, psi=3.14, vx=5, delta=0)),
+    }
+    commands = DgSampledSequence[VehicleCommands](timestamps=[0], values=[VehicleCommands(acc=0, ddelta=0)])
+    players = {p: NPAgent(commands) for p in models}
+    param = SimParameters(dt=D("0.05"), dt_commands=D("0.1"), max_sim_time=D(3))
+    return SimContext(dg_scenario=DgScenario(), models=models, players=players, param=param, seed=seed)
+
+
+def _failing_head_on(seed: int, fail: bool) -> SimContext:
+    if fail and seed == 1:
+        raise RuntimeError("Failing on purpose")
+    return _head_on(seed)
+
+
+def _n_players(sim_context: SimContext) -> dict:
+    return {"n_players": len(sim_context.models)}
+
+
+def test_run_batch():
+    outcomes_file = os.path.join(OUT_TESTS_DIR, "batch", "outcomes.pickle")
+    if os.path.exists(outcomes_file):
+        os.remove(outcomes_file)
+    outcomes = list(run_batch(_head_on, seeds=range(3), metrics=_n_players, n_workers=2, outcomes_file=outcomes_file))
+    assert sorted(o.seed for o in outcomes) == [0, 1, 2]
+    for o in outcomes:
+        assert o.error is None
+        assert o.metrics == {"n_players": 2}
+        assert bool(o.collision_reports) == (o.seed % 2 == 0)
+    # resuming skips the seeds already simulated
+    new_outcomes = list(run_batch(_head_on, seeds=range(5), n_workers=0, outcomes_file=outcomes_file))
+    assert sorted(o.seed for o in new_outcomes) == [3, 4]
+    stored = {o.seed: o for o in load_batch_outcomes(outcomes_file)}
+    assert sorted(stored) == [0, 1, 2, 3, 4]
+    assert stored[4].first_collision_ts == {o.seed: o for o in outcomes}[0].first_collision_ts
+
+
+def test_run_batch_resume_after_interruption():
+    outcomes_file = os.path.join(OUT_TESTS_DIR, "batch", "interrupted.pickle")
+    if os.path.exists(outcomes_file):
+        os.remove(outcomes_file)
+    list(run_batch(_head_on, seeds=[0], n_workers=0, outcomes_file=outcomes_file))
+    # an interrupted run leaves half of a record at the end
+    with open(outcomes_file, "ab") as f:
+        f.write(pickle.dumps(load_batch_outcomes(outcomes_file)[0])[:50])
+    assert [o.seed for o in load_batch_outcomes(outcomes_file)] == [0]
+    new_outcomes = list(run_batch(_head_on, seeds=range(3), n_workers=0, outcomes_file=outcomes_file))
+    assert sorted(o.seed for o in new_outcomes) == [1, 2]
+    assert sorted(o.seed for o in load_batch_outcomes(outcomes_file)) == [0, 1, 2]
+    # and the file can be resumed again
+    list(run_batch(_head_on, seeds=range(4), n_workers=0, outcomes_file=outcomes_file))
+    assert sorted(o.seed for o in load_batch_outcomes(outcomes_file)) == [0, 1, 2, 3]
+
+
+def test_run_batch_retries_failed_seeds():
+    outcomes_file = os.path.join(OUT_TESTS_DIR, "batch", "failed.pickle")
+    if os.path.exists(outcomes_file):
+        os.remove(outcomes_file)
+    outcomes = list(
+        run_batch(partial(_failing_head_on, fail=True), seeds=range(2), n_workers=0, outcomes_file=outcomes_file)
+    )
+    assert {o.seed: o.error is not None for o in outcomes} == {0: False, 1: True}
+    new_outcomes = list(
+        run_batch(partial(_failing_head_on, fail=False), seeds=range(2), n_workers=0, outcomes_file=outcomes_file)
+    )
+    assert [(o.seed, o.error) for o in new_outcomes] == [(1, None)]
+    stored = load_batch_outcomes(outcomes_file)
+    assert sorted(o.seed for o in stored) == [0, 1]
+    assert all(o.error is None for o in stored)
@@ -0,0 +1,60 @@
+from copy import deepcopy
+from decimal import Decimal as D
+
+import numpy as np
+
+from dg_commons import PlayerName, DgSampledSequence
+from dg_commons.sim import SimParameters
+from dg_commons.sim.agents import NPAgent
+from dg_commons.sim.models.integrators import RK4, RK45
+from dg_commons.sim.models.vehicle import VehicleCommands
+from dg_commons.sim.scenarios.structures import DgScenario
+from dg_commons.sim.simulator import SimContext, Simulator
+from dg_commons_tests.fixtures import get_random_vehicles
+
+
+def _batch_vs_single(dyn: bool, integrator, atol: float):
+    models, commands = get_random_vehicles(dyn)
+    batch_models = deepcopy(models)
+    dt = D("0.05")
+    for model, cmds in zip(models, commands):
+        model.update(cmds, dt)
+    batch_dynamics = type(batch_models[0]).get_batch_dynamics(batch_models)
+    batch_dynamics.update(commands, dt, integrator=integrator)
+    for model, batch_model in zip(models, batch_models):
+        assert type(model.get_state()) == type(batch_model.get_state())
+        np.testing.assert_allclose(model.get_state().as_ndarray(), batch_model.get_state().as_ndarray(), atol=atol)
+
+
+def test_batch_kinematic():
+    _batch_vs_single(dyn=False, integrator=RK45, atol=1e-3)
+    _batch_vs_single(dyn=False, integrator=RK4, atol=5e-2)
+
+
+def test_batch_dynamic():
+    _batch_vs_single(dyn=True, integrator=RK45, atol=1e-2)
+
+
+def test_batch_simulation():
+    models, _ = get_random_vehicles(dyn=True, n=10)
+    commands = DgSampledSequence[VehicleCommands](timestamps=[0], values=[VehicleCommands(acc=1, ddelta=0.1)])
+    players = {PlayerName(f"P{i}"): NPAgent(commands) for i in range(len(models))}
+    models = {PlayerName(f"P{i}"): model for i, model in enumerate(models)}
+
+    def get_sim_context(batch_update: bool) -> SimContext:
+        return SimContext(
+            dg_scenario=DgScenario(),
+            models=deepcopy(models),
+            players=deepcopy(players),
+            param=SimParameters(max_sim_time=D(1), batch_update=batch_update),
+        )
+
+    sim_context, batch_sim_context = get_sim_context(False), get_sim_context(True)
+    Simulator().run(sim_context)
+    Simulator().run(batch_sim_context)
+    for p in models:
+        np.testing.assert_allclose(
+            sim_context.models[p].get_state().as_ndarray(),
+            batch_sim_context.models[p].get_state().as_ndarray(),
+            atol=1e-1,
+        )
@@ -0,0 +1,10 @@
+from dg_commons.sim.simulator import Simulator
+from dg_commons_tests.fixtures import all_colliding_pairs, get_dense_traffic
+
+
+def test_colliding_pairs():
+    for n_players, density in [(0, 0.01), (1, 0.01), (60, 0.01), (80, 0.03)]:
+        sim_context = get_dense_traffic(n_players, density=density, seed=n_players)
+        pairs = Simulator._colliding_pairs(sim_context)
+        assert pairs == all_colliding_pairs(sim_context)
+    assert len(pairs) > 0
@@ -1,8 +1,15 @@
+import numpy as np
 import pytest
-from shapely.geometry import Polygon, LineString
+from shapely.affinity import rotate, translate
+from shapely.geometry import Polygon, LineString, MultiPolygon
 from shapely.geometry.base import BaseGeometry
 
-from dg_commons.sim.collision_utils import compute_impact_geometry
+from dg_commons.sim.collision_utils import (
+    compute_impact_geometry,
+    convex_vertices,
+    time_of_impact,
+    time_of_impact_batch,
+)
 
 # Create two intersecting rectangles
 rect1 = Polygon([(0, 0), (0, 2), (2, 2), (2, 0)])
@@ -30,3 +37,43 @@ pairs_to_test: list[tuple[BaseGeometry, BaseGeometry]] = [
 def test_compute_impact_geometry(a: BaseGeometry, b: BaseGeometry):
     norm, impact_p = compute_impact_geometry(a, b)
     print(norm, impact_p)
+
+
+def test_time_of_impact():
+    square = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+    other = Polygon([(3, 0), (4, 0), (4, 1), (3, 1)])
+    assert time_of_impact(square, other, (-1, 0)) == pytest.approx(2)
+    assert time_of_impact(square, other, (-4, 0)) == pytest.approx(0.5)
+    assert time_of_impact(square, other, (1, 0)) == np.inf
+    assert time_of_impact(square, other, (-1, 0), max_time=1) == np.inf
+    # it passes by
+    assert time_of_impact(square, other, (-1, 1)) == np.inf
+    assert time_of_impact(rect1, rect2, (5, 5)) == 0
+    assert time_of_impact(rect, line_intersecting, (1, 0)) == 0
+
+
+def test_time_of_impact_batch():
+    rng = np.random.default_rng(0)
+    n = 50
+    a_poses = rng.uniform([-5, -5, -np.pi], [5, 5, np.pi], size=(n, 3))
+    b_poses = rng.uniform([-5, -5, -np.pi], [5, 5, np.pi], size=(n, 3))
+    rel_vel = rng.uniform(-5, 5, size=(n, 2))
+
+    def _placed(poly, pose):
+        return translate(rotate(poly, pose[2], origin=(0, 0), use_radians=True), pose[0], pose[1])
+
+    a_polys = [_placed(rect1, pose) for pose in a_poses]
+    b_polys = [_placed(rect2, pose) for pose in b_poses]
+    toi, t_exit = time_of_impact_batch(
+        np.stack([convex_vertices(p) for p in a_polys]), np.stack([convex_vertices(p) for p in b_polys]), rel_vel
+    )
+    for a, b, v, t, t_out in zip(a_polys, b_polys, rel_vel, toi, t_exit):
+        assert time_of_impact(a, b, v) == t
+        if np.isfinite(t):
+            assert a.distance(translate(b, *(v * t))) < 1e-9
+            assert a.intersects(translate(b, *(v * (t + t_out) / 2)))
+            if t > 0:
+                assert not a.intersects(translate(b, *(v * t * 0.99)))
+        else:
+            swept = MultiPolygon([b, translate(b, *(100 * v))]).convex_hull
+            assert not a.intersects(swept)
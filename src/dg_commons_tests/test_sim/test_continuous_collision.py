@@ -0,0 +1,64 @@
+from dataclasses import replace
+from decimal import Decimal as D
+
+from shapely.geometry import Polygon
+
+from dg_commons import PlayerName, DgSampledSequence
+from dg_commons.sim import SimParameters
+from dg_commons.sim.agents import NPAgent
+from dg_commons.sim.models.obstacles import StaticObstacle
+from dg_commons.sim.models.vehicle import VehicleCommands, VehicleModel, VehicleState
+from dg_commons.sim.scenarios.structures import DgScenario
+from dg_commons.sim.simulator import SimContext, Simulator
+
+
+def _get_sim_context(param: SimParameters, states: dict[str, VehicleState], dg_scenario=None) -> SimContext:
+    models, players = {}, {}
+    for name, x0 in states.items():
+        models[PlayerName(name)] = VehicleModel.default_car(x0)
+        players[PlayerName(name)] = NPAgent(
+            DgSampledSequence[VehicleCommands](timestamps=[0], values=[VehicleCommands(0, 0)])
+        )
+    return SimContext(dg_scenario=dg_scenario or DgScenario(), models=models, players=players, param=param)
+
+
+_PARAM = SimParameters(dt=D("0.5"), dt_commands=D("0.5"), max_sim_time=D("1"))
+
+
+def test_swept_collision_among_players():
+    # head-on at 60 m/s of relative speed, they swap places within a step without ever overlapping at its ends
+    states = {
+        "P1": VehicleState(x=0, y=0, psi=0, vx=30, delta=0),
+        "P2": VehicleState(x=20, y=0.5, psi=3.14159, vx=30, delta=0),
+    }
+    sim_context = _get_sim_context(_PARAM, states)
+    Simulator().run(sim_context)
+    assert not sim_context.collision_reports
+
+    sim_context = _get_sim_context(replace(_PARAM, continuous_collision=True), states)
+    Simulator().run(sim_context)
+    assert len(sim_context.collision_reports) == 1
+    report = sim_context.collision_reports[0]
+    # the noses touch when the gap of 20 m minus a car length is closed
+    length = sim_context.models[PlayerName("P1")].vg.length
+    assert abs(float(report.at_time) - (20 - length) / 60) < 0.01
+    assert sim_context.first_collision_ts == report.at_time
+    assert report.players.keys() == {"P1", "P2"}
+
+
+def test_swept_collision_with_environment():
+    wall = StaticObstacle(Polygon([(10, -5), (10.2, -5), (10.2, 5), (10, 5)]))
+    states = {"P1": VehicleState(x=0, y=0, psi=0, vx=40, delta=0)}
+    sim_context = _get_sim_context(_PARAM, states, DgScenario(static_obstacles=[wall]))
+    Simulator().run(sim_context)
+    assert not sim_context.collision_reports
+
+    sim_context = _get_sim_context(
+        replace(_PARAM, continuous_collision=True), states, DgScenario(static_obstacles=[wall])
+    )
+    Simulator().run(sim_context)
+    assert len(sim_context.collision_reports) >= 1
+    report = sim_context.collision_reports[0]
+    model = sim_context.models[PlayerName("P1")]
+    front = model.vg.lf + model.vg.bumpers_length[0]
+    assert abs(float(report.at_time) - (10 - front) / 40) < 0.01
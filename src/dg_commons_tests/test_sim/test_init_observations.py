@@ -0,0 +1,51 @@
+from dataclasses import FrozenInstanceError
+from decimal import Decimal as D
+
+import pytest
+from shapely.geometry import Polygon
+
+from dg_commons import DgSampledSequence, PlayerName
+from dg_commons.sim import SimParameters
+from dg_commons.sim.agents import NPAgent
+from dg_commons.sim.goals import PolygonGoal
+from dg_commons.sim.models.vehicle import VehicleCommands, VehicleModel, VehicleState
+from dg_commons.sim.scenarios import load_commonroad_scenario
+from dg_commons.sim.scenarios.structures import DgScenario
+from dg_commons.sim.simulator import SimContext, Simulator
+
+
+class _InitRecorder(NPAgent):
+    def on_episode_init(self, init_sim_obs):
+        self.init_sim_obs = init_sim_obs
+
+
+def _sim_context(copy_init_observations: bool) -> SimContext:
+    scenario, _ = load_commonroad_scenario("USA_Lanker-1_1_T-1")
+    commands = DgSampledSequence[VehicleCommands](timestamps=[0], values=[VehicleCommands(acc=0, ddelta=0)])
+    names = [PlayerName(f"P{i}") for i in range(3)]
+    return SimContext(
+        dg_scenario=DgScenario(scenario),
+        models={
+            p: VehicleModel.default_car(VehicleState(x=0, y=10 * i, psi=0, vx=1, delta=0)) for i, p in enumerate(names)
+        },
+        players={p: _InitRecorder(commands) for p in names},
+        missions={names[0]: PolygonGoal(Polygon([(100, 0), (100, 1), (101, 1)]))},
+        param=SimParameters(max_sim_time=D("0.1"), copy_init_observations=copy_init_observations),
+    )
+
+
+def test_shared_init_observations():
+    sim_context = _sim_context(copy_init_observations=False)
+    Simulator().run(sim_context)
+    init_obs = {p: agent.init_sim_obs for p, agent in sim_context.players.items()}
+    assert all(init.dg_scenario is sim_context.dg_scenario for init in init_obs.values())
+    assert init_obs[PlayerName("P0")].goal is sim_context.missions[PlayerName("P0")]
+    # the shared scenario cannot be modified
+    with pytest.raises(FrozenInstanceError):
+        init_obs[PlayerName("P1")].dg_scenario.static_obstacles = ()
+
+    sim_context = _sim_context(copy_init_observations=True)
+    Simulator().run(sim_context)
+    scenarios = [agent.init_sim_obs.dg_scenario for agent in sim_context.players.values()]
+    assert len({id(s) for s in scenarios} | {id(sim_context.dg_scenario)}) == len(scenarios) + 1
+    assert sim_context.players[PlayerName("P0")].init_sim_obs.goal == sim_context.missions[PlayerName("P0")]
@@ -0,0 +1,73 @@
+import os
+from dataclasses import replace
+from decimal import Decimal as D
+
+import numpy as np
+from matplotlib import pyplot as plt
+from shapely import Polygon
+
+from dg_commons import DgColumnarSequence
+from dg_commons.eval.safety import get_min_dist, get_min_ttc_max_drac
+from dg_commons.eval.safety_vectorized import get_min_dist_vectorized
+from dg_commons.sim import SimParameters
+from dg_commons.sim.goals import PolygonGoal
+from dg_commons.sim.log_stream import StreamedSequence, load_log_stream
+from dg_commons.sim.log_visualisation import plot_player_log
+from dg_commons.sim.simulator import Simulator
+from dg_commons_tests import OUT_TESTS_DIR
+from dg_commons_tests.test_sim.test_agents_execution import _get_sim_context
+
+
+def test_log_stream():
+    log_dir = os.path.join(OUT_TESTS_DIR, "log_stream")
+    param = SimParameters(dt=D("0.05"), dt_commands=D("0.1"), max_sim_time=D(3))
+    sim_context = _get_sim_context(param)
+    Simulator().run(sim_context)
+    streamed_context = _get_sim_context(replace(param, log_dir=log_dir))
+    Simulator().run(streamed_context)
+
+    for log in [streamed_context.log, load_log_stream(log_dir)]:
+        assert log.keys() == sim_context.log.keys()
+        for p, player_log in log.items():
+            ref = sim_context.log[p]
+            assert isinstance(player_log.states, StreamedSequence)
+            assert isinstance(player_log.states.columnar, DgColumnarSequence)
+            assert len(player_log.states) == len(ref.states)
+            assert player_log.states.timestamps[:] == ref.states.timestamps
+            assert player_log.states.get_end() == ref.states.get_end()
+            assert type(player_log.states.values[-1]) == type(ref.states.values[-1])
+            np.testing.assert_allclose(player_log.states.array, [x.as_ndarray() for x in ref.states.values])
+            for t in [D(0), D("0.12"), D("1.5"), D(3)]:
+                np.testing.assert_allclose(
+                    player_log.at_interp(t).state.as_ndarray(), ref.at_interp(t).state.as_ndarray()
+                )
+                assert player_log.at_interp(t).commands == ref.at_interp(t).commands
+            assert player_log.commands.values[:] == ref.commands.values
+            assert len(player_log.info) == len(ref.info)
+        assert log.get_last_time() == sim_context.log.get_last_time()
+
+    # an interrupted write leaves a partial row that gets ignored
+    states_file = os.path.join(log_dir, "player0", "states.f64")
+    n_states = len(streamed_context.log["P0"].states)
+    with open(states_file, "ab") as f:
+        f.write(b"\x00" * 12)
+    assert len(load_log_stream(log_dir)["P0"].states) == n_states
+
+
+def test_log_stream_consumers():
+    log_dir = os.path.join(OUT_TESTS_DIR, "log_stream_consumers")
+    param = SimParameters(dt=D("0.05"), dt_commands=D("0.1"), max_sim_time=D(2), log_dir=log_dir)
+    sim_context = _get_sim_context(param)
+    Simulator().run(sim_context)
+
+    fig = plt.figure()
+    plot_player_log(sim_context.log["P0"], fig)
+    plt.close(fig)
+
+    missions = {p: PolygonGoal(Polygon([(1000, 0), (1001, 0), (1001, 1)])) for p in sim_context.models}
+    for log in [sim_context.log, load_log_stream(log_dir)]:
+        min_dist, agent, t = get_min_dist(log, sim_context.models, missions, "P0")
+        assert agent == "P1" and min_dist > 0
+        vec_dist, vec_agent, vec_t = get_min_dist_vectorized(log, sim_context.models, missions, "P0")
+        assert np.isclose(vec_dist, min_dist) and (vec_agent, vec_t) == (agent, t)
+        get_min_ttc_max_drac(log, sim_context.models, missions, "P0")
@@ -0,0 +1,33 @@
+from copy import deepcopy
+from decimal import Decimal as D
+
+import numpy as np
+
+from dg_commons.sim.models.vehicle import VehicleCommands
+from dg_commons.sim.models.vehicle_dynamic import VehicleModelDyn, VehicleStateDyn
+
+
+def test_geometry_cache():
+    model = VehicleModelDyn.default_car(VehicleStateDyn(x=1, y=2, psi=0.3, vx=5, delta=0))
+    footprint = model.get_footprint()
+    assert model.get_footprint() is footprint
+    pose = model.get_pose()
+    pose[0, 2] = 100
+    assert model.get_pose()[0, 2] == 1
+
+    model.update(VehicleCommands(acc=1, ddelta=0), dt=D("0.1"))
+    assert model.get_footprint() is not footprint
+    assert not model.get_footprint().equals(footprint)
+    np.testing.assert_allclose(model.get_pose()[:2, 2], [model._state.x, model._state.y])
+
+    footprint = model.get_footprint()
+    model.set_state(VehicleStateDyn(x=10, y=2, psi=0.3, vx=5, delta=0))
+    assert model.get_footprint().centroid.x > footprint.centroid.x
+    mesh = model.get_mesh()
+    model.set_velocity(np.array([1, 0]), 0, in_model_frame=True)
+    assert model.get_mesh() is not mesh
+    assert all(model.get_mesh()[k].equals(mesh[k]) for k in mesh)
+
+    copied = deepcopy(model)
+    copied.set_state(VehicleStateDyn(x=0, y=0, psi=0, vx=5, delta=0))
+    assert not copied.get_footprint().equals(model.get_footprint())
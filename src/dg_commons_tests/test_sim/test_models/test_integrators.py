@@ -0,0 +1,63 @@
+from copy import deepcopy
+from decimal import Decimal as D
+
+import numpy as np
+
+from dg_commons.sim.models.diff_drive import DiffDriveModel, DiffDriveState, DiffDriveCommands
+from dg_commons.sim.models.integrators import EULER, EXACT_KINEMATIC, RK4, RK45, integrate
+from dg_commons_tests.fixtures import get_random_vehicles
+
+
+def test_integrate_linear():
+    y0 = np.array([[1.0, 2.0], [3.0, 4.0]])
+    for method, atol in [(RK45, 1e-3), (RK4, 1e-6), (EULER, 1e-2)]:
+        y1 = integrate(lambda y: -y, y0, dt=0.1, method=method, n_steps=10)
+        np.testing.assert_allclose(y1, y0 * np.exp(-0.1), atol=atol)
+
+
+def _fixed_step_vs_rk45(dyn: bool, integrator, atol: float):
+    models, commands = get_random_vehicles(dyn)
+    ref_models = deepcopy(models)
+    dt = D("0.05")
+    for model, ref_model, cmds in zip(models, ref_models, commands):
+        model.integrator = integrator
+        model.update(cmds, dt)
+        ref_model.update(cmds, dt)
+        np.testing.assert_allclose(model.get_state().as_ndarray(), ref_model.get_state().as_ndarray(), atol=atol)
+
+
+def test_kinematic_integrators():
+    _fixed_step_vs_rk45(dyn=False, integrator=EXACT_KINEMATIC, atol=5e-2)
+    _fixed_step_vs_rk45(dyn=False, integrator=RK4, atol=5e-2)
+    _fixed_step_vs_rk45(dyn=False, integrator=EULER, atol=1e-1)
+
+
+def test_exact_kinematic_constant_steering():
+    # with constant steering the vehicle moves on a circle of radius wheelbase/tan(delta) (rear axle)
+    models, commands = get_random_vehicles(dyn=False, n=5)
+    for model in models:
+        model.has_collided = False
+        model.integrator = EXACT_KINEMATIC
+        x0 = model.get_state()
+        model.update(type(commands[0])(acc=0, ddelta=0), D("0.5"))
+        x1 = model.get_state()
+        k = np.tan(x0.delta) / model.vg.wheelbase
+        np.testing.assert_allclose(x1.psi, x0.psi + k * x0.vx * 0.5)
+        np.testing.assert_allclose(x1.vx, x0.vx)
+        # the rear axle moves on a circle, its chord length is 2 sin(dpsi/2)/k
+        rear0 = np.array([x0.x, x0.y]) - model.vg.lr * np.array([np.cos(x0.psi), np.sin(x0.psi)])
+        rear1 = np.array([x1.x, x1.y]) - model.vg.lr * np.array([np.cos(x1.psi), np.sin(x1.psi)])
+        dpsi = x1.psi - x0.psi
+        np.testing.assert_allclose(np.linalg.norm(rear1 - rear0), abs(2 * np.sin(dpsi / 2) / k), rtol=1e-9)
+
+
+def test_generic_model_integrators():
+    x0 = DiffDriveState(x=1, y=2, psi=0.3)
+    cmds = DiffDriveCommands(omega_l=3, omega_r=4)
+    ref = DiffDriveModel.default(x0)
+    ref.update(cmds, D("0.1"))
+    for integrator in [RK4, EULER, EXACT_KINEMATIC]:
+        model = DiffDriveModel.default(x0)
+        model.integrator = integrator
+        model.update(cmds, D("0.1"))
+        np.testing.assert_allclose(model.get_state().as_ndarray(), ref.get_state().as_ndarray(), atol=1e-2)
@@ -0,0 +1,62 @@
+import os
+import shutil
+
+import pytest
+
+from dg_commons.maps import road_bounds
+from dg_commons.maps.lanelet_index import LaneletIndex
+from dg_commons.maps.road_bounds import build_road_boundary_obstacle
+from dg_commons.sim.scenarios import find_commonroad_scenario, load_commonroad_scenario
+from dg_commons.sim.scenarios.factory import get_scenario_commonroad_replica
+from dg_commons.sim.scenarios.structures import DgScenario
+
+_NAME = "USA_Lanker-1_1_T-1"
+
+
+def test_find_commonroad_scenario(tmp_path):
+    scenarios_dir = tmp_path / "scenarios"
+    os.makedirs(scenarios_dir / "sub")
+    shutil.copy(find_commonroad_scenario(_NAME), scenarios_dir / "sub")
+    assert find_commonroad_scenario(_NAME, str(scenarios_dir)) == str(scenarios_dir / "sub" / f"{_NAME}.xml")
+    # files added (or moved) after the directory has been indexed are found as well
+    shutil.move(scenarios_dir / "sub" / f"{_NAME}.xml", scenarios_dir / "other.xml")
+    assert find_commonroad_scenario("other", str(scenarios_dir)) == str(scenarios_dir / "other.xml")
+    with pytest.raises(FileNotFoundError):
+        find_commonroad_scenario(_NAME, str(scenarios_dir))
+
+
+def test_scenario_cache(tmp_path):
+    scenarios_dir, cache_dir = tmp_path / "scenarios", tmp_path / "cache"
+    os.makedirs(scenarios_dir)
+    shutil.copy(find_commonroad_scenario(_NAME), scenarios_dir)
+    reference, _ = load_commonroad_scenario(_NAME, str(scenarios_dir))
+
+    scenario, planning_problems = load_commonroad_scenario(_NAME, str(scenarios_dir), cache_dir=str(cache_dir))
+    (entry,) = os.listdir(cache_dir)
+    entry_mtime = os.stat(cache_dir / entry).st_mtime_ns
+    cached, cached_planning_problems = load_commonroad_scenario(_NAME, str(scenarios_dir), cache_dir=str(cache_dir))
+    assert os.stat(cache_dir / entry).st_mtime_ns == entry_mtime
+    assert cached is not scenario
+    assert len(cached.lanelet_network.lanelets) == len(reference.lanelet_network.lanelets)
+    assert len(cached.dynamic_obstacles) == len(reference.dynamic_obstacles)
+    assert cached_planning_problems.planning_problem_dict.keys() == planning_problems.planning_problem_dict.keys()
+    # the lanelets come already converted and are shared with the scenarios built on it
+    index = DgScenario(cached).lanelet_index
+    assert index is LaneletIndex.of(cached) and index.network is cached.lanelet_network
+    assert len(index._dglanelets) == len(reference.lanelet_network.lanelets)
+    # so are the road boundaries
+    assert cached in road_bounds._ROAD_BOUNDARIES
+    dgscenario = DgScenario(cached, use_road_boundaries=True)
+    assert len(dgscenario.static_obstacles) == len(build_road_boundary_obstacle(reference)[0])
+    sim_context = get_scenario_commonroad_replica(_NAME, str(scenarios_dir), cache_dir=str(cache_dir))
+    assert len(sim_context.players) > 0
+
+    # modifying the scenario invalidates the entry, so does a corrupted entry
+    os.utime(scenarios_dir / f"{_NAME}.xml", ns=(entry_mtime, entry_mtime))
+    load_commonroad_scenario(_NAME, str(scenarios_dir), cache_dir=str(cache_dir))
+    assert os.stat(cache_dir / entry).st_mtime_ns != entry_mtime
+    with open(cache_dir / entry, "wb") as f:
+        f.write(b"not a pickle")
+    scenario, _ = load_commonroad_scenario(_NAME, str(scenarios_dir), cache_dir=str(cache_dir))
+    assert len(scenario.lanelet_network.lanelets) == len(reference.lanelet_network.lanelets)
+    assert os.listdir(cache_dir) == [entry]
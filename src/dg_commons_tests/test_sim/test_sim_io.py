@@ -0,0 +1,78 @@
+import os
+import pickle
+from decimal import Decimal as D
+
+import numpy as np
+
+from dg_commons import DgColumnarSequence
+from dg_commons.sim.sim_io import (
+    load_collision_reports,
+    load_player_log,
+    load_sim_log,
+    save_collision_reports,
+    save_player_log,
+    save_sim_log,
+)
+from dg_commons_tests import OUT_TESTS_DIR, REPO_DIR
+
+LOGS_DIR = REPO_DIR / "src/dg_commons_tests/test_eval/logs"
+
+
+def _load(name: str):
+    with open(LOGS_DIR / name, "rb") as f:
+        return pickle.load(f)
+
+
+def test_sim_log_io():
+    log = _load("log.pickle")
+    reports = _load("collision_reports_collided.pickle")
+    os.makedirs(OUT_TESTS_DIR, exist_ok=True)
+    path = os.path.join(OUT_TESTS_DIR, "sim_log.npz")
+    save_sim_log(path, log, collision_reports=reports)
+
+    loaded = load_sim_log(path)
+    assert loaded.keys() == log.keys()
+    for p in log:
+        for field in ["states", "commands", "info"]:
+            assert getattr(loaded[p], field) == getattr(log[p], field), (p, field)
+        assert loaded[p].extra.values == log[p].extra.values
+
+    # selective loading
+    p = list(log)[1]
+    window = load_sim_log(path, players=[p], from_ts=D(1), to_ts=D(2))
+    assert list(window) == [p]
+    assert window[p].states == log[p].states.get_subsequence(D(1), D(2))
+    # the non numeric columns (e.g. the lights of the commands) are sliced before unpickling
+    assert window[p].commands == log[p].commands.get_subsequence(D(1), D(2))
+    columnar = load_sim_log(path, players=[p], columnar=True)
+    assert isinstance(columnar[p].states, DgColumnarSequence)
+    np.testing.assert_allclose(
+        columnar[p].states.at_interp(D("1.23")).as_ndarray(), log[p].states.at_interp(D("1.23")).as_ndarray()
+    )
+
+    assert len(load_collision_reports(path)) == len(reports)
+
+
+def test_player_log_and_reports_io():
+    log = _load("log.pickle")
+    reports = _load("collision_reports_collided.pickle")
+    os.makedirs(OUT_TESTS_DIR, exist_ok=True)
+    p = list(log)[0]
+    path = os.path.join(OUT_TESTS_DIR, "player_log.npz")
+    save_player_log(path, log[p], compress=True)
+    assert load_player_log(path).states == log[p].states
+
+    path = os.path.join(OUT_TESTS_DIR, "collision_reports.npz")
+    save_collision_reports(path, reports)
+    loaded = load_collision_reports(path)
+    assert len(loaded) == len(reports)
+    for r, r_loaded in zip(reports, loaded):
+        assert r_loaded.at_time == r.at_time
+        assert r_loaded.impact_point.equals(r.impact_point)
+        np.testing.assert_allclose(r_loaded.impact_normal, r.impact_normal)
+        for player, player_report in r.players.items():
+            loaded_player = r_loaded.players[player]
+            assert loaded_player.footprint.equals(player_report.footprint)
+            assert [n for n, _ in loaded_player.locations] == [n for n, _ in player_report.locations]
+            np.testing.assert_allclose(loaded_player.velocity[0], player_report.velocity[0])
+            assert loaded_player.energy_delta == player_report.energy_delta
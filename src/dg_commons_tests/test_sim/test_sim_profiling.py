@@ -0,0 +1,63 @@
+import csv
+import json
+import os
+from decimal import Decimal as D
+
+from dg_commons import DgSampledSequence, PlayerName
+from dg_commons.sim import SimParameters
+from dg_commons.sim.agents import NPAgent
+from dg_commons.sim.models.vehicle import VehicleCommands, VehicleModel, VehicleState
+from dg_commons.sim.scenarios.structures import DgScenario
+from dg_commons.sim.sim_profiling import AGENTS, GOALS, MODELS_UPDATE, SENSING, measure
+from dg_commons.sim.simulator import SimContext, Simulator
+from dg_commons_tests import OUT_TESTS_DIR
+
+
+class _MeasuredAgent(NPAgent):
+    def get_commands(self, sim_obs):
+        with measure("planning", PlayerName("P0")):
+            return super().get_commands(sim_obs)
+
+
+def _sim_context(profile: bool) -> SimContext:
+    commands = DgSampledSequence[VehicleCommands](timestamps=[0], values=[VehicleCommands(acc=1, ddelta=0)])
+    return SimContext(
+        dg_scenario=DgScenario(),
+        models={
+            PlayerName(f"P{i}"): VehicleModel.default_car(VehicleState(x=0, y=10 * i, psi=0, vx=5, delta=0))
+            for i in range(2)
+        },
+        players={PlayerName("P0"): _MeasuredAgent(commands), PlayerName("P1"): NPAgent(commands)},
+        param=SimParameters(max_sim_time=D(1), profile=profile),
+    )
+
+
+def test_sim_profiling():
+    sim_context = _sim_context(profile=True)
+    Simulator().run(sim_context)
+    stats = {(row["phase"], row["player"]): row for row in sim_context.stats.summary()}
+    n_steps, n_commands = 21, 11
+    for p in ("P0", "P1"):
+        assert stats[(SENSING, p)]["count"] == n_commands
+        assert stats[(AGENTS, p)]["count"] == n_commands
+        assert stats[(MODELS_UPDATE, p)]["count"] == n_steps
+    assert stats[(GOALS, None)]["count"] == n_steps
+    assert stats[("planning", "P0")]["count"] == n_commands
+    row = stats[(MODELS_UPDATE, "P0")]
+    assert 0 < row["p50_s"] <= row["p90_s"] <= row["p99_s"] <= row["max_s"] <= row["total_s"]
+
+    out = os.path.join(OUT_TESTS_DIR, "sim_profiling")
+    os.makedirs(out, exist_ok=True)
+    sim_context.stats.to_json(os.path.join(out, "stats.json"))
+    sim_context.stats.to_csv(os.path.join(out, "stats.csv"))
+    with open(os.path.join(out, "stats.json")) as f:
+        assert len(json.load(f)) == len(stats)
+    with open(os.path.join(out, "stats.csv")) as f:
+        assert len(list(csv.DictReader(f))) == len(stats)
+
+    # nothing is recorded when disabled, the measurements of the agents are skipped as well
+    sim_context = _sim_context(profile=False)
+    Simulator().run(sim_context)
+    assert sim_context.stats.summary() == []
+    with measure("outside of a simulation"):
+        pass
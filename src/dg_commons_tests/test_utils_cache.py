@@ -0,0 +1,20 @@
+import gc
+
+from dg_commons import IdentityCache
+
+
+class _Unhashable:
+    __hash__ = None
+
+
+def test_identity_cache():
+    cache: IdentityCache[int] = IdentityCache()
+    a, b = _Unhashable(), _Unhashable()
+    cache.put(a, 1)
+    cache.put(a, 2)
+    assert a in cache and b not in cache
+    assert cache.get(a) == 2 and cache.get(b) is None
+    # released with the object
+    del a
+    gc.collect()
+    assert len(cache) == 0